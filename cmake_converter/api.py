@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+    API
+    ===
+     In-memory conversion of solutions for embedding of converter into other programs.
+     Nothing is printed and written to disk, rendered CMakeLists.txt are returned instead.
+
+     Example::
+
+        from cmake_converter.api import convert, ConverterCache
+
+        cache = ConverterCache()
+        result = convert('path/to/my.sln', {'warn_level': 3}, cache)
+        for cmake_lists_path, text in result.cmake_lists.items():
+            ...
+"""
+
+import os
+import time
+from collections import OrderedDict, namedtuple
+
+from cmake_converter import fs_stats
+from cmake_converter.cache import ConverterCache
+from cmake_converter.visual_studio.context import VSContext
+from cmake_converter.visual_studio.solution import VSSolutionConverter, SolutionError
+
+__all__ = ['convert', 'ConversionResult', 'ConverterCache', 'OPTIONS', 'SolutionError']
+
+# Options of converter that may be given to convert()
+OPTIONS = (
+    'projects_regexp',
+    'additional_code',
+    'verbose',
+    'warn_level',
+    'private_include_directories',
+    'ignore_absent_sources',
+    'indent',
+    'prefetch_depth',
+    'prefetch_memory_limit',
+    'project_timeout',
+    'target_names',
+    'with_deps',
+    'render_cache',
+    'unity_build_batch_size',
+    'share_pch',
+    'compiler_cache',
+    'parser_stats',
+    'fs_stats',
+    'snapshot_fs',
+)
+
+Message = namedtuple('Message', ['project', 'status', 'text'])
+
+
+class ConversionResult:
+    """
+        Result of in-memory conversion of solution
+    """
+
+    def __init__(self):
+        self.cmake_lists = OrderedDict()    # path of CMakeLists.txt -> text
+        self.messages = []
+        self.warnings_count = 0
+        self.stats = {}
+        self.failures = []
+
+    def __deepcopy__(self, memo):
+        return self     # shared by all contexts of conversion as sink of messages
+
+    def add_message(self, context, text, status):
+        """ Sink of messages of converter """
+        self.messages.append(Message(context.project_name, status, text))
+
+    @property
+    def warnings(self):
+        """ Texts of warnings """
+        return [m.text for m in self.messages if m.status.startswith('warn')]
+
+    @property
+    def errors(self):
+        """ Texts of errors """
+        return [m.text for m in self.messages if m.status == 'error']
+
+
+def _create_context(options, cache, conversion_result):
+    """ Creates context of solution for in-memory conversion with given options """
+    context = VSContext()
+    for name, value in (options or {}).items():
+        if name not in OPTIONS:
+            raise ValueError('Unknown option of converter: {}'.format(name))
+        setattr(context, name, value)
+    context.jobs = 1
+    context.in_memory = True
+    context.cache = cache
+    context.message_sink = conversion_result
+    return context
+
+
+def _collect_cmake_lists(context, results, solution_text, conversion_result):
+    """ Joins texts of projects of the same directory like they are written to disk """
+    texts_of_directories = OrderedDict()
+    for batch_results in results:
+        for target_result in batch_results:
+            if target_result['cmake'] == context.solution_path:
+                continue    # rendered into CMakeLists.txt of solution
+            texts_of_directories.setdefault(target_result['cmake'], []).append(
+                target_result['cmake_lists_text']
+            )
+    for subdirectory, texts in texts_of_directories.items():
+        conversion_result.cmake_lists[os.path.join(subdirectory, 'CMakeLists.txt')] = \
+            ('\n' * 26).join(texts)
+    conversion_result.cmake_lists[os.path.join(context.solution_path, 'CMakeLists.txt')] = \
+        solution_text
+
+
+def convert(sln_path, options=None, cache=None):
+    """
+    Converts given solution in memory. Conversion runs at calling process,
+    so given cache stays warm for next calls. SolutionError (a ValueError) is raised
+    if solution has unsupported format or given targets are absent at it.
+
+    :param sln_path: path to *.sln file
+    :type sln_path: str
+    :param options: options of converter mapped to names from OPTIONS
+    :type options: dict
+    :param cache: cache of data read from disk shared between calls
+    :type cache: ConverterCache
+    :return: rendered CMakeLists.txt, messages and statistics
+    :rtype: ConversionResult
+    """
+    start_time = time.time()
+    conversion_result = ConversionResult()
+    context = _create_context(options, cache, conversion_result)
+
+    if context.fs_stats:
+        fs_stats.enable()
+    try:
+        converter = VSSolutionConverter()
+        solution_data = converter.read_solution(context, os.path.abspath(sln_path))
+        input_data_for_converter = converter.get_input_data_for_converter(
+            context,
+            solution_data['sln_projects_data']
+        )
+        results = converter.do_conversion(context, input_data_for_converter)
+        if context.share_pch:
+            converter.share_pch_of_solutions(context, [(context, solution_data)], results)
+        solution_text = converter.render_solution_cmake_file(context, solution_data, results)
+        _collect_cmake_lists(context, results, solution_text, conversion_result)
+
+        conversion_result.warnings_count = context.warnings_count
+        conversion_result.failures = context.failures
+        conversion_result.stats = {
+            'projects': sum(len(batch_results) for batch_results in results),
+            'failed_projects': len(context.failures),
+            'cmake_lists': len(conversion_result.cmake_lists),
+            'seconds': time.time() - start_time,
+            'cache_hits': cache.hits if cache is not None else 0,
+            'cache_misses': cache.misses if cache is not None else 0,
+        }
+        if context.parser_stats:
+            conversion_result.stats['handlers'] = converter.merge_handler_stats(results)
+        if context.fs_stats:
+            conversion_result.stats['filesystem'] = fs_stats.take_records()
+    finally:
+        if context.fs_stats:
+            fs_stats.disable()
+    return conversion_result
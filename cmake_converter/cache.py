@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+    ConverterCache
+    ==============
+     Cache of data read from disk that may be reused between conversions
+     of one process (directory listings, names and references of projects, package metadata)
+"""
+
+import os
+import copy
+
+DIRECTORY_LISTINGS = 'directory_listings'
+REFERENCE_NAMES = 'reference_names'
+PACKAGE_METADATA = 'package_metadata'
+PROJECT_REFERENCES = 'project_references'
+LIBRARY_LINKS = 'library_links'
+
+
+def get_cached(context, kind, path, loader):
+    """
+    Returns data of given kind for path from cache of context or loads it
+
+    :param context: converter context
+    :type context: Context
+    :param kind: kind of cached data
+    :type kind: str
+    :param path: path of file or directory data is read from
+    :type path: str
+    :param loader: function that reads data by path
+    :type loader: function
+    :return: loaded data
+    """
+    if context.cache is None:
+        return loader(path)
+    return context.cache.get(kind, path, loader, context)
+
+
+class ConverterCache:
+    """
+        Cache that is validated by modification time of files. Data of absent files
+        is not cached. Input files read by loader are kept with data and added to
+        context on hit. Cache is shared between clones of context, so it is not copied with them.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.__data = {}
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @staticmethod
+    def __get_mtime(path):
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    def get(self, kind, path, loader, context):
+        """ Returns cached data or loads it if there is no data or file was changed """
+        key = (kind, os.path.normcase(os.path.abspath(path)))
+        mtime = self.__get_mtime(path)
+        cached = self.__data.get(key)
+        if cached is not None and cached[0] == mtime:
+            self.hits += 1
+            context.input_files.update(cached[2])
+            return copy.deepcopy(cached[1])  # callers may modify data
+
+        self.misses += 1
+        input_files = context.input_files
+        context.input_files = set()     # records files read by loader even if they are known
+        try:
+            data = loader(path)
+        finally:
+            loaded_files, context.input_files = context.input_files, input_files
+            input_files.update(loaded_files)
+        if mtime is not None:
+            self.__data[key] = (mtime, copy.deepcopy(data), frozenset(loaded_files))
+        return data
+
+    def clear(self):
+        """ Drops all cached data """
+        self.__data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.__data)
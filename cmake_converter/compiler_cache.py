@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    Compiler cache
+    ==============
+     Helpers of conversion for compiler launchers like ccache or sccache. Compiler
+     caches can't store debug information written into shared PDB files (/Zi, /ZI),
+     so debug information is embedded into object files (/Z7).
+"""
+
+from cmake_converter.flags import cl_flags
+
+# Debug information format that is embedded into object files
+EMBEDDED_DEBUG_INFORMATION_FORMAT = '/Z7'
+
+# Languages that have compiler launchers at CMake
+LAUNCHER_LANGUAGES = ('C', 'CXX')
+
+_PDB_DEBUG_INFORMATION_FORMATS = ('/Zi', '/ZI', '-Zi', '-ZI')
+_PDB_FILE_NAME_OPTIONS = ('/Fd', '-Fd')
+
+
+def make_cache_friendly_option(option):
+    """ Replaces compile option that writes shared PDB file with embedded debug information """
+    if option in _PDB_DEBUG_INFORMATION_FORMATS:
+        return EMBEDDED_DEBUG_INFORMATION_FORMAT
+    return option
+
+
+def get_compiler_cache_issues(context):
+    """
+    Returns reasons why compilation of target can't be cached by compiler cache
+
+    :param context: context of target after merging of settings
+    :type context: Context
+    :return: sorted reasons
+    :rtype: list
+    """
+    issues = set()
+    if 'Fortran' in context.target_languages:
+        issues.add('Fortran has no compiler launcher')
+
+    contexts = [context] + list(context.file_contexts.values())
+    for setting_context in contexts:
+        for value in setting_context.settings.get_column('PrecompiledHeader').values():
+            if value and 'Use' in value:
+                issues.add('precompiled headers are used')
+        for flags in setting_context.settings.get_column(cl_flags).values():
+            for flag in flags or []:
+                if flag.startswith(_PDB_FILE_NAME_OPTIONS):
+                    issues.add('PDB file is set with {}'.format(flag))
+    return sorted(issues)
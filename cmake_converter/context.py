@@ -28,12 +28,12 @@
 
 import os
 import time
-from multiprocessing import cpu_count
 from collections import OrderedDict
 import copy
 
 from cmake_converter.utils import message
-from cmake_converter.writer import CMakeWriter
+from cmake_converter.system_resources import get_available_cpu_count
+from cmake_converter.settings_store import SettingsStore
 
 
 class Context:
@@ -42,7 +42,9 @@ class Context:
     """
     def __init__(self):
         self.time0 = time.time()
-        self.jobs = cpu_count()
+        self.jobs = get_available_cpu_count()
+        self.jobs_auto = False
+        self.executor = 'auto'
         self.xml_data = {}
         self.vcxproj_path = ''
         self.solution_path = ''
@@ -51,12 +53,22 @@ class Context:
         self.target_languages = []
         self.sln_deps = []
         self.target_references = []
+        self.object_library = False
+        self.archived_object_libraries = []
+        self.fortran_module_dependencies = []
         self.add_lib_deps = False
         self.packages_config_path = ''
         self.import_projects = []
         self.packages = []
+        self.input_files = set()
 
         self.projects_regexp = '.*'
+        self.target_names = []
+        self.with_deps = False
+        self.selected_projects = None
+        self.object_libraries = set()
+        self.archived_object_libraries_of_projects = {}
+        self.fortran_module_dependencies_of_projects = {}
         self.additional_code = None
         self.dry = False
         self.verbose = False
@@ -64,11 +76,30 @@ class Context:
         self.private_include_directories = False
         self.ignore_absent_sources = False
         self.indent = '    '
+        self.prefetch_depth = 2
+        self.prefetch_memory_limit = 64 * 1024 * 1024
+        self.xml_prefetcher = None
+        self.in_memory = False
+        self.cache = None
+        self.message_sink = None
+        self.events = None
+        self.project_timeout = None
+        self.render_cache = None
+        self.render_cache_hit = False
+        self.unity_build_batch_size = None
+        self.share_pch = False
+        self.compiler_cache = None
+        self.parser_stats = False
+        self.fs_stats = False
+        self.snapshot_fs = False
+        self.fs_snapshot = None
+        self.failures = []
 
         self.sln_configurations_map = {}
         self.project_folder = ''
         self.configurations_to_parse = set()
         self.cmake = ''
+        self.cmake_lists_text = ''
         self.project_name = ''
         self.root_namespace = ''
         self.target_windows_version = ''
@@ -80,10 +111,12 @@ class Context:
         self.excluded_from_build = False
         self.file_contexts = OrderedDict()
         self.supported_architectures = set()
-        self.settings = OrderedDict()
+        self.settings = SettingsStore()
         self.current_setting = (None, None)  # (conf, arch)
         self.current_node = None
         self.warnings_count = 0
+        self.phase_durations = {}
+        self.handler_stats = {}  # key of handler -> [calls, total time, own time]
         # helpers
         self.parser = None
         self.variables = None
@@ -91,7 +124,16 @@ class Context:
         self.flags = None
         self.dependencies = None
         self.utils = None
-        self.writer = CMakeWriter()
+        self.__writer = None
+
+    @property
+    def writer(self):
+        """ Writer of CMake files. Created on first use to keep startup fast """
+        if self.__writer is None:
+            # pylint: disable=import-outside-toplevel
+            from cmake_converter.writer import CMakeWriter
+            self.__writer = CMakeWriter()
+        return self.__writer
 
     def clone(self):
         """
@@ -27,14 +27,112 @@
 """
 
 import os
-from collections import OrderedDict
-from multiprocessing import Pool
-import shutil
-import copy
+import io
+import time
+import signal
+import threading
+import multiprocessing
+from collections import OrderedDict, namedtuple
+from multiprocessing.pool import ThreadPool
 
-from cmake_converter.data_files import get_cmake_lists
-from cmake_converter.utils import message
+from cmake_converter.data_files import write_file_if_changed, copy_file_if_changed
+from cmake_converter.utils import message, get_peak_rss, init_worker_console
 from cmake_converter.context import Context
+from cmake_converter.events import emit_event
+from cmake_converter.prefetcher import XmlPrefetcher
+from cmake_converter.render_cache import get_model_fingerprint
+from cmake_converter.shared_pch import get_pch_sharing_data
+from cmake_converter.compiler_cache import get_compiler_cache_issues
+from cmake_converter.system_resources import get_available_memory, estimate_worker_memory, \
+    get_auto_jobs_count, get_project_size
+from cmake_converter import fs_stats
+
+# Compact immutable description of project to convert. Sent to workers instead of Context.
+TargetTask = namedtuple('TargetTask', [
+    'target_number',
+    'target_abs',
+    'subdirectory',
+    'sln_configurations_map',   # tuple of (sln_setting, project_setting) pairs
+    'sln_deps',
+    'project_folder',
+])
+
+# Solution-wide data that is sent to every worker process once by pool initializer.
+# Serial and thread executors pass solution contexts with batches instead, so
+# conversions of different threads of one process do not share it
+_worker_data = {}
+
+EXECUTORS = ('auto', 'serial', 'thread', 'process', 'forkserver')
+
+# Modules that forkserver imports once, so its workers do not import them again
+FORKSERVER_PRELOAD = [
+    'lxml.etree',
+    'cmake_converter.data_converter',
+    'cmake_converter.visual_studio.context',
+    'cmake_converter.writer',
+]
+
+# Solutions that are not larger are converted by auto executor at main process,
+# because startup of pool and pickling of data take longer than conversion itself
+AUTO_SERIAL_MAX_PROJECTS = 8
+AUTO_SERIAL_MAX_INPUT_SIZE = 1024 * 1024
+
+
+class ProjectTimeoutError(Exception):
+    """ Conversion of project took more time than allowed """
+
+
+class ProjectTimer:
+    """
+        Interrupts conversion of project with ProjectTimeoutError after given seconds.
+        Works at main thread of process on platforms with SIGALRM only, elsewhere
+        pool watchdog of do_conversion is the only limit.
+    """
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.__previous_handler = None
+        self.__enabled = bool(seconds) and hasattr(signal, 'setitimer') \
+            and threading.current_thread() is threading.main_thread()
+
+    @staticmethod
+    def __raise_timeout(signum, frame):
+        del signum, frame
+        raise ProjectTimeoutError()
+
+    def __enter__(self):
+        if self.__enabled:
+            self.__previous_handler = signal.signal(signal.SIGALRM, self.__raise_timeout)
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.__enabled:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self.__previous_handler)
+        return False
+
+
+def init_conversion_worker_process(solution_context, solution_contexts=None):
+    """
+    Initializer of conversion worker process. Keeps solution context with options of
+    converter. Console of worker prints colors like console of main process.
+
+    :param solution_context: context of converted solution
+    :type solution_context: Context
+    :param solution_contexts: contexts of other solutions mapped to their keys (batch mode)
+    :type solution_contexts: dict
+    """
+    init_worker_console()
+    _worker_data['solution_context'] = solution_context
+    _worker_data['solution_contexts'] = solution_contexts or {}
+    if solution_context.fs_stats:
+        fs_stats.enable()
+
+
+def get_worker_solution_context(solution_key):
+    """ Returns context of solution with given key at worker process (None is for the main one) """
+    return _worker_data['solution_contexts'].get(solution_key, _worker_data['solution_context'])
 
 
 class DataConverter:
@@ -133,16 +231,16 @@ class DataConverter:
                     context.current_setting = (None, mapped_arch)
                     context.utils.init_context_current_setting(context)
 
-                if key not in context.settings[mapped_setting] \
-                        or mapped_setting[0] is None:
+                if mapped_setting[0] is None or \
+                        not context.settings.has_value(mapped_setting, key):
                     continue
-                settings_list = context.settings[mapped_setting][key]
+                settings_list = context.settings.get_value(mapped_setting, key)
                 if not lists_of_items_to_merge[mapped_arch]:  # first pass
                     set_of_items[mapped_arch] = set(settings_list)
 
                 lists_of_items_to_merge[mapped_arch][sln_setting] = settings_list
                 set_of_items[mapped_arch] = set_of_items[mapped_arch].intersection(
-                    set(context.settings[mapped_setting][key])
+                    settings_list
                 )
 
             self.__remove_common_settings_from_context(
@@ -160,7 +258,7 @@ class DataConverter:
             )
 
             for arch, merged_setting in merged_settings.items():
-                context.settings[(None, arch)][key] = merged_setting
+                context.settings.set_value((None, arch), key, merged_setting)
                 context.sln_configurations_map[(None, arch)] = (None, arch)
 
         if context.file_contexts is not None:
@@ -184,10 +282,11 @@ class DataConverter:
     @staticmethod
     def __update_settings_at_context(context, sln_setting, key, settings_to_set):
         if sln_setting not in context.settings:
-            context.settings[sln_setting] = \
-                copy.deepcopy(context.settings[context.sln_configurations_map[sln_setting]])
+            context.settings.copy_setting(
+                context.sln_configurations_map[sln_setting], sln_setting
+            )
         context.sln_configurations_map[sln_setting] = sln_setting
-        context.settings[sln_setting][key] = settings_to_set
+        context.settings.set_value(sln_setting, key, settings_to_set)
 
     @staticmethod
     def __get_order_of_common_settings(lists_of_items_to_merge_arch):
@@ -226,6 +325,22 @@ class DataConverter:
 
         return common_ordered_lists
 
+    @staticmethod
+    def release_parse_state(context):
+        """
+        Drops xml trees and scratch data of parsing, so only settings needed
+        for writing stay in memory
+
+        :param context: converter context
+        :type context: Context
+        """
+        context.parser.release_parse_state()
+        context.files.release_parse_state()
+        for target_context in [context] + list(context.file_contexts.values()):
+            target_context.xml_data = {}
+            target_context.current_node = None
+            target_context.flags.release_parse_state()
+
     @staticmethod
     def write_data(context, cmake_file):
         """
@@ -249,21 +364,22 @@ class DataConverter:
             return False
 
         message(context, 'Conversion started: Project {}'.format(context.project_name), 'done')
+        phase_start = time.time()
         self.collect_data(context)
+        context.phase_durations['parse'] = time.time() - phase_start
         if not self.verify_data(context):
             return False
+        phase_start = time.time()
         self.merge_data_settings(context)
+        self.release_parse_state(context)
+        context.phase_durations['merge'] = time.time() - phase_start
         if context.dry:
             return True
 
-        message(context, f'Writing data for project {context.vcxproj_path}', '')
-        if os.path.exists(os.path.join(context.cmake, 'CMakeLists.txt')):
-            for cmake_file in get_cmake_lists(context, context.cmake, 'a'):
-                cmake_file.write('\n' * 26)
-                self.write_data(context, cmake_file)
-        else:
-            for cmake_file in get_cmake_lists(context, context.cmake):
-                self.write_data(context, cmake_file)
+        message(context, f'Rendering data for project {context.vcxproj_path}', '')
+        phase_start = time.time()
+        self.render_data(context)
+        context.phase_durations['render'] = time.time() - phase_start
 
         warnings = ''
         if context.warnings_count > 0:
@@ -275,57 +391,663 @@ class DataConverter:
 
         return True
 
-    def run_conversion(self, subdirectory_targets_data):
-        """ Routine that converts projects located at the same directory """
+    def render_data(self, context):
+        """
+        Renders CMake code of target into context. With render cache rendered code
+        is taken from cache if the same model was rendered before.
+        """
+        render_key = None
+        if context.render_cache is not None:
+            render_key = get_model_fingerprint(context)
+            cached = context.render_cache.get(render_key)
+            if cached is not None:
+                context.cmake_lists_text, warnings_count = cached
+                context.warnings_count += warnings_count
+                context.render_cache_hit = True
+                message(context, 'Rendered code is taken from cache', '')
+                return
+
+        warnings_count = context.warnings_count
+        cmake_file = io.StringIO()
+        self.write_data(context, cmake_file)
+        context.cmake_lists_text = cmake_file.getvalue()
+        if render_key is not None:
+            context.render_cache.put(
+                render_key, context.cmake_lists_text, context.warnings_count - warnings_count
+            )
+
+    @staticmethod
+    def create_target_context(task, solution_context):
+        """
+        Creates context of target at worker from solution context and given task
+
+        :param task: description of project to convert
+        :type task: TargetTask
+        :param solution_context: context of solution of project
+        :type solution_context: Context
+        :return: context of target
+        :rtype: Context
+        """
+        target_context = solution_context.clone()
+        target_context.target_number = task.target_number
+        target_context.sln_configurations_map = OrderedDict(task.sln_configurations_map)
+        target_context.sln_deps = list(task.sln_deps)
+        target_context.project_folder = task.project_folder
+        project_key = os.path.normcase(os.path.normpath(os.path.abspath(task.target_abs)))
+        target_context.object_library = project_key in target_context.object_libraries
+        target_context.archived_object_libraries = list(
+            target_context.archived_object_libraries_of_projects.get(project_key, [])
+        )
+        target_context.fortran_module_dependencies = list(
+            target_context.fortran_module_dependencies_of_projects.get(project_key, [])
+        )
+        return target_context
+
+    def run_conversion(self, tasks, solution_key=None, solution_context=None):
+        """
+        Routine that converts given projects. Projects of the same directory go in a row.
+        Failed projects are skipped and reported in failures.
+
+        :param tasks: projects to convert
+        :type tasks: list
+        :param solution_key: key of solution of projects at batch mode
+        :type solution_key: str
+        :param solution_context: context of solution, worker process takes it by key if None
+        :type solution_context: Context
+        :return: results of converted projects and failures
+        :rtype: dict
+        """
+        if solution_context is None:
+            solution_context = get_worker_solution_context(solution_key)
         results = []
-        for target_data in subdirectory_targets_data:
-            target_context = target_data['target_context']
-            number = target_context.target_number
-            message(target_context, '------ Starting {} -------'.format(number), '')
-            converted = self.convert_project(
-                target_context,
-                target_data['target_abs'],
-                target_data['subdirectory'],
+        failures = []
+        prefetcher = self.__create_xml_prefetcher(solution_context, tasks)
+        try:
+            for index, task in enumerate(tasks):
+                if prefetcher is not None:
+                    prefetcher.schedule(
+                        [next_task.target_abs
+                         for next_task in tasks[index:index + prefetcher.depth + 1]]
+                    )
+                target_result = self.__convert_task(solution_context, task, prefetcher, failures)
+                if target_result is not None:
+                    results.append(target_result)
+        finally:
+            if prefetcher is not None:
+                prefetcher.shutdown()
+
+        if prefetcher is not None:
+            emit_event(
+                solution_context,
+                'prefetch_stats',
+                hits=prefetcher.hits,
+                misses=prefetcher.misses
             )
-            message(target_context, '------ Exiting  {} -------'.format(number), '')
+        if not solution_context.share_pch:  # otherwise they are written after sharing of PCH
+            self.write_cmake_lists_of_results(solution_context, results)
+        if solution_context.fs_stats:
+            return {'results': results, 'failures': failures, 'fs_stats': fs_stats.take_records()}
+        return {'results': results, 'failures': failures}
 
-            if not converted:
-                continue
+    def __convert_task(self, solution_context, task, prefetcher, failures):
+        """ Converts one project of batch. Returns result of project or None if it failed """
+        target_context = self.create_target_context(task, solution_context)
+        target_context.xml_prefetcher = prefetcher
+        number = target_context.target_number
+        if solution_context.fs_stats:
+            fs_stats.set_project(os.path.splitext(os.path.basename(task.target_abs))[0])
+        message(target_context, '------ Starting {} -------'.format(number), '')
+        emit_event(
+            target_context, 'project_started', target_number=number, path=task.target_abs
+        )
+        converted = False
+        try:
+            with ProjectTimer(target_context.project_timeout):
+                converted = self.convert_project(
+                    target_context,
+                    task.target_abs,
+                    task.subdirectory,
+                )
+        except (Exception, SystemExit) as e:  # failure of one project must not stop others
+            failures.append(self.__make_failure(target_context, task, e))
+        emit_event(
+            target_context,
+            'project_finished',
+            target_number=number,
+            path=task.target_abs,
+            project=target_context.project_name,
+            converted=converted,
+            warnings_count=target_context.warnings_count,
+            phases=target_context.phase_durations,
+        )
+        message(target_context, '------ Exiting  {} -------'.format(number), '')
+        target_context.xml_prefetcher = None
+        if solution_context.fs_stats:
+            fs_stats.set_project('')
+
+        if not converted:
+            return None
+
+        shared_pch = None
+        if target_context.share_pch and not target_context.dry:
+            shared_pch = get_pch_sharing_data(target_context)
+        compiler_cache_issues = []
+        if target_context.compiler_cache:
+            compiler_cache_issues = get_compiler_cache_issues(target_context)
+
+        # Can't return context as a result due PicklingError
+        return {
+            'cmake': target_context.cmake,
+            'target_name': target_context.project_name,
+            'project_languages': target_context.project_languages,
+            'target_windows_ver': target_context.target_windows_version,
+            'warnings_count': target_context.warnings_count,
+            'input_files': sorted(target_context.input_files),
+            'cmake_lists_text': target_context.cmake_lists_text,
+            'worker': os.getpid(),
+            'peak_rss': get_peak_rss(),
+            'render_cache_hit': target_context.render_cache_hit,
+            'shared_pch': shared_pch,
+            'compiler_cache_issues': compiler_cache_issues,
+            'handler_stats': target_context.handler_stats,
+        }
+
+    @staticmethod
+    def __make_failure(context, task, error):
+        if isinstance(error, ProjectTimeoutError):
+            reason = 'timeout'
+            details = 'conversion took more than {} s'.format(context.project_timeout)
+        elif isinstance(error, SystemExit):
+            reason = 'error'
+            details = 'conversion was aborted'
+        else:
+            reason = 'error'
+            details = '{}: {}'.format(type(error).__name__, error)
+        context.current_setting = (None, None)
+        context.current_node = None
+        message(context, 'Conversion failed ({}): {}'.format(reason, details), 'error')
+        emit_event(
+            context,
+            'project_failed',
+            target_number=task.target_number,
+            path=task.target_abs,
+            reason=reason,
+            details=details
+        )
+        return {
+            'target_number': task.target_number,
+            'path': task.target_abs,
+            'reason': reason,
+            'details': details,
+        }
+
+    @staticmethod
+    def write_cmake_lists_of_results(solution_context, results):
+        """
+        Writes rendered CMakeLists.txt of directories. Projects of the same directory are
+        written into one file. CMakeLists.txt of solution directory is left to be written
+        together with entry point of solution. In memory mode texts are only kept in results.
+
+        :param solution_context: context of solution
+        :type solution_context: Context
+        :param results: results of projects conversion
+        :type results: list
+        """
+        texts_of_directories = OrderedDict()
+        for target_result in results:
+            texts_of_directories.setdefault(target_result['cmake'], []).append(
+                target_result['cmake_lists_text']
+            )
 
-            target_context = target_data['target_context']
-            # Can't return context as a result due PicklingError
-            results.append(
-                {
-                    'cmake': target_context.cmake,
-                    'target_name': target_context.project_name,
-                    'project_languages': target_context.project_languages,
-                    'target_windows_ver': target_context.target_windows_version,
-                    'warnings_count': target_context.warnings_count
-                }
+        written = {}
+        for subdirectory, texts in texts_of_directories.items():
+            if solution_context.dry or solution_context.in_memory \
+                    or subdirectory == solution_context.solution_path:
+                continue
+            cmake_lists_path = os.path.join(subdirectory, 'CMakeLists.txt')
+            cmake_lists_text = ('\n' * 26).join(texts)
+            written[subdirectory] = (
+                cmake_lists_path,
+                write_file_if_changed(cmake_lists_path, cmake_lists_text)
+            )
+            emit_event(
+                solution_context,
+                'cmake_lists_written',
+                path=cmake_lists_path,
+                changed=written[subdirectory][1],
+                bytes=len(cmake_lists_text.encode('utf-8')),
+            )
+            message(
+                solution_context,
+                'CMakeLists.txt {} : {}'.format(
+                    'written' if written[subdirectory][1] else 'unchanged', cmake_lists_path
+                ),
+                ''
             )
-        return results
+
+        for target_result in results:
+            target_result['cmake_lists'], target_result['cmake_lists_changed'] = \
+                written.get(target_result['cmake'], ('', False))
+            if not solution_context.in_memory and \
+                    target_result['cmake'] != solution_context.solution_path:
+                target_result['cmake_lists_text'] = ''  # do not send it back
+
+    @staticmethod
+    def __create_xml_prefetcher(context, tasks):
+        """ Creates prefetcher of xml files if it makes sense for given projects """
+        if len(tasks) < 2:
+            return None
+        if context.prefetch_depth < 1:
+            return None
+        return XmlPrefetcher(context.prefetch_depth, context.prefetch_memory_limit)
+
+    @staticmethod
+    def __get_project_paths(inputs_of_solutions):
+        project_paths = []
+        for input_data_for_converter in inputs_of_solutions.values():
+            for tasks in input_data_for_converter.values():
+                project_paths.extend(task.target_abs for task in tasks)
+        return project_paths
+
+    @staticmethod
+    def get_executor(context, inputs_of_solutions):
+        """
+        Returns executor of conversion. Auto executor converts small solutions at main
+        process and large ones at pool of processes that are started by forkserver
+        if processes are spawned by default (otherwise they are forked cheaply).
+
+        :param context: context with options of converter
+        :type context: Context
+        :param inputs_of_solutions: input data for converter mapped to keys of solutions
+        :type inputs_of_solutions: OrderedDict
+        :return: one of 'serial', 'thread', 'process', 'forkserver'
+        :rtype: str
+        """
+        if context.jobs <= 1:
+            return 'serial'
+        if context.executor != 'auto':
+            return context.executor
+
+        project_paths = DataConverter.__get_project_paths(inputs_of_solutions)
+        if len(project_paths) <= AUTO_SERIAL_MAX_PROJECTS and \
+                sum(get_project_size(path) for path in project_paths) \
+                <= AUTO_SERIAL_MAX_INPUT_SIZE:
+            return 'serial'
+        start_methods = multiprocessing.get_all_start_methods()
+        start_method = multiprocessing.get_start_method(allow_none=True) or start_methods[0]
+        if start_method == 'spawn' and 'forkserver' in start_methods:
+            return 'forkserver'
+        return 'process'
+
+    @staticmethod
+    def __create_pool(project_context, executor, solution_contexts):
+        """ Creates pool of threads or processes with initialized workers """
+        if executor == 'thread':   # batches carry solution contexts
+            return ThreadPool(project_context.jobs)
+        if executor == 'forkserver':
+            mp_context = multiprocessing.get_context('forkserver')
+            mp_context.set_forkserver_preload(FORKSERVER_PRELOAD)
+        else:
+            mp_context = multiprocessing.get_context()
+        return mp_context.Pool(project_context.jobs,
+                               initializer=init_conversion_worker_process,
+                               initargs=(project_context, solution_contexts))
+
+    @staticmethod
+    def get_auto_jobs(context, inputs_of_solutions):
+        """
+        Returns count of workers for given projects that fits into available CPUs and memory
+
+        :param context: context with options of converter
+        :type context: Context
+        :param inputs_of_solutions: input data for converter mapped to keys of solutions
+        :type inputs_of_solutions: OrderedDict
+        :return: count of workers
+        :rtype: int
+        """
+        project_paths = DataConverter.__get_project_paths(inputs_of_solutions)
+        groups_count = sum(len(input_data) for input_data in inputs_of_solutions.values())
+
+        available_memory = get_available_memory()
+        worker_memory = estimate_worker_memory(
+            project_paths, context.prefetch_depth, context.prefetch_memory_limit
+        )
+        jobs = get_auto_jobs_count(context.jobs, available_memory, worker_memory, groups_count)
+
+        mega_byte = 1024 * 1024
+        message(
+            context,
+            'processes count = {} (auto: CPUs {}, available memory {}, '
+            'estimated memory of worker {:.1f} MB)'.format(
+                jobs,
+                context.jobs,
+                'unknown' if available_memory is None else
+                '{:.1f} MB'.format(available_memory / mega_byte),
+                worker_memory / mega_byte
+            ),
+            'done'
+        )
+        return jobs
+
+    @staticmethod
+    def __get_conversion_batches(inputs_of_solutions, jobs):
+        """
+        Splits input data into batches for workers. Projects located at the same
+        directory always stay at one batch, because they are written into one CMakeLists.txt.
+        Every batch contains projects of one solution and is a pair of tasks and solution key.
+        """
+        groups_count = sum(len(input_data) for input_data in inputs_of_solutions.values())
+        batches_count = 1
+        if jobs > 1:
+            batches_count = jobs * 4
+        batch_size = max(1, -(-groups_count // batches_count))
+
+        batches = []
+        for solution_key, input_data_for_converter in inputs_of_solutions.items():
+            groups = list(input_data_for_converter.values())
+            for i in range(0, len(groups), batch_size):
+                batch = []
+                for group in groups[i:i + batch_size]:
+                    batch.extend(group)
+                batches.append((batch, solution_key))
+        return batches
 
     def do_conversion(self, project_context, input_data_for_converter):
-        """ Executes conversion with given projects input data """
-        input_converter_data_list = []
-        for subdirectory in input_data_for_converter:
-            input_converter_data_list.append(input_data_for_converter[subdirectory])
+        """
+        Executes conversion with given projects input data.
+        Projects that failed are added to failures of project context.
+        """
+        return self.do_solutions_conversion(
+            project_context, OrderedDict([(None, input_data_for_converter)])
+        )[None]
 
-        results = []
-        if project_context.jobs > 1:
-            with Pool(project_context.jobs) as pool:
-                results = pool.map(self.run_conversion, input_converter_data_list)
+    def do_solutions_conversion(self, project_context, inputs_of_solutions,
+                                solution_contexts=None):
+        """
+        Executes conversion of projects of several solutions with one pool of workers.
+        Projects that failed are added to failures of project context.
+
+        :param project_context: context of main solution (key None) with options of converter
+        :type project_context: Context
+        :param inputs_of_solutions: input data for converter mapped to keys of solutions
+        :type inputs_of_solutions: OrderedDict
+        :param solution_contexts: contexts of other solutions mapped to their keys
+        :type solution_contexts: dict
+        :return: lists of results mapped to keys of solutions
+        :rtype: OrderedDict
+        """
+        if project_context.jobs_auto:
+            project_context.jobs = self.get_auto_jobs(project_context, inputs_of_solutions)
+        executor = self.get_executor(project_context, inputs_of_solutions)
+        message(project_context, 'executor = {}'.format(executor), '')
+        jobs = project_context.jobs if executor != 'serial' else 1
+        batches = self.__get_conversion_batches(inputs_of_solutions, jobs)
+
+        if executor in ('serial', 'thread'):  # contexts are passed, not kept at workers
+            if project_context.fs_stats:
+                fs_stats.enable()
+            batches = [
+                (tasks, solution_key, (solution_contexts or {}).get(solution_key, project_context))
+                for tasks, solution_key in batches
+            ]
+
+        batch_outputs = []
+        if executor != 'serial':
+            pool = self.__create_pool(project_context, executor, solution_contexts)
+            try:
+                batch_outputs = self.__run_pool_with_watchdog(project_context, pool, batches)
+            finally:
+                pool.terminate()
         else:   # do in main thread
-            for data_for_converter in input_converter_data_list:
-                results.append(self.run_conversion(data_for_converter))
+            for batch in batches:
+                batch_outputs.append(self.run_conversion(*batch))
+
+        results_of_solutions = OrderedDict(
+            (solution_key, []) for solution_key in inputs_of_solutions
+        )
+        for batch, batch_output in zip(batches, batch_outputs):
+            results_of_solutions[batch[1]].append(batch_output['results'])
+            project_context.failures.extend(batch_output['failures'])
+            if 'fs_stats' in batch_output:
+                fs_stats.add_records(batch_output['fs_stats'])
+        return results_of_solutions
+
+    def __run_pool_with_watchdog(self, project_context, pool, batches):
+        """
+        Runs batches at pool. If project timeout is set and no batch is finished during
+        time allowed for the longest batch, unfinished batches are considered hung.
+        Hung worker processes are killed with the pool afterwards, hung threads are abandoned.
+        """
+        pending = OrderedDict(
+            (index, pool.apply_async(self.run_conversion, batch))
+            for index, batch in enumerate(batches)
+        )
+        watchdog_seconds = None
+        if project_context.project_timeout:
+            watchdog_seconds = project_context.project_timeout * (
+                max(len(batch[0]) for batch in batches) + 1
+            )
+
+        batch_outputs = [None] * len(batches)
+        last_progress = time.time()
+        while pending:
+            for index in list(pending):
+                if pending[index].ready():
+                    batch_outputs[index] = pending.pop(index).get()
+                    last_progress = time.time()
+            if not pending:
+                break
+            if watchdog_seconds and time.time() - last_progress > watchdog_seconds:
+                for index in pending:
+                    batch_outputs[index] = self.__make_hung_batch_output(
+                        project_context, batches[index][0], watchdog_seconds
+                    )
+                break
+            next(iter(pending.values())).wait(0.05)
+        return batch_outputs
+
+    @staticmethod
+    def __make_hung_batch_output(project_context, tasks, watchdog_seconds):
+        failures = []
+        for task in tasks:
+            details = 'worker did not respond for {:.1f} s'.format(watchdog_seconds)
+            message(
+                project_context,
+                'Conversion of {} failed (timeout): {}'.format(task.target_abs, details),
+                'error'
+            )
+            failures.append({
+                'target_number': task.target_number,
+                'path': task.target_abs,
+                'reason': 'timeout',
+                'details': details,
+            })
+        return {'results': [], 'failures': failures}
+
+    def report_conversion_results(self, context, results):
+        """
+        Prints reports of conversion of projects: memory of workers, caches,
+        statistics of parser and failed projects
+
+        :param context: context of solution
+        :type context: Context
+        :param results: lists of results of projects conversion
+        :type results: list
+        """
+        self.__report_workers_memory(context, results)
+        self.__report_render_cache(context, results)
+        self.__report_compiler_cache(context, results)
+        self.__report_parser_stats(context, results)
+        self.__report_failures(context)
+
+    @staticmethod
+    def __report_failures(context):
+        """ Prints summary of projects that failed to convert """
+        if not context.failures:
+            return
+        message(
+            context,
+            'Failed projects: {} (skipped at output)'.format(len(context.failures)),
+            'error'
+        )
+        for failure in sorted(context.failures, key=lambda f: f['target_number']):
+            message(
+                context,
+                '    {}> {} : {} : {}'.format(
+                    failure['target_number'],
+                    failure['path'],
+                    failure['reason'],
+                    failure['details']
+                ),
+                'error'
+            )
+
+    @staticmethod
+    def __report_render_cache(context, results):
+        """ Prints how many targets were taken from render cache """
+        if context.render_cache is None:
+            return
+        target_results = [r for batch_results in results for r in batch_results]
+        hits = sum(1 for r in target_results if r.get('render_cache_hit'))
+        message(
+            context,
+            'Render cache: {} of {} targets taken from {}'.format(
+                hits, len(target_results), context.render_cache.directory
+            ),
+            'done'
+        )
+
+    @staticmethod
+    def __report_compiler_cache(context, results):
+        """ Prints targets which compilation can't be cached by compiler cache """
+        if not context.compiler_cache:
+            return
+        target_results = [r for batch_results in results for r in batch_results]
+        not_cached = [r for r in target_results if r.get('compiler_cache_issues')]
+        message(
+            context,
+            'Compiler cache: {} of {} targets are cache-friendly'.format(
+                len(target_results) - len(not_cached), len(target_results)
+            ),
+            'done'
+        )
+        for target_result in not_cached:
+            message(
+                context,
+                '    {} : {}'.format(
+                    target_result['target_name'],
+                    ', '.join(target_result['compiler_cache_issues'])
+                ),
+                'warn'
+            )
+
+    @staticmethod
+    def merge_handler_stats(results):
+        """
+        Merges statistics of parser handlers of all targets
 
-        return results
+        :param results: lists of results of projects conversion
+        :type results: list
+        :return: calls, total time, own time and project with the longest own time
+            mapped to keys of handlers
+        :rtype: dict
+        """
+        merged_stats = {}
+        for batch_results in results:
+            for target_result in batch_results:
+                for key, (calls, total_time, own_time) in \
+                        target_result.get('handler_stats', {}).items():
+                    stats = merged_stats.setdefault(key, {
+                        'calls': 0,
+                        'total_time': 0.0,
+                        'own_time': 0.0,
+                        'hottest_project': '',
+                        'hottest_project_time': 0.0,
+                    })
+                    stats['calls'] += calls
+                    stats['total_time'] += total_time
+                    stats['own_time'] += own_time
+                    if own_time > stats['hottest_project_time']:
+                        stats['hottest_project'] = target_result['target_name']
+                        stats['hottest_project_time'] = own_time
+        return merged_stats
+
+    def __report_parser_stats(self, context, results, count=10):
+        """ Prints parser handlers that took most of time at all workers """
+        if not context.parser_stats:
+            return
+        merged_stats = self.merge_handler_stats(results)
+        hottest_keys = sorted(
+            merged_stats, key=lambda k: merged_stats[k]['own_time'], reverse=True
+        )[:count]
+        message(
+            context,
+            'Hottest parser handlers ({} of {}, own time without nested handlers):'.format(
+                len(hottest_keys), len(merged_stats)
+            ),
+            'done'
+        )
+        for key in hottest_keys:
+            stats = merged_stats[key]
+            message(
+                context,
+                '    {} : {} calls, own {:.3f} s, total {:.3f} s, '
+                'most at {} ({:.3f} s)'.format(
+                    key,
+                    stats['calls'],
+                    stats['own_time'],
+                    stats['total_time'],
+                    stats['hottest_project'],
+                    stats['hottest_project_time']
+                ),
+                'done'
+            )
+
+    @staticmethod
+    def __report_workers_memory(context, results):
+        """ Prints peak resident memory of workers that converted projects """
+        peak_rss_of_workers = {}
+        for batch_results in results:
+            for target_result in batch_results:
+                if target_result['peak_rss'] is None:
+                    continue
+                worker = target_result['worker']
+                peak_rss_of_workers[worker] = max(
+                    peak_rss_of_workers.get(worker, 0), target_result['peak_rss']
+                )
+        if not peak_rss_of_workers:
+            return
+
+        mega_byte = 1024 * 1024
+        for worker in sorted(peak_rss_of_workers):
+            message(
+                context,
+                '    worker {} peak RSS: {:.1f} MB'.format(
+                    worker, peak_rss_of_workers[worker] / mega_byte
+                ),
+                ''
+            )
+        message(
+            context,
+            'Peak RSS per worker: max {:.1f} MB, workers {}'.format(
+                max(peak_rss_of_workers.values()) / mega_byte, len(peak_rss_of_workers)
+            ),
+            'done'
+        )
 
     @staticmethod
     def copy_cmake_utils(cmake_lists_path):
-        """ Copy necessary util files into CMake folder """
+        """
+        Copy necessary util files into CMake folder
+
+        :param cmake_lists_path: directory of solution CMakeLists.txt
+        :type cmake_lists_path: str
+        :return: paths of util files mapped to flag of change
+        :rtype: dict
+        """
         utils_path = os.path.join(cmake_lists_path, 'CMake')
         if not os.path.exists(utils_path):
             os.makedirs(utils_path)
         src_dir = os.path.dirname(os.path.abspath(__file__))
-        shutil.copyfile(os.path.join(src_dir, 'utils.cmake'), utils_path + '/Utils.cmake')
+        dst_path = utils_path + '/Utils.cmake'
+        return {dst_path: copy_file_if_changed(os.path.join(src_dir, 'utils.cmake'), dst_path)}
@@ -28,7 +28,6 @@
 
 import os
 import sys
-from lxml import etree
 
 from cmake_converter.utils import message, get_actual_filename, set_native_slash
 
@@ -95,13 +94,20 @@ def get_xml_data(context, xml_file):
     :rtype: dict
     """
 
+    from lxml import etree  # pylint: disable=import-outside-toplevel
+
     xml = {}
     xml_file = search_file_path(context, xml_file)
     if xml_file is None:
         return None
+    context.input_files.add(os.path.abspath(xml_file))
 
     try:
-        tree = etree.parse(xml_file)
+        tree = None
+        if context.xml_prefetcher is not None:
+            tree = context.xml_prefetcher.take(xml_file)
+        if tree is None:
+            tree = etree.parse(xml_file)
         namespace = str(tree.getroot().nsmap)
         ns = {'ns': namespace.partition('\'')[-1].rpartition('\'')[0]}
         xml['tree'] = tree
@@ -161,32 +167,48 @@ def get_definitiongroup(target_platform):
     return item
 
 
-def get_cmake_lists(context, cmake_path=None, open_type='w'):
+def write_file_if_changed(file_path, text):
     """
-    Create CMakeLists.txt file in wanted "cmake_path"
-
-    :param context: the context of converter
-    :type context: Context
-    :param cmake_path: path where CMakeLists.txt should be open
-    :type cmake_path: str
-    :param open_type: type that CMakeLists.txt should be opened
-    :type open_type: str
-    :return: cmake file wrapper opened
-    :rtype: _io.TextIOWrapper
+    Write given text into file only if file content differs. Keeps modification time of
+    unchanged files, so CMake does not reconfigure build directories without reason.
+
+    :param file_path: path of file to write
+    :type file_path: str
+    :param text: new content of file
+    :type text: str
+    :return: True if file was written
+    :rtype: bool
     """
 
-    if not cmake_path:
-        cmake_path = os.getcwd()
-        message(context, 'CMakeLists dir is current directory.', 'warn')
+    if os.path.exists(file_path):
+        with open(file_path, newline='', encoding='utf-8', errors='replace') as old_file:
+            if old_file.read() == text:
+                return False
 
-    cmake = os.path.join(cmake_path, 'CMakeLists.txt')
+    with open(file_path, 'w', newline='\n', encoding='utf-8') as new_file:
+        new_file.write(text)
+    return True
 
-    if not os.path.exists(cmake) and open_type == 'r':
-        return None
 
-    message(context, 'CMakeLists.txt will be written to : ' + cmake, '')
+def copy_file_if_changed(src_file_path, dst_file_path):
+    """
+    Copy file only if destination content differs
+
+    :param src_file_path: path of source file
+    :type src_file_path: str
+    :param dst_file_path: path of destination file
+    :type dst_file_path: str
+    :return: True if file was copied
+    :rtype: bool
+    """
 
-    with open(cmake, open_type, newline='\n', encoding='utf-8') as cmake_file:
-        yield cmake_file
+    with open(src_file_path, 'rb') as src_file:
+        content = src_file.read()
+    if os.path.exists(dst_file_path):
+        with open(dst_file_path, 'rb') as dst_file:
+            if dst_file.read() == content:
+                return False
 
-    return None
+    with open(dst_file_path, 'wb') as dst_file:
+        dst_file.write(content)
+    return True
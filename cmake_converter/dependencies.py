@@ -30,6 +30,7 @@ import ntpath
 import os
 import re
 
+from cmake_converter.cache import get_cached, REFERENCE_NAMES
 from cmake_converter.data_files import get_vcxproj_data
 from cmake_converter.utils import get_global_project_name_from_vcxproj_file, normalize_path, message
 from cmake_converter.utils import replace_vs_vars_with_cmake_vars, resolve_path_variables_of_vs
@@ -106,6 +107,15 @@ class Dependencies:
         :rtype: str
         """
 
+        return get_cached(
+            context,
+            REFERENCE_NAMES,
+            vs_project,
+            lambda path: Dependencies.__read_dependency_target_name(context, path)
+        )
+
+    @staticmethod
+    def __read_dependency_target_name(context, vs_project):
         vcxproj = get_vcxproj_data(context, vs_project)
         project_name = get_global_project_name_from_vcxproj_file(vcxproj)
 
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+    Events
+    ======
+     Machine-readable stream of conversion events. Workers put events into
+     a queue and one thread of main process writes them as JSON lines.
+"""
+
+import os
+import time
+import json
+import threading
+import multiprocessing
+
+EVENTS_FORMATS = ['jsonl']
+
+
+def emit_event(context, event, **fields):
+    """
+    Sends event into stream of context if events are enabled
+
+    :param context: converter context
+    :type context: Context
+    :param event: type of event
+    :type event: str
+    :param fields: data of event
+    """
+    if context.events is not None:
+        context.events.emit(event, **fields)
+
+
+class EventStream:
+    """
+        Queue of events shared with worker processes and writer thread of main process
+    """
+
+    def __init__(self, file_path, mp_context=None):
+        self.file_path = file_path
+        # queue is created by multiprocessing context that starts worker processes
+        self.queue = (mp_context or multiprocessing).Queue()
+        self.__writer_thread = None
+
+    def __getstate__(self):
+        return {'file_path': self.file_path, 'queue': self.queue}
+
+    def __setstate__(self, state):
+        self.file_path = state['file_path']
+        self.queue = state['queue']
+        self.__writer_thread = None
+
+    def __deepcopy__(self, memo):
+        return self     # shared by all contexts of process
+
+    def emit(self, event, **fields):
+        """ Puts event into queue. Never blocks on writing of file """
+        fields['event'] = event
+        fields['time'] = time.time()
+        fields['pid'] = os.getpid()
+        self.queue.put(fields)
+
+    def start(self):
+        """ Starts writer thread at main process """
+        self.__writer_thread = threading.Thread(target=self.__write_events, daemon=True)
+        self.__writer_thread.start()
+
+    def close(self):
+        """ Writes remaining events and stops writer thread """
+        self.queue.put(None)
+        self.__writer_thread.join()
+        self.queue.close()
+
+    def __write_events(self):
+        with open(self.file_path, 'w', encoding='utf-8') as events_file:
+            while True:
+                event = self.queue.get()
+                if event is None:
+                    break
+                events_file.write(json.dumps(event, sort_keys=True, default=str) + '\n')
+                events_file.flush()
@@ -43,6 +43,10 @@ class Flags:
         Class who manage flags of projects
     """
 
+    def release_parse_state(self):
+        """ Drops flags collected while parsing. They are applied to settings already """
+        self.flags.clear()
+
     @staticmethod
     def get_no_default_lib_link_flags(flag_value):
         """Helper to get list of /NODEFAULTLIB flags"""
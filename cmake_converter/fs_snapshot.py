@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    FsSnapshot
+    ==========
+     Index of directories of solution tree that is read once by parallel walk.
+     Conversion asks it instead of disk about existence of files, their actual
+     case and listings of directories.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def _get_key(path):
+    return os.path.normpath(path).lower()
+
+
+def _scan_directory(directory):
+    """
+    Reads entries of directory: names mapped to flags of directories and
+    subdirectories to walk
+    """
+    entries = {}
+    subdirectories = []
+    try:
+        with os.scandir(directory) as iterator:
+            for entry in iterator:
+                try:
+                    entries[entry.name] = entry.is_dir()
+                    if entry.is_dir(follow_symlinks=False) and not entry.name.startswith('.'):
+                        subdirectories.append(entry.path)
+                except OSError:
+                    entries[entry.name] = False
+    except OSError:
+        return directory, None, []
+    return directory, entries, subdirectories
+
+
+class FsSnapshot:
+    """
+        Case-insensitive index of directories under roots. Entries which names differ
+        only by case are all kept and the one with the same case is preferred.
+        Directories which names start with dot and links to directories are not walked,
+        paths under them are not covered by snapshot and must be checked at disk.
+    """
+
+    def __init__(self):
+        # key of directory -> variants of (actual path, names of entries,
+        #                                  lowered name -> variants of (name, is dir))
+        self.__directories = {}
+
+    def __deepcopy__(self, memo):
+        return self     # read only, shared by all contexts
+
+    def __len__(self):
+        return len(self.__directories)
+
+    @classmethod
+    def build(cls, roots, jobs):
+        """
+        Walks given directories with thread pool and builds snapshot of them
+
+        :param roots: absolute paths of directories to walk
+        :type roots: list
+        :param jobs: count of threads reading directories
+        :type jobs: int
+        :return: snapshot of directories
+        :rtype: FsSnapshot
+        """
+        snapshot = cls()
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+            pending = {
+                executor.submit(_scan_directory, os.path.normpath(root))
+                for root in cls.__get_outer_roots(roots)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory, entries, subdirectories = future.result()
+                    if entries is None:
+                        continue
+                    snapshot.add_directory(directory, entries)
+                    for subdirectory in subdirectories:
+                        pending.add(executor.submit(_scan_directory, subdirectory))
+        return snapshot
+
+    @staticmethod
+    def __get_outer_roots(roots):
+        """ Drops roots that are inside of other roots """
+        outer_roots = []
+        for root in sorted({_get_key(os.path.abspath(root)) for root in roots}):
+            if not any(root.startswith(os.path.join(outer_root, '')) or root == outer_root
+                       for outer_root in outer_roots):
+                outer_roots.append(root)
+        actual_roots = {_get_key(os.path.abspath(root)): os.path.abspath(root) for root in roots}
+        return [actual_roots[root] for root in outer_roots]
+
+    def add_directory(self, directory, entries):
+        """
+        Adds read directory to snapshot
+
+        :param directory: actual path of directory
+        :type directory: str
+        :param entries: flags that entry is directory mapped to names of entries
+        :type entries: dict
+        """
+        directory = os.path.normpath(directory)
+        names = sorted(entries)
+        lowered_names = {}
+        for name in names:
+            lowered_names.setdefault(name.lower(), []).append((name, entries[name]))
+        variants = self.__directories.setdefault(_get_key(directory), [])
+        variants.append((directory, names, lowered_names))
+        variants.sort(key=lambda variant: variant[0])
+
+    def __get_directories(self, path):
+        """ Returns walked directories of given normalized path, the same case first """
+        variants = self.__directories.get(_get_key(path), [])
+        return sorted(variants, key=lambda variant: variant[0] != path)
+
+    def __get_directory(self, path):
+        """ Returns walked directory of given normalized path preferring the same case """
+        return next(iter(self.__get_directories(path)), None)
+
+    def lookup(self, path):
+        """
+        Finds actual path of given absolute path ignoring case
+
+        :param path: absolute path of file or directory
+        :type path: str
+        :return: flag that snapshot covers path and actual path or None if path is absent
+        :rtype: tuple
+        """
+        if not os.path.isabs(path):
+            return False, None
+        path = os.path.normpath(path)
+        directory = self.__get_directory(path)
+        if directory is not None and directory[0] == path:
+            return True, path
+
+        rest = []
+        parent = path
+        while True:
+            parent, name = os.path.split(parent)
+            if not name:
+                # root walked with other case or no walked directory above path
+                return (True, directory[0]) if directory is not None else (False, None)
+            rest.append(name)
+            parent_directories = self.__get_directories(parent)
+            if parent_directories:
+                results = [self.__lookup_in_directory(parent_directory, rest)
+                           for parent_directory in parent_directories]
+                return next((result for result in results if result[1]), results[0])
+
+    def __lookup_in_directory(self, directory, rest):
+        """ Finds path made of reversed names of rest at walked directory """
+        actual_parent, _, lowered_names = directory
+        variants = lowered_names.get(rest[-1].lower())
+        if variants is None:
+            return True, None
+        actual_name, is_dir = next(
+            (variant for variant in variants if variant[0] == rest[-1]), variants[0]
+        )
+        actual_path = os.path.join(actual_parent, actual_name)
+        if is_dir:
+            walked = self.__get_directory(actual_path)
+            if walked is None or walked[0] != actual_path:
+                return False, None     # directory that is not walked
+        if len(rest) > 1:
+            return True, None      # path under file
+        return True, actual_path
+
+    def exists(self, path):
+        """
+        Checks existence of path with the same case sensitivity as filesystem
+
+        :param path: absolute path of file or directory
+        :type path: str
+        :return: flag that snapshot covers path and flag of existence
+        :rtype: tuple
+        """
+        covered, actual_path = self.lookup(path)
+        if not covered or actual_path is None:
+            return covered, False
+        return True, os.path.normcase(actual_path) == os.path.normcase(os.path.normpath(path))
+
+    def listdir(self, path):
+        """
+        Returns names of entries of directory like os.listdir
+
+        :param path: absolute path of directory
+        :type path: str
+        :return: flag that snapshot covers path and names or None if directory is absent
+        :rtype: tuple
+        """
+        covered, actual_path = self.lookup(path)
+        if not covered or actual_path is None:
+            return covered, None
+        if os.path.normcase(actual_path) != os.path.normcase(os.path.normpath(path)):
+            return True, None
+        directory = self.__get_directory(actual_path)
+        if directory is None or directory[0] != actual_path:
+            return True, None      # it is file
+        return True, list(directory[1])
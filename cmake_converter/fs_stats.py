@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    Filesystem statistics
+    =====================
+     Counts and times calls of filesystem functions by call site, project and path.
+     Functions are replaced at their modules only when statistics are enabled.
+"""
+
+import builtins
+import glob
+import os
+import sys
+import threading
+import time
+
+from cmake_converter.utils import message
+
+# Functions that are measured: (operation, module, name of function)
+MEASURED_FUNCTIONS = (
+    ('os.path.exists', os.path, 'exists'),
+    ('os.path.isfile', os.path, 'isfile'),
+    ('os.path.isdir', os.path, 'isdir'),
+    ('os.path.ismount', os.path, 'ismount'),
+    ('os.path.getsize', os.path, 'getsize'),
+    ('os.stat', os, 'stat'),
+    ('os.listdir', os, 'listdir'),
+    ('os.scandir', os, 'scandir'),
+    ('glob.glob', glob, 'glob'),
+    ('open', builtins, 'open'),
+)
+
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_lock = threading.Lock()
+_state = threading.local()     # depth of measured calls and project of thread
+_original_functions = {}
+_calls = {}     # (operation, call site, project) -> [calls, seconds]
+_paths = {}     # path -> calls
+
+
+def _get_call_site(frame):
+    file_name = frame.f_code.co_filename
+    if file_name.startswith(_PACKAGE_DIR):
+        file_name = os.path.relpath(file_name, _PACKAGE_DIR).replace('\\', '/')
+    else:
+        file_name = os.path.basename(file_name)
+    return '{}:{} {}'.format(file_name, frame.f_lineno, frame.f_code.co_name)
+
+
+def _measure(operation, function):
+    def measured_function(*args, **kwargs):
+        depth = getattr(_state, 'depth', 0)
+        if depth:   # calls made by measured function itself are its cost
+            return function(*args, **kwargs)
+
+        _state.depth = 1
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            key = (
+                operation,
+                _get_call_site(sys._getframe(1)),  # pylint: disable=protected-access
+                getattr(_state, 'project', ''),
+            )
+            _state.depth = 0
+            path = args[0] if args and isinstance(args[0], str) else None
+            with _lock:
+                stats = _calls.setdefault(key, [0, 0.0])
+                stats[0] += 1
+                stats[1] += elapsed
+                if path is not None:
+                    _paths[path] = _paths.get(path, 0) + 1
+    measured_function.__wrapped__ = function
+    return measured_function
+
+
+def enable():
+    """ Starts measuring of filesystem functions at current process """
+    with _lock:
+        if _original_functions:
+            return
+        for operation, module, name in MEASURED_FUNCTIONS:
+            function = getattr(module, name)
+            _original_functions[(module, name)] = function
+            setattr(module, name, _measure(operation, function))
+
+
+def disable():
+    """ Restores measured functions. Collected records are kept """
+    with _lock:
+        for (module, name), function in _original_functions.items():
+            setattr(module, name, function)
+        _original_functions.clear()
+
+
+def is_enabled():
+    """ Returns True if filesystem functions are measured at current process """
+    return bool(_original_functions)
+
+
+def set_project(project):
+    """ Sets project which following calls of current thread belong to """
+    _state.project = project
+
+
+def take_records():
+    """
+    Returns records collected at current process and drops them
+
+    :return: records of calls as [operation, call site, project, calls, seconds] and
+        records of paths as [path, calls]
+    :rtype: dict
+    """
+    with _lock:
+        records = {
+            'calls': [list(key) + stats for key, stats in _calls.items()],
+            'paths': [[path, calls] for path, calls in _paths.items()],
+        }
+        _calls.clear()
+        _paths.clear()
+    return records
+
+
+def add_records(records):
+    """ Adds records taken at other process (worker) to records of current process """
+    with _lock:
+        for operation, call_site, project, calls, seconds in records['calls']:
+            stats = _calls.setdefault((operation, call_site, project), [0, 0.0])
+            stats[0] += calls
+            stats[1] += seconds
+        for path, calls in records['paths']:
+            _paths[path] = _paths.get(path, 0) + calls
+
+
+def get_report_lines(records, count=10):
+    """
+    Returns lines of report about the most expensive call sites, projects and
+    the most often touched paths
+
+    :param records: records returned by take_records
+    :type records: dict
+    :param count: count of lines of every part of report
+    :type count: int
+    :return: lines of report
+    :rtype: list
+    """
+    sites = {}
+    projects = {}
+    for operation, call_site, project, calls, seconds in records['calls']:
+        for key, totals in (((operation, call_site), sites), (project or '-', projects)):
+            stats = totals.setdefault(key, [0, 0.0])
+            stats[0] += calls
+            stats[1] += seconds
+
+    lines = [
+        'Filesystem calls: {} in {:.3f} s'.format(
+            sum(stats[0] for stats in sites.values()),
+            sum(stats[1] for stats in sites.values())
+        ),
+        'Call sites:',
+    ]
+    for (operation, call_site), (calls, seconds) in sorted(
+            sites.items(), key=lambda item: item[1][1], reverse=True)[:count]:
+        lines.append('    {:.3f} s {:>7} x {} at {}'.format(seconds, calls, operation, call_site))
+    lines.append('Projects (- is for solution):')
+    for project, (calls, seconds) in sorted(
+            projects.items(), key=lambda item: item[1][1], reverse=True)[:count]:
+        lines.append('    {:.3f} s {:>7} x {}'.format(seconds, calls, project))
+    lines.append('Most touched paths:')
+    for path, calls in sorted(records['paths'], key=lambda item: item[1], reverse=True)[:count]:
+        lines.append('    {:>7} x {}'.format(calls, path))
+    return lines
+
+
+def report_fs_stats(context):
+    """ Prints report about filesystem calls collected at current process """
+    for line in get_report_lines(take_records()):
+        message(context, line, 'done')
@@ -27,13 +27,75 @@
 """
 
 import argparse
+import glob
+import math
+import multiprocessing
 import os
+import sys
 
-from cmake_converter.visual_studio.context import VSContext
-from cmake_converter.visual_studio.solution import VSSolutionConverter
 from cmake_converter.utils import message
 
 
+def get_solution_paths(solution_patterns):
+    """
+    Expands given paths or wildcards of solutions into list of absolute paths without duplicates
+
+    :param solution_patterns: paths or wildcards of *.sln files
+    :type solution_patterns: list
+    :return: absolute paths of solutions
+    :rtype: list
+    """
+    sln_file_paths = []
+    for pattern in solution_patterns:
+        if any(c in pattern for c in '*?['):
+            paths = sorted(glob.glob(pattern))
+            if not paths:
+                raise ValueError('no solution matches {}'.format(pattern))
+        else:
+            paths = [pattern]
+        for path in paths:
+            path = os.path.abspath(path)
+            if path not in sln_file_paths:
+                sln_file_paths.append(path)
+    return sln_file_paths
+
+
+def positive_float(value):
+    """
+    Argument type of positive number of seconds
+
+    :param value: text of argument
+    :type value: str
+    :return: number
+    :rtype: float
+    """
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError('invalid number: {}'.format(value)) from None
+    if not (math.isfinite(number) and number > 0):
+        raise argparse.ArgumentTypeError('must be positive: {}'.format(value))
+    return number
+
+
+def non_negative_int(value):
+    """
+    Argument type of size that may be 0
+
+    :param value: text of argument
+    :type value: str
+    :return: number
+    :rtype: int
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError('invalid integer: {}'.format(value)) from None
+    if number < 0:
+        raise argparse.ArgumentTypeError('must not be negative: {}'.format(value))
+    return number
+
+
 def main():  # pragma: no cover
     """
     Define arguments and message to DataConverter()
@@ -41,22 +103,37 @@ def main():  # pragma: no cover
     """
 
     usage = "cmake-converter -s <path/to/file.sln> " \
-            "[ -h | -s | -p | -i | -d | -v | -w | -j | -a | -pi | -ias ]"
+            "[ -h | -s | -p | -t | -i | -d | -v | -w | -j | -a | -pi | -ias ]"
     parser = argparse.ArgumentParser(
         usage=usage,
         description='Converts Visual Studio projects in solution (*.sln) to CMakeLists.txt tree'
     )
     parser.add_argument(
         '-s', '--solution',
-        help='[required] valid solution file. i.e.: ../../my.sln',
+        help='[required] valid solution file. i.e.: ../../my.sln '
+             '(several files or wildcards convert solutions in batch)',
         required=True,
-        dest='solution'
+        dest='solution',
+        nargs='+'
     )
     parser.add_argument(
         '-p', '--projects-filter',
         help='python regexp to filter that projects should be converted from the given solution',
         dest='projects_regexp'
     )
+    parser.add_argument(
+        '-t', '--target',
+        help='convert only project with given name (may be repeated)',
+        dest='target_names',
+        action='append'
+    )
+    parser.add_argument(
+        '--with-deps',
+        help='convert projects given by --target with all their dependencies',
+        dest='with_deps',
+        default=False,
+        action='store_true'
+    )
     parser.add_argument(
         '-i', '--indent',
         help='indentation for formatting of out CMakeLists.txt',
@@ -81,9 +158,18 @@ def main():  # pragma: no cover
     )
     parser.add_argument(
         '-j', '--jobs',
-        help='run converter using given number of processes.',
+        help='run converter using given number of processes (default: CPUs available for '
+             'converter). "auto" also limits processes by available memory.',
         dest='jobs',
     )
+    parser.add_argument(
+        '--executor',
+        help='run conversion at main process (serial), at threads of main process (thread), '
+             'at processes (process) or at processes started by forkserver that preloads '
+             'converter (forkserver). Default "auto" chooses by count and size of projects.',
+        choices=['auto', 'serial', 'thread', 'process', 'forkserver'],
+        dest='executor',
+    )
     parser.add_argument(
         '-a', '--additional',
         help='[experimental] import cmake code from file.cmake to your final CMakeLists.txt',
@@ -104,8 +190,155 @@ def main():  # pragma: no cover
         action='store_true'
     )
 
+    parser.add_argument(
+        '--prefetch-depth',
+        help='count of next projects which xml files are read in background (0 disables).',
+        dest='prefetch_depth',
+        type=int,
+    )
+    parser.add_argument(
+        '--prefetch-memory',
+        help='memory limit in megabytes for xml trees read in background.',
+        dest='prefetch_memory',
+        type=int,
+    )
+    parser.add_argument(
+        '--project-timeout',
+        help='time limit in seconds for conversion of one project (failed projects are skipped).',
+        dest='project_timeout',
+        type=positive_float,
+    )
+    parser.add_argument(
+        '--render-cache',
+        help='directory of cache of rendered CMake code of targets (may be shared by runs).',
+        dest='render_cache',
+    )
+    parser.add_argument(
+        '--unity-build',
+        help='enable unity build of targets with given batch size '
+             '(default=8, 0 puts all sources of target into one batch).',
+        dest='unity_build',
+        type=non_negative_int,
+        nargs='?',
+        const=8,
+        metavar='BATCH_SIZE',
+    )
+    parser.add_argument(
+        '--share-pch',
+        help='reuse PCH of one target by other targets with the same PCH and compile settings.',
+        dest='share_pch',
+        default=False,
+        action='store_true'
+    )
+    parser.add_argument(
+        '--compiler-cache',
+        help='use given compiler launcher (ccache, sccache) with cache-friendly debug info.',
+        dest='compiler_cache',
+        metavar='LAUNCHER',
+    )
+    parser.add_argument(
+        '--parser-stats',
+        help='count calls and time of handlers of xml nodes and attributes and print hottest.',
+        dest='parser_stats',
+        default=False,
+        action='store_true'
+    )
+    parser.add_argument(
+        '--fs-stats',
+        help='count and time filesystem calls by call site, project and path and print them.',
+        dest='fs_stats',
+        default=False,
+        action='store_true'
+    )
+    parser.add_argument(
+        '--snapshot-fs',
+        help='read directories of solution once by parallel walk and answer file checks from it.',
+        dest='snapshot_fs',
+        default=False,
+        action='store_true'
+    )
+    parser.add_argument(
+        '--watch',
+        help='keep running and reconvert projects of solution when their files change.',
+        dest='watch',
+        default=False,
+        action='store_true'
+    )
+    parser.add_argument(
+        '--watch-interval',
+        help='polling interval of watch mode in seconds (default=1.0).',
+        dest='watch_interval',
+        default=1.0,
+        type=float
+    )
+    parser.add_argument(
+        '--shard',
+        help='convert only given part i/n of projects of solution (i in [1..n]) '
+             'and save results for --merge-shards.',
+        dest='shard',
+    )
+    parser.add_argument(
+        '--shard-results',
+        help='file for results of shard (default=<solution>.shard-<i>-of-<n>.json).',
+        dest='shard_results',
+    )
+    parser.add_argument(
+        '--merge-shards',
+        help='write entry point CMakeLists.txt of solution from results of all shards.',
+        dest='merge_shards',
+        nargs='+',
+        metavar='SHARD_RESULTS'
+    )
+    parser.add_argument(
+        '--events',
+        help='write machine-readable events of conversion in given format.',
+        dest='events',
+        choices=['jsonl'],
+    )
+    parser.add_argument(
+        '--events-file',
+        help='file for events (default=<solution>.events.jsonl).',
+        dest='events_file',
+    )
+
     args = parser.parse_args()
 
+    # converter is imported after parsing of arguments to keep --help and errors fast
+    # pylint: disable=import-outside-toplevel
+    from cmake_converter.visual_studio.context import VSContext
+    from cmake_converter.shards import parse_shard
+    from cmake_converter.render_cache import RenderCache
+    from cmake_converter import fs_stats
+
+    if args.fs_stats:
+        fs_stats.enable()
+
+    try:
+        sln_file_paths = get_solution_paths(args.solution)
+    except ValueError as e:
+        parser.error(str(e))
+    if len(sln_file_paths) > 1 and (args.watch or args.shard or args.merge_shards):
+        parser.error('several solutions can not be used with --watch, --shard or --merge-shards')
+
+    if args.share_pch and (args.watch or args.shard or args.merge_shards):
+        parser.error('--share-pch can not be used with --watch, --shard or --merge-shards')
+
+    if args.snapshot_fs and args.watch:
+        parser.error('--snapshot-fs can not be used with --watch')
+
+    if args.executor == 'forkserver' and \
+            'forkserver' not in multiprocessing.get_all_start_methods():
+        parser.error('forkserver executor is not supported at this platform')
+
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    if shard and args.merge_shards:
+        parser.error('--shard and --merge-shards can not be used together')
+
     project_context = VSContext()
     # Prepare context
     project_context.additional_code = args.additional
@@ -113,6 +346,12 @@ def main():  # pragma: no cover
     if args.projects_regexp:
         project_context.projects_regexp = args.projects_regexp
 
+    if args.target_names:
+        project_context.target_names = args.target_names
+        project_context.with_deps = args.with_deps
+    elif args.with_deps:
+        parser.error('--with-deps requires --target')
+
     if args.indent:
         project_context.indent = args.indent
 
@@ -124,9 +363,16 @@ def main():  # pragma: no cover
         project_context.verbose = True
         message(project_context, 'Converter runs in verbose mode', 'done')
 
-    if args.jobs:
-        project_context.jobs = int(args.jobs)
-    message(project_context, 'processes count = {}'. format(project_context.jobs), 'done')
+    if args.jobs == 'auto':
+        project_context.jobs_auto = True
+        message(project_context, 'processes count = auto', 'done')
+    else:
+        if args.jobs:
+            project_context.jobs = int(args.jobs)
+        message(project_context, 'processes count = {}'. format(project_context.jobs), 'done')
+
+    if args.executor:
+        project_context.executor = args.executor
 
     if args.warn:
         project_context.warn_level = int(args.warn)
@@ -136,12 +382,123 @@ def main():  # pragma: no cover
         message(project_context, 'include directories will be PRIVATE', 'done')
         project_context.private_include_directories = True
 
+    if args.prefetch_depth is not None:
+        project_context.prefetch_depth = args.prefetch_depth
+
+    if args.prefetch_memory is not None:
+        project_context.prefetch_memory_limit = args.prefetch_memory * 1024 * 1024
+
+    if args.project_timeout:
+        project_context.project_timeout = args.project_timeout
+        message(
+            project_context,
+            'time limit of project conversion = {} s'.format(project_context.project_timeout),
+            'done'
+        )
+
+    if args.render_cache:
+        project_context.render_cache = RenderCache(args.render_cache)
+        message(project_context, 'render cache = {}'.format(args.render_cache), 'done')
+
+    if args.unity_build is not None:
+        project_context.unity_build_batch_size = args.unity_build
+        message(
+            project_context,
+            'unity build batch size = {}'.format(project_context.unity_build_batch_size),
+            'done'
+        )
+
+    if args.share_pch:
+        project_context.share_pch = True
+        message(project_context, 'PCH will be shared between targets', 'done')
+
+    if args.compiler_cache:
+        project_context.compiler_cache = args.compiler_cache
+        message(project_context, 'compiler cache = {}'.format(args.compiler_cache), 'done')
+
+    if args.parser_stats:
+        project_context.parser_stats = True
+        message(project_context, 'parser handlers will be measured', 'done')
+
+    if args.fs_stats:
+        project_context.fs_stats = True
+        message(project_context, 'filesystem calls will be measured', 'done')
+
+    if args.snapshot_fs:
+        project_context.snapshot_fs = True
+        message(project_context, 'directories of solution will be read at once', 'done')
+
     if args.ignore_absent_sources:
         message(project_context, 'absent source files will be ignored', 'done')
         project_context.ignore_absent_sources = True
 
+    sln_file_path = sln_file_paths[0]
+    events_stream = None
+    if args.events:
+        events_stream = start_event_stream(
+            project_context,
+            args.events_file or os.path.splitext(sln_file_path)[0] + '.events.jsonl'
+        )
+
+    try:
+        run_converter(project_context, args, sln_file_paths, shard)
+    finally:
+        if project_context.fs_stats:
+            fs_stats.report_fs_stats(project_context)
+        if events_stream is not None:
+            events_stream.close()
+
+
+def start_event_stream(project_context, events_file):  # pragma: no cover
+    """ Starts writing of conversion events to given file """
+    from cmake_converter.events import EventStream  # pylint: disable=import-outside-toplevel
+    mp_context = None
+    if project_context.executor == 'forkserver':   # queue must be shared with its workers
+        mp_context = multiprocessing.get_context('forkserver')
+    events_stream = EventStream(os.path.abspath(events_file), mp_context)
+    events_stream.start()
+    project_context.events = events_stream
+    message(project_context, 'events will be written to {}'.format(events_file), 'done')
+    return events_stream
+
+
+def run_converter(project_context, args, sln_file_paths, shard):  # pragma: no cover
+    """ Runs converter in mode selected by arguments """
+    # pylint: disable=import-outside-toplevel
+    from cmake_converter.visual_studio.solution import VSSolutionConverter, SolutionError
+    from cmake_converter.visual_studio.watcher import VSSolutionWatcher
+    from cmake_converter.shards import get_shard_results_path
+
+    sln_file_path = sln_file_paths[0]
     converter = VSSolutionConverter()
-    converter.convert_solution(project_context, os.path.abspath(args.solution))
+    try:
+        if args.watch:
+            watcher = VSSolutionWatcher(interval=args.watch_interval)
+            watcher.watch(project_context, sln_file_path)
+            return
+
+        if args.merge_shards:
+            if not converter.merge_solution_shards(
+                    project_context, sln_file_path, args.merge_shards
+            ):
+                sys.exit(1)
+            return
+
+        if shard:
+            shard_results_path = args.shard_results or \
+                get_shard_results_path(sln_file_path, *shard)
+            converter.convert_solution_shard(
+                project_context, sln_file_path, shard, os.path.abspath(shard_results_path)
+            )
+        elif len(sln_file_paths) > 1:
+            converter.convert_solutions(project_context, sln_file_paths)
+        else:
+            converter.convert_solution(project_context, sln_file_path)
+    except SolutionError:
+        sys.exit(1)     # reported by converter already
+
+    if project_context.failures:
+        sys.exit(1)
 
 
 if __name__ == "__main__":  # pragma: no cover
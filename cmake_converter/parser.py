@@ -25,6 +25,7 @@ Module of Basic logic of parsers for Visual Solution projects
 """
 
 import re
+import time
 
 from cmake_converter.utils import message
 
@@ -39,6 +40,7 @@ class Parser:
     """
     def __init__(self):
         self.reset_setting_after_nodes = set()
+        self.handler_time_stack = []
 
     @staticmethod
     def parse(context):
@@ -61,6 +63,10 @@ class Parser:
         """ Basic implementation of getting attribute handlers dict """
         raise NotImplementedError('You need to define a get_attribute_handlers_dict method!')
 
+    def release_parse_state(self):
+        """ Drops data that is needed only while parsing """
+        self.reset_setting_after_nodes.clear()
+
     def reset_current_setting_after_parsing_node(self, node):
         """ Remember node after parsing that current setting must be reset """
         self.reset_setting_after_nodes.add(node)
@@ -70,6 +76,29 @@ class Parser:
         """ Removes namespace from xml tag """
         return re.sub(r'{.*\}', '', tag)
 
+    def _call_handler(self, context, stats_key, handler, *args):
+        """
+        Calls handler of node or attribute. With parser statistics counts calls of
+        handler, its total time and its own time without time of nested handlers.
+        """
+        if not context.parser_stats:
+            handler(*args)
+            return
+
+        self.handler_time_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            handler(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested_time = self.handler_time_stack.pop()
+            if self.handler_time_stack:
+                self.handler_time_stack[-1] += elapsed
+            stats = context.handler_stats.setdefault(stats_key, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += elapsed - nested_time
+
     def _parse_nodes(self, context, parent):
         for child_node in parent:
             if not isinstance(child_node.tag, str):
@@ -98,7 +127,13 @@ class Parser:
             if child_node_tag in node_handlers:
                 if child_node.text is not None:
                     child_node.text = child_node.text.strip()
-                    node_handlers[child_node_tag](context, child_node)
+                    self._call_handler(
+                        context,
+                        '<{}>'.format(child_node_tag),
+                        node_handlers[child_node_tag],
+                        context,
+                        child_node
+                    )
             else:
                 message(context, 'No handler for <{}> node.'.format(child_node_tag), 'warn3')
 
@@ -114,9 +149,19 @@ class Parser:
             node_key = '{}_{}'.format(node_tag, attr)
             attributes_handlers = self.get_attribute_handlers_dict(context)
             if node_key in attributes_handlers:    # node specified handler
-                attributes_handlers[node_key](context, node_key, node.get(attr), node)
+                self._call_handler(
+                    context,
+                    '<{}> {}'.format(node_tag, attr),
+                    attributes_handlers[node_key],
+                    context, node_key, node.get(attr), node
+                )
             elif attr in attributes_handlers:      # common attribute handler
-                attributes_handlers[attr](context, attr, node.get(attr), node)
+                self._call_handler(
+                    context,
+                    attr,
+                    attributes_handlers[attr],
+                    context, attr, node.get(attr), node
+                )
             else:
                 message(
                     context,
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    XmlPrefetcher
+    =============
+     Reads and parses xml files of upcoming projects at background threads
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from cmake_converter.system_resources import PREFETCHED_MEMORY_FACTOR
+
+
+def get_project_xml_files(project_path):
+    """ Returns xml files of project that are known before parsing of it """
+    project_dir = os.path.dirname(project_path)
+    return [
+        project_path,
+        project_path + '.filters',
+        os.path.join(project_dir, 'packages.config'),
+    ]
+
+
+def _parse_xml_file(xml_file):
+    """ Parses xml file at background thread. Errors are reported by main thread later """
+    from lxml import etree  # pylint: disable=import-outside-toplevel
+    try:
+        return etree.parse(xml_file)
+    except (OSError, IOError, etree.XMLSyntaxError):
+        return None
+
+
+class XmlPrefetcher:
+    """
+        Bounded queue of xml files that are read and parsed at thread pool
+        while current project is being converted. Memory limit applies to estimated
+        size of parsed trees, which are several times bigger than files.
+    """
+
+    def __init__(self, depth, memory_limit):
+        self.depth = depth
+        self.memory_limit = memory_limit
+        self.hits = 0
+        self.misses = 0
+        self.__executor = ThreadPoolExecutor(max_workers=max(1, depth))
+        self.__lock = threading.Lock()
+        self.__pending = OrderedDict()  # key -> (future, size)
+        self.__pending_bytes = 0
+
+    @staticmethod
+    def __key(xml_file):
+        return os.path.normcase(os.path.abspath(xml_file))
+
+    def schedule(self, project_paths):
+        """
+        Starts reading of xml files of given projects until memory limit is reached.
+        Files of projects that are not given any more (already passed) are dropped.
+
+        :param project_paths: paths of current project and projects that will be converted next
+        :type project_paths: list
+        """
+        xml_files = [
+            xml_file
+            for project_path in project_paths
+            for xml_file in get_project_xml_files(project_path)
+        ]
+        self.__drop_passed({self.__key(xml_file) for xml_file in xml_files})
+        for xml_file in xml_files:
+            key = self.__key(xml_file)
+            with self.__lock:
+                if key in self.__pending:
+                    continue
+            try:
+                size = os.path.getsize(xml_file) * PREFETCHED_MEMORY_FACTOR
+            except OSError:
+                continue
+            with self.__lock:
+                if self.__pending_bytes + size > self.memory_limit:
+                    return
+                self.__pending_bytes += size
+                self.__pending[key] = (self.__executor.submit(_parse_xml_file, xml_file), size)
+
+    def __drop_passed(self, keys):
+        """ Drops prefetched files except given ones, so they do not hold memory """
+        with self.__lock:
+            for key in [key for key in self.__pending if key not in keys]:
+                future, size = self.__pending.pop(key)
+                future.cancel()
+                self.__pending_bytes -= size
+
+    def take(self, xml_file):
+        """
+        Returns prefetched tree of given file or None if file was not prefetched.
+        Tree is given away only once, because parsers modify it.
+        """
+        with self.__lock:
+            pending = self.__pending.pop(self.__key(xml_file), None)
+            if pending is None:
+                self.misses += 1
+                return None
+            self.__pending_bytes -= pending[1]
+
+        tree = pending[0].result()
+        if tree is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return tree
+
+    def shutdown(self):
+        """ Drops not used prefetched data and stops threads """
+        with self.__lock:
+            for future, _ in self.__pending.values():
+                future.cancel()
+            self.__pending.clear()
+            self.__pending_bytes = 0
+        self.__executor.shutdown(wait=True)
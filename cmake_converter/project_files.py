@@ -32,6 +32,36 @@ import copy
 
 from cmake_converter.utils import take_name_from_list_case_ignore, normalize_path
 from cmake_converter.utils import message, set_unix_slash
+from cmake_converter.cache import get_cached, DIRECTORY_LISTINGS
+from cmake_converter.settings_store import SettingsStore
+
+
+def list_directory(path):
+    """ Returns names of entries of directory or empty list if it is absent """
+    if os.path.exists(path):
+        return os.listdir(path)
+    return []
+
+
+def get_directory_listing(context, path):
+    """
+    Returns names of entries of directory from snapshot of filesystem if it covers
+    the directory or from disk otherwise. Empty list is returned for absent directory.
+    """
+    if context.fs_snapshot is not None:
+        covered, names = context.fs_snapshot.listdir(path)
+        if covered:
+            return names or []
+    return get_cached(context, DIRECTORY_LISTINGS, path, list_directory)
+
+
+def is_existing_path(context, path):
+    """ Checks existence of path at snapshot of filesystem if it covers path or at disk """
+    if context.fs_snapshot is not None:
+        covered, exists = context.fs_snapshot.exists(path)
+        if covered:
+            return exists
+    return os.path.exists(path)
 
 
 class ProjectFiles:
@@ -44,13 +74,18 @@ class ProjectFiles:
         self.file_lists = {}
         self.file_lists_for_include_paths = {}
 
+    def release_parse_state(self):
+        """ Drops listings of directories that are needed only while parsing """
+        self.file_lists = {}
+        self.file_lists_for_include_paths = {}
+
     def include_directive_case_check(self, context, file_path_name, file_lists_for_include_paths):
         """ Dummy to fix crash """
 
     @staticmethod
     def __create_file_context(context):
         file_context = copy.copy(context)
-        file_context.settings = {}
+        file_context.settings = SettingsStore()
         file_context.flags = copy.copy(context.flags)
         file_context.flags.__init__()
         file_context.sln_configurations_map = copy.copy(context.sln_configurations_map)
@@ -111,9 +146,10 @@ class ProjectFiles:
             vcxproj_dir = os.path.dirname(context.vcxproj_path)
             file_path = normalize_path(context, vcxproj_dir, file_path, False, False)
             if file_path not in self.file_lists:
-                self.file_lists[file_path] = []
-                if os.path.exists(os.path.join(vcxproj_dir, file_path)):
-                    self.file_lists[file_path] = os.listdir(os.path.join(vcxproj_dir, file_path))
+                self.file_lists[file_path] = get_directory_listing(
+                    context,
+                    os.path.join(vcxproj_dir, file_path)
+                )
             if file_path not in files_container:
                 files_container[file_path] = []
             if file_name not in files_container[file_path]:
@@ -137,9 +173,9 @@ class ProjectFiles:
             for include_path in context.settings[setting]['inc_dirs_list']:
                 if include_path not in self.file_lists_for_include_paths:
                     abs_include_path = os.path.normpath(os.path.join(vcxproj_dir, include_path))
-                    if os.path.exists(abs_include_path):
+                    if is_existing_path(context, abs_include_path):
                         self.file_lists_for_include_paths[abs_include_path]\
-                            = set(os.listdir(abs_include_path))
+                            = set(get_directory_listing(context, abs_include_path))
 
     def apply_files_to_context(self, context):
         """ Analyzes collected set of files and initializes necessary variables """
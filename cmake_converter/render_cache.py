@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    RenderCache
+    ===========
+     Content-addressable cache of rendered CMake code of targets. Key is a hash of
+     merged project model with options of writer, so cache directory may be shared
+     between checkouts and runs.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+from cmake_converter import __version__
+
+RENDER_CACHE_VERSION = 2
+
+# Attributes of context that do not affect rendered code
+_VOLATILE_ATTRIBUTES = frozenset((
+    '_Context__writer',
+    'archived_object_libraries_of_projects',
+    'cache',
+    'cmake_lists_text',
+    'dry',
+    'events',
+    'executor',
+    'failures',
+    'fortran_module_dependencies_of_projects',
+    'fs_snapshot',
+    'fs_stats',
+    'handler_stats',
+    'in_memory',
+    'input_files',
+    'jobs',
+    'jobs_auto',
+    'message_sink',
+    'object_libraries',
+    'parser_stats',
+    'phase_durations',
+    'prefetch_depth',
+    'prefetch_memory_limit',
+    'project_timeout',
+    'projects_regexp',
+    'render_cache',
+    'render_cache_hit',
+    'selected_projects',
+    'share_pch',
+    'snapshot_fs',
+    'target_names',
+    'target_number',
+    'time0',
+    'verbose',
+    'warn_level',
+    'warnings_count',
+    'with_deps',
+    'xml_prefetcher',
+))
+
+
+def _write_canonical(value, output, in_progress):
+    """ Writes representation of value that does not depend on order of sets and dicts """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        output.append(repr(value))
+    elif isinstance(value, OrderedDict):
+        output.append('O{')
+        for key, item in value.items():
+            _write_canonical(key, output, in_progress)
+            output.append(':')
+            _write_canonical(item, output, in_progress)
+            output.append(',')
+        output.append('}')
+    elif isinstance(value, dict):
+        items = []
+        for key, item in value.items():
+            item_output = []
+            _write_canonical(key, item_output, in_progress)
+            item_output.append(':')
+            _write_canonical(item, item_output, in_progress)
+            items.append(''.join(item_output))
+        output.append('{' + ','.join(sorted(items)) + '}')
+    elif isinstance(value, (list, tuple)):
+        output.append('[')    # shared empty lists of settings are tuples
+        for item in value:
+            _write_canonical(item, output, in_progress)
+            output.append(',')
+        output.append(']')
+    elif isinstance(value, (set, frozenset)):
+        items = []
+        for item in value:
+            item_output = []
+            _write_canonical(item, item_output, in_progress)
+            items.append(''.join(item_output))
+        output.append('S{' + ','.join(sorted(items)) + '}')
+    elif hasattr(value, '__dict__') and id(value) not in in_progress:
+        in_progress.add(id(value))
+        output.append(type(value).__name__)
+        _write_canonical(
+            {k: v for k, v in vars(value).items() if k not in _VOLATILE_ATTRIBUTES},
+            output,
+            in_progress
+        )
+        in_progress.discard(id(value))
+    else:
+        output.append(type(value).__name__)
+
+
+def get_model_fingerprint(context):
+    """
+    Returns hash of merged project model of context with options of writer
+
+    :param context: context of target after merging of settings
+    :type context: Context
+    :return: hex digest
+    :rtype: str
+    """
+    output = ['{}:{}:'.format(RENDER_CACHE_VERSION, __version__)]
+    _write_canonical(context, output, set())
+    digest = hashlib.sha256(''.join(output).encode('utf-8'))
+    if context.additional_code:
+        try:
+            with open(context.additional_code, 'rb') as additional_code:
+                digest.update(additional_code.read())
+        except OSError:
+            pass    # writer reports it
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """
+        Directory with rendered CMake code of targets. Only path of directory is kept,
+        so cache is cheap to copy with contexts and to send to workers.
+    """
+
+    def __init__(self, directory):
+        self.directory = os.path.abspath(directory)
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __get_blob_path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def get(self, key):
+        """
+        Returns rendered code and count of warnings of rendering by key or None
+
+        :param key: fingerprint of model
+        :type key: str
+        :return: text and count of warnings
+        :rtype: tuple | None
+        """
+        try:
+            with open(self.__get_blob_path(key), encoding='utf-8') as blob:
+                data = json.load(blob)
+        except (OSError, ValueError):
+            return None
+        return data['text'], data['warnings_count']
+
+    def put(self, key, text, warnings_count):
+        """ Stores rendered code by key. File is replaced atomically for concurrent writers """
+        blob_path = self.__get_blob_path(key)
+        try:
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(blob_path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as blob:
+                json.dump({'text': text, 'warnings_count': warnings_count}, blob)
+            os.replace(temp_path, blob_path)
+        except OSError:
+            pass    # cache is optional, conversion goes on without it
@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    SettingsStore
+    =============
+     Columnar storage of settings of configurations: every property is kept as one
+     column across (conf, arch) pairs. Strings are interned and empty values are shared.
+     context.settings[setting][key] keeps working through SettingsOfConfiguration adapter.
+"""
+
+import copy
+import sys
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+
+class _EmptyDict(dict):
+    """ Shared immutable empty dict """
+
+    def __readonly(self, *args, **kwargs):
+        raise TypeError('shared empty value of settings can not be changed')
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return '_EMPTY_DICT'
+
+
+class _Absent:
+    """ Marker of absent value at column """
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return '_ABSENT'
+
+
+_EMPTY_LIST = ()
+_EMPTY_DICT = _EmptyDict()
+_ABSENT = _Absent()
+
+
+def _pack(value):
+    """ Returns value to keep at column: shared empty value or copy with interned strings """
+    if isinstance(value, list):
+        if not value:
+            return _EMPTY_LIST
+        return [
+            sys.intern(item) if type(item) is str else item  # pylint: disable=unidiomatic-typecheck
+            for item in value
+        ]
+    if isinstance(value, dict) and not value:
+        return _EMPTY_DICT
+    if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+        return sys.intern(value)
+    return value
+
+
+def _unpack(value):
+    """ Returns mutable value instead of shared empty one """
+    if value is _EMPTY_LIST:
+        return []
+    if value is _EMPTY_DICT:
+        return {}
+    return value
+
+
+class SettingsStore(MutableMapping):
+    """
+        Settings of target mapped to (conf, arch) pairs. Every column is a list with
+        value of property for every setting in order of adding of settings.
+        Heavy code reads values with get_column() and get_value() that do not unpack
+        shared empty values.
+    """
+
+    def __init__(self):
+        self.__rows = OrderedDict()     # (conf, arch) -> index of values at columns
+        self.__rows_count = 0
+        self.__free_rows = []           # indexes of rows of deleted settings
+        self.__columns = {}             # key -> list of values
+
+    def __getitem__(self, setting):
+        if setting not in self.__rows:
+            raise KeyError(setting)
+        return SettingsOfConfiguration(self, setting)
+
+    def __setitem__(self, setting, values):
+        self.__add_row(setting)
+        for key, value in values.items():
+            self.set_value(setting, key, value)
+
+    def __delitem__(self, setting):
+        row = self.__rows.pop(setting)
+        for column in self.__columns.values():
+            column[row] = _ABSENT
+        self.__free_rows.append(row)
+
+    def __iter__(self):
+        return iter(self.__rows)
+
+    def __len__(self):
+        return len(self.__rows)
+
+    def __contains__(self, setting):
+        return setting in self.__rows
+
+    def __add_row(self, setting):
+        """ Adds empty row of setting. Rows of replaced and deleted settings are reused """
+        row = self.__rows.get(setting)
+        if row is not None:
+            for column in self.__columns.values():
+                column[row] = _ABSENT
+            return row
+        if self.__free_rows:
+            row = self.__free_rows.pop()
+        else:
+            row = self.__rows_count
+            self.__rows_count += 1
+            for column in self.__columns.values():
+                column.append(_ABSENT)
+        self.__rows[setting] = row
+        return row
+
+    def get_column(self, key):
+        """
+        Returns values of property for all settings that have it
+
+        :param key: name of property
+        :type key: str
+        :return: values mapped to settings. Values must not be changed
+        :rtype: dict
+        """
+        column = self.__columns.get(key)
+        if column is None:
+            return {}
+        return {
+            setting: column[row] for setting, row in self.__rows.items()
+            if column[row] is not _ABSENT
+        }
+
+    def has_value(self, setting, key):
+        """ Checks whether given setting has property """
+        return self.get_value(setting, key, _ABSENT) is not _ABSENT
+
+    def get_value(self, setting, key, default=None):
+        """ Returns value of property without copying of shared empty value """
+        column = self.__columns.get(key)
+        row = self.__rows.get(setting)
+        if column is None or row is None or column[row] is _ABSENT:
+            return default
+        return column[row]
+
+    def get_mutable_value(self, setting, key):
+        """ Returns value of property that may be changed in place """
+        value = self.get_value(setting, key, _ABSENT)
+        if value is _ABSENT:
+            raise KeyError(key)
+        if value is _EMPTY_LIST or value is _EMPTY_DICT:
+            value = self.__columns[key][self.__rows[setting]] = _unpack(value)
+        return value
+
+    def set_value(self, setting, key, value):
+        """ Sets value of property for given setting """
+        row = self.__rows[setting]
+        column = self.__columns.get(key)
+        if column is None:
+            column = self.__columns[key] = [_ABSENT] * self.__rows_count
+        column[row] = _pack(value)
+
+    def delete_value(self, setting, key):
+        """ Removes property from given setting """
+        if not self.has_value(setting, key):
+            raise KeyError(key)
+        self.__columns[key][self.__rows[setting]] = _ABSENT
+
+    def get_keys(self, setting):
+        """ Returns names of properties of given setting """
+        row = self.__rows[setting]
+        return [key for key, column in self.__columns.items() if column[row] is not _ABSENT]
+
+    def copy_setting(self, source_setting, setting):
+        """ Adds setting with deep copy of values of source setting. Empty values stay shared """
+        source_row = self.__rows[source_setting]
+        row = self.__add_row(setting)
+        for column in self.__columns.values():
+            value = column[source_row]
+            if value is not _EMPTY_LIST and value is not _EMPTY_DICT:
+                value = copy.deepcopy(value)
+            column[row] = value
+
+
+class SettingsOfConfiguration(MutableMapping):
+    """
+        Adapter of one setting of SettingsStore with interface of dict
+    """
+
+    def __init__(self, store, setting):
+        self.__store = store
+        self.__setting = setting
+
+    def __getitem__(self, key):
+        try:
+            return self.__store.get_mutable_value(self.__setting, key)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        self.__store.set_value(self.__setting, key, value)
+
+    def __delitem__(self, key):
+        try:
+            self.__store.delete_value(self.__setting, key)
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return self.__store.has_value(self.__setting, key)
+
+    def __iter__(self):
+        return iter(self.__store.get_keys(self.__setting))
+
+    def __len__(self):
+        return len(self.__store.get_keys(self.__setting))
+
+    def __repr__(self):
+        return repr(dict(self.items()))
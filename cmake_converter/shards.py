@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+
+"""
+    Shards
+    ======
+     Deterministic partitioning of projects between several converter runs
+     and storing of their results for merging
+"""
+
+import os
+import json
+import hashlib
+
+SHARD_RESULTS_VERSION = 1
+
+# Keys of result of project conversion that hold absolute paths
+_PATH_KEYS = ('cmake', 'cmake_lists')
+
+
+def parse_shard(shard_text):
+    """
+    Parses shard given as "i/n" where i is in range [1..n]
+
+    :param shard_text: text of shard option
+    :type shard_text: str
+    :return: index and count of shards
+    :rtype: tuple
+    """
+    try:
+        index, count = (int(x) for x in shard_text.split('/'))
+    except ValueError as e:
+        raise ValueError('shard must be given as i/n, got "{}"'.format(shard_text)) from e
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError('shard index must be in range [1..{}], got {}'.format(count, index))
+    return index, count
+
+
+def get_shard_of_directory(solution_path, subdirectory, shards_count):
+    """
+    Returns shard index [1..n] of directory. Depends only on path of directory
+    relative to solution, so it is the same on every machine and python run.
+    """
+    relative_path = os.path.relpath(subdirectory, solution_path).replace('\\', '/')
+    digest = hashlib.sha1(relative_path.encode('utf-8')).hexdigest()
+    return int(digest, 16) % shards_count + 1
+
+
+def select_shard(solution_path, input_data_for_converter, shard_index, shards_count):
+    """
+    Selects projects of given shard. Projects of the same directory stay together
+    because they are written into one CMakeLists.txt
+
+    :param solution_path: directory of solution
+    :type solution_path: str
+    :param input_data_for_converter: lists of tasks mapped to directories
+    :type input_data_for_converter: dict
+    :param shard_index: index of shard [1..n]
+    :type shard_index: int
+    :param shards_count: count of shards
+    :type shards_count: int
+    :return: lists of tasks of shard mapped to directories
+    :rtype: dict
+    """
+    return {
+        subdirectory: tasks
+        for subdirectory, tasks in input_data_for_converter.items()
+        if get_shard_of_directory(solution_path, subdirectory, shards_count) == shard_index
+    }
+
+
+def get_shard_results_path(sln_file_path, shard_index, shards_count):
+    """ Returns default path of file with results of shard """
+    return '{}.shard-{}-of-{}.json'.format(
+        os.path.splitext(sln_file_path)[0], shard_index, shards_count
+    )
+
+
+def _relative_result(solution_path, target_result):
+    result = dict(target_result)
+    for key in _PATH_KEYS:
+        if result[key]:
+            result[key] = os.path.relpath(result[key], solution_path).replace('\\', '/')
+    result['input_files'] = [
+        os.path.relpath(f, solution_path).replace('\\', '/') for f in result['input_files']
+    ]
+    result['project_languages'] = sorted(result['project_languages'])
+    return result
+
+
+def _absolute_result(solution_path, target_result):
+    result = dict(target_result)
+    for key in _PATH_KEYS:
+        if result[key]:
+            result[key] = os.path.normpath(os.path.join(solution_path, result[key]))
+    result['input_files'] = [
+        os.path.normpath(os.path.join(solution_path, f)) for f in result['input_files']
+    ]
+    result['project_languages'] = set(result['project_languages'])
+    return result
+
+
+def save_shard_results(file_path, solution_path, shard_index, shards_count, results):
+    """
+    Saves results of shard conversion. Paths are stored relative to solution,
+    so shards may be converted at different checkouts.
+
+    :param file_path: path of file with results
+    :type file_path: str
+    :param solution_path: directory of solution
+    :type solution_path: str
+    :param shard_index: index of shard [1..n]
+    :type shard_index: int
+    :param shards_count: count of shards
+    :type shards_count: int
+    :param results: lists of results of projects conversion
+    :type results: list
+    """
+    shard_data = {
+        'version': SHARD_RESULTS_VERSION,
+        'shard': [shard_index, shards_count],
+        'results': [
+            _relative_result(solution_path, target_result)
+            for batch_results in results
+            for target_result in batch_results
+        ],
+    }
+    with open(file_path, 'w', encoding='utf-8') as shard_file:
+        json.dump(shard_data, shard_file, indent=1)
+
+
+def load_shard_results(file_path, solution_path):
+    """
+    Loads results of shard conversion
+
+    :param file_path: path of file with results
+    :type file_path: str
+    :param solution_path: directory of solution
+    :type solution_path: str
+    :return: index and count of shards with list of results
+    :rtype: tuple
+    """
+    with open(file_path, encoding='utf-8') as shard_file:
+        shard_data = json.load(shard_file)
+    if shard_data.get('version') != SHARD_RESULTS_VERSION:
+        raise ValueError('{} has unsupported version of shard results'.format(file_path))
+    shard_index, shards_count = shard_data['shard']
+    results = [
+        _absolute_result(solution_path, target_result)
+        for target_result in shard_data['results']
+    ]
+    return shard_index, shards_count, results
@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    Shared precompiled headers
+    ==========================
+     Targets of solution that build the same precompiled header with the same
+     compile settings reuse PCH of one of them (leader) with REUSE_FROM
+"""
+
+import hashlib
+import io
+import os
+from collections import OrderedDict
+
+from cmake_converter.flags import defines, cl_flags
+from cmake_converter.utils import message, make_cmake_literal
+
+# Settings of target that must be equal to share PCH
+_PCH_SETTINGS_KEYS = (
+    'target_type',
+    'PrecompiledHeader',
+    defines,
+    cl_flags,
+    'inc_dirs',
+    'MSVC_RUNTIME_LIBRARY',
+    'property_sheets',
+)
+
+_REUSE_FROM_TEXT = 'target_precompile_headers(${{PROJECT_NAME}} REUSE_FROM {})\n\n'
+
+
+def _get_path_key(path):
+    return os.path.normcase(os.path.normpath(os.path.abspath(path)))
+
+
+def _get_absolute_value(context, value):
+    """ Makes paths relative to directory of CMakeLists.txt comparable between targets """
+    if isinstance(value, str) and '${CMAKE_CURRENT_SOURCE_DIR}' in value:
+        return os.path.normpath(value.replace('${CMAKE_CURRENT_SOURCE_DIR}', context.cmake))
+    return value
+
+
+def get_pch_sharing_data(context):
+    """
+    Returns data of target to find targets with the same PCH at solution
+
+    :param context: context of target after rendering
+    :type context: Context
+    :return: hash of PCH settings, rendered PCH code and name of target or None
+        if PCH of target can not be shared
+    :rtype: dict
+    """
+    if context.object_library:
+        return None     # PCH is compiled by separate OBJECT library of target
+    pch_file = io.StringIO()
+    context.writer.write_use_pch_function(context, pch_file)
+    pch_text = pch_file.getvalue()
+    if not pch_text:
+        return None
+
+    settings_of_target = []
+    pch_header = ''
+    for sln_setting, mapped_setting in sorted(context.sln_configurations_map.items(), key=repr):
+        if mapped_setting not in context.settings:
+            continue
+        if context.settings.get_value(mapped_setting, 'target_type') == 'DynamicLibrary':
+            return None     # every shared library has its own <target>_EXPORTS define
+        values = [repr(sln_setting)]
+        for key in _PCH_SETTINGS_KEYS:
+            value = context.settings.get_value(mapped_setting, key)
+            if isinstance(value, (list, tuple)):
+                value = [_get_absolute_value(context, item) for item in value]
+            values.append(repr(value))
+        settings_of_target.append(values)
+        pch_header = pch_header or context.settings.get_value(
+            mapped_setting, 'PrecompiledHeaderFile', ''
+        )
+
+    pch_header = _get_path_key(os.path.join(os.path.dirname(context.vcxproj_path), pch_header))
+    signature = hashlib.sha256(repr((pch_header, settings_of_target)).encode('utf-8'))
+    return {
+        'signature': signature.hexdigest(),
+        'text': pch_text,
+        'target': make_cmake_literal(context, context.project_name),
+        'path': context.vcxproj_path,
+    }
+
+
+def share_precompiled_headers(context, results, dependencies):
+    """
+    Groups targets by PCH data of results and replaces PCH of every target of group
+    with reusing of PCH of leader. Leader is the first target of group that does not
+    depend on other targets of group, so reusing does not make cycles.
+
+    :param context: context of solution
+    :type context: Context
+    :param results: lists of results of projects conversion
+    :type results: list
+    :param dependencies: paths of all dependencies of project mapped to its path
+    :type dependencies: dict
+    :return: count of targets that reuse PCH
+    :rtype: int
+    """
+    groups = OrderedDict()
+    for batch_results in results:
+        for target_result in batch_results:
+            pch_data = target_result.get('shared_pch')
+            if pch_data is not None and target_result['cmake_lists_text']:
+                groups.setdefault(pch_data['signature'], []).append(target_result)
+
+    reusing_count = 0
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        paths = [_get_path_key(target_result['shared_pch']['path']) for target_result in group]
+        leader = None
+        for target_result, path in zip(group, paths):
+            if not dependencies.get(path, set()).intersection(paths):
+                leader = target_result
+                break
+        if leader is None:
+            message(
+                context,
+                'PCH of {} is not shared due to cycle of dependencies'.format(
+                    ', '.join(target_result['target_name'] for target_result in group)
+                ),
+                'warn'
+            )
+            continue
+
+        leader_name = leader['shared_pch']['target']
+        for target_result in group:
+            if target_result is leader:
+                continue
+            target_result['cmake_lists_text'] = target_result['cmake_lists_text'].replace(
+                target_result['shared_pch']['text'], _REUSE_FROM_TEXT.format(leader_name), 1
+            )
+            reusing_count += 1
+        message(
+            context,
+            'PCH of {} is shared by {} targets'.format(leader['target_name'], len(group)),
+            ''
+        )
+
+    message(context, 'Targets that reuse PCH of other targets: {}'.format(reusing_count), 'done')
+    return reusing_count
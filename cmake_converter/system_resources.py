@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    System resources
+    ================
+     CPUs and memory that are really available for converter. Affinity mask and
+     cgroup limits of containers are taken into account.
+"""
+
+import os
+from multiprocessing import cpu_count
+
+CGROUP_ROOT = '/sys/fs/cgroup'
+PROC_SELF_CGROUP = '/proc/self/cgroup'
+PROC_MEMINFO = '/proc/meminfo'
+
+# Memory of worker process without any project and growth of it per byte of project file
+WORKER_BASE_MEMORY = 32 * 1024 * 1024
+PROJECT_MEMORY_FACTOR = 128
+# Memory of parsed xml tree per byte of prefetched file
+PREFETCHED_MEMORY_FACTOR = 8
+
+
+def _read_text(path):
+    try:
+        with open(path, encoding='utf-8') as text_file:
+            return text_file.read().strip()
+    except (OSError, IOError, UnicodeDecodeError):
+        return None
+
+
+def _read_cgroups_of_process(proc_cgroup):
+    """ Returns paths of cgroups of process mapped to controllers ('' is cgroup v2) """
+    cgroups = {}
+    text = _read_text(proc_cgroup) or ''
+    for line in text.splitlines():
+        parts = line.split(':', 2)
+        if len(parts) != 3:
+            continue
+        for controller in parts[1].split(','):
+            cgroups[controller] = parts[2]
+    return cgroups
+
+
+def _get_cgroup_directories(cgroup_root, proc_cgroup, controller):
+    """
+    Returns directories of cgroup of process and of its ancestors for given controller
+    of cgroup v1 and for cgroup v2. Limit of any of them applies to the process.
+    """
+    mounts = [cgroup_root, os.path.join(cgroup_root, 'unified')]
+    try:
+        mounts.extend(
+            os.path.join(cgroup_root, name) for name in sorted(os.listdir(cgroup_root))
+            if controller in name.split(',')
+        )
+    except OSError:
+        return []
+
+    cgroups = _read_cgroups_of_process(proc_cgroup)
+    directories = []
+    for mount in mounts:
+        cgroup_path = cgroups.get('' if mount in mounts[:2] else controller, '/').strip('/')
+        while cgroup_path:
+            directories.append(os.path.join(mount, cgroup_path))
+            cgroup_path = os.path.dirname(cgroup_path)
+        directories.append(mount)
+    return [directory for directory in directories if os.path.isdir(directory)]
+
+
+def _read_number(path):
+    """ Returns integer from file or None if file is absent or limit is not set """
+    text = _read_text(path)
+    if text is None or text == 'max':
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return None
+
+
+def get_cgroup_cpu_limit(cgroup_root=CGROUP_ROOT, proc_cgroup=PROC_SELF_CGROUP):
+    """
+    Returns count of CPUs allowed by CPU quota of cgroup of process or None if quota is not set
+
+    :param cgroup_root: mount point of cgroup file systems
+    :type cgroup_root: str
+    :param proc_cgroup: file with cgroups of process
+    :type proc_cgroup: str
+    :return: count of CPUs rounded up
+    :rtype: int
+    """
+    limit = None
+    for directory in _get_cgroup_directories(cgroup_root, proc_cgroup, 'cpu'):
+        cpu_max = (_read_text(os.path.join(directory, 'cpu.max')) or '').split()
+        if len(cpu_max) == 2 and cpu_max[0] != 'max':
+            quota, period = cpu_max
+        else:
+            quota = _read_text(os.path.join(directory, 'cpu.cfs_quota_us'))
+            period = _read_text(os.path.join(directory, 'cpu.cfs_period_us'))
+        try:
+            quota, period = int(quota), int(period)
+        except (TypeError, ValueError):
+            continue
+        if quota <= 0 or period <= 0:
+            continue
+        cpus = max(1, -(-quota // period))
+        limit = cpus if limit is None else min(limit, cpus)
+    return limit
+
+
+def get_available_cpu_count(cgroup_root=CGROUP_ROOT, proc_cgroup=PROC_SELF_CGROUP):
+    """
+    Returns count of CPUs that converter may use: CPUs of affinity mask of process
+    limited by CPU quota of container
+
+    :param cgroup_root: mount point of cgroup file systems
+    :type cgroup_root: str
+    :param proc_cgroup: file with cgroups of process
+    :type proc_cgroup: str
+    :return: count of CPUs
+    :rtype: int
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except (AttributeError, OSError):  # Windows and macOS
+        cpus = cpu_count()
+    cgroup_limit = get_cgroup_cpu_limit(cgroup_root, proc_cgroup)
+    if cgroup_limit is not None:
+        cpus = min(cpus, cgroup_limit)
+    return max(1, cpus)
+
+
+def get_available_memory(cgroup_root=CGROUP_ROOT, proc_cgroup=PROC_SELF_CGROUP,
+                         meminfo=PROC_MEMINFO):
+    """
+    Returns memory that may be used without swapping: available memory of system
+    limited by free memory of cgroups of process
+
+    :param cgroup_root: mount point of cgroup file systems
+    :type cgroup_root: str
+    :param proc_cgroup: file with cgroups of process
+    :type proc_cgroup: str
+    :param meminfo: file with memory information of system
+    :type meminfo: str
+    :return: count of bytes or None if it is unknown
+    :rtype: int
+    """
+    available = None
+    for line in (_read_text(meminfo) or '').splitlines():
+        if line.startswith('MemAvailable:'):
+            available = int(line.split()[1]) * 1024
+            break
+
+    for directory in _get_cgroup_directories(cgroup_root, proc_cgroup, 'memory'):
+        for limit_file, usage_file in (('memory.max', 'memory.current'),
+                                       ('memory.limit_in_bytes', 'memory.usage_in_bytes')):
+            limit = _read_number(os.path.join(directory, limit_file))
+            usage = _read_number(os.path.join(directory, usage_file))
+            # cgroup v1 reports huge number when limit is not set
+            if limit is None or usage is None or limit >= 2 ** 62:
+                continue
+            free = max(0, limit - usage)
+            available = free if available is None else min(available, free)
+    return available
+
+
+def get_project_size(project_path):
+    """
+    Returns size of project file and its filters
+
+    :param project_path: path of project file
+    :type project_path: str
+    :return: count of bytes
+    :rtype: int
+    """
+    size = 0
+    for project_file in (project_path, project_path + '.filters'):
+        try:
+            size += os.path.getsize(project_file)
+        except OSError:
+            pass
+    return size
+
+
+def estimate_worker_memory(project_paths, prefetch_depth=0, prefetch_memory_limit=0):
+    """
+    Estimates peak memory of worker process that converts given projects one by one.
+    It grows with size of the largest project and with xml trees of prefetched projects.
+
+    :param project_paths: paths of project files
+    :type project_paths: list
+    :param prefetch_depth: count of projects prefetched by worker
+    :type prefetch_depth: int
+    :param prefetch_memory_limit: limit of memory of xml trees prefetched by worker
+    :type prefetch_memory_limit: int
+    :return: count of bytes
+    :rtype: int
+    """
+    largest_project_size = max(
+        [get_project_size(project_path) for project_path in project_paths] or [0]
+    )
+
+    prefetched_memory = min(
+        prefetch_memory_limit,
+        PREFETCHED_MEMORY_FACTOR * max(0, prefetch_depth) * largest_project_size
+    )
+    return WORKER_BASE_MEMORY + PROJECT_MEMORY_FACTOR * largest_project_size + prefetched_memory
+
+
+def get_auto_jobs_count(cpus, available_memory, worker_memory, groups_count):
+    """
+    Returns count of workers that fits into CPUs and available memory and is not
+    greater than count of groups of projects that are converted separately
+
+    :param cpus: count of available CPUs
+    :type cpus: int
+    :param available_memory: available memory in bytes or None if it is unknown
+    :type available_memory: int
+    :param worker_memory: estimated peak memory of worker in bytes
+    :type worker_memory: int
+    :param groups_count: count of groups of projects (directories of CMakeLists.txt)
+    :type groups_count: int
+    :return: count of workers
+    :rtype: int
+    """
+    jobs = min(cpus, max(1, groups_count))
+    if available_memory is not None and worker_memory > 0:
+        jobs = min(jobs, available_memory // worker_memory)
+    return max(1, jobs)
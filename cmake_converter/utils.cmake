@@ -227,6 +227,48 @@ function(source_file_compile_options SOURCE_FILE)
     set_source_files_properties("${SOURCE_FILE}" PROPERTIES COMPILE_OPTIONS "${COMPILE_OPTIONS}")
 endfunction()
 
+################################################################################
+# Compile OBJECT library with compile properties of STATIC library which is built
+# from its objects. Usage requirements of libraries linked by STATIC library are
+# used too. PCH is compiled by OBJECT library only.
+#     use_compile_properties(<objects_target> <target>)
+# Input:
+#     objects_target - OBJECT library
+#     target         - STATIC library
+################################################################################
+function(use_compile_properties OBJECTS_TARGET TARGET)
+    set(PROPERTIES
+        COMMON_LANGUAGE_RUNTIME
+        COMPILE_DEFINITIONS
+        COMPILE_FEATURES
+        COMPILE_OPTIONS
+        Fortran_MODULE_DIRECTORY
+        INCLUDE_DIRECTORIES
+        INTERPROCEDURAL_OPTIMIZATION
+        MSVC_RUNTIME_LIBRARY
+        PRECOMPILE_HEADERS
+        UNITY_BUILD
+        UNITY_BUILD_BATCH_SIZE
+    )
+    foreach(CONFIG ${CMAKE_CONFIGURATION_TYPES} ${CMAKE_BUILD_TYPE})
+        string(TOUPPER "${CONFIG}" CONFIG_U)
+        list(APPEND PROPERTIES "INTERPROCEDURAL_OPTIMIZATION_${CONFIG_U}")
+    endforeach()
+
+    foreach(PROPERTY ${PROPERTIES})
+        get_target_property(VALUE "${TARGET}" "${PROPERTY}")
+        if(NOT "${VALUE}" STREQUAL "VALUE-NOTFOUND")
+            set_target_properties("${OBJECTS_TARGET}" PROPERTIES "${PROPERTY}" "${VALUE}")
+        endif()
+    endforeach()
+    set_property(TARGET "${TARGET}" PROPERTY PRECOMPILE_HEADERS)
+
+    get_target_property(LINK_LIBRARIES "${TARGET}" LINK_LIBRARIES)
+    if(LINK_LIBRARIES)
+        target_link_libraries("${OBJECTS_TARGET}" PRIVATE ${LINK_LIBRARIES})
+    endif()
+endfunction()
+
 ################################################################################
 # Default properties of visual studio projects
 ################################################################################
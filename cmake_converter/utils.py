@@ -31,14 +31,13 @@ import glob
 import re
 import time
 import ntpath
+import sys
 import sysconfig
 
 
-import colorama
-
-
 def init_colorama():
     """ Initialization of colorful console output """
+    import colorama  # pylint: disable=import-outside-toplevel
     if 'PYCHARM_HOSTED' in os.environ:
         convert = False  # in PyCharm, we should disable convert
         strip = False
@@ -49,13 +48,40 @@ def init_colorama():
     colorama.init(convert=convert, strip=strip)
 
 
-init_colorama()
+# ANSI codes of colorama.Fore and colorama.Style
+DONE = '\033[32m\033[1m'
+OK = '\033[36m\033[1m'
+WARN = '\033[33m\033[1m'
+FAIL = '\033[31m\033[1m'
+ENDC = '\033[39m\033[0m'
+
+# Console is set up on first message, so that imports and runs without output stay fast
+_console = {'ready': False, 'colors': True}
+
+
+def init_console():
+    """ Sets up console of main process before first output """
+    if not _console['ready']:
+        _console['ready'] = True
+        init_colorama()
+
+
+def init_worker_console():
+    """
+    Sets up console of worker process that writes into console of main process.
+    Colors are printed only where main process prints them: to terminals (colorama
+    converts them at Windows) and to PyCharm.
+    """
+    _console['ready'] = True
+    _console['colors'] = sys.stdout.isatty() or 'PYCHARM_HOSTED' in os.environ
+    if os.name == 'nt' and sys.stdout.isatty():
+        init_colorama()
+
 
-DONE = colorama.Fore.GREEN + colorama.Style.BRIGHT
-OK = colorama.Fore.CYAN + colorama.Style.BRIGHT
-WARN = colorama.Fore.YELLOW + colorama.Style.BRIGHT
-FAIL = colorama.Fore.RED + colorama.Style.BRIGHT
-ENDC = colorama.Fore.RESET + colorama.Style.RESET_ALL
+def _paint(color, text):
+    if _console['colors']:
+        return color + text + ENDC
+    return text
 
 
 class Utils:
@@ -136,19 +162,16 @@ def is_settings_has_data(sln_configurations_map, settings, settings_key, sln_arc
     if sln_arch:
         mapped_archs = get_mapped_architectures(sln_configurations_map, sln_arch)
 
+    column = settings.get_column(settings_key)
     for sln_setting in sln_configurations_map:
         mapped_setting_key = sln_configurations_map[sln_setting]
-        if mapped_setting_key not in settings:
-            continue
-        mapped_setting = settings[mapped_setting_key]
         if sln_arch and (mapped_setting_key[1] not in mapped_archs):
             continue
         if conf and (mapped_setting_key[0] != conf):
             continue
 
-        if settings_key in mapped_setting:
-            if mapped_setting[settings_key]:
-                return True
+        if column.get(mapped_setting_key):
+            return True
     return False
 
 
@@ -228,6 +251,18 @@ def get_mount_point(path):
     return mount_point
 
 
+def get_peak_rss():
+    """ Returns peak resident set size of current process in bytes or None if unknown """
+    try:
+        import resource  # pylint: disable=import-outside-toplevel
+    except ImportError:  # Windows
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak_rss
+    return peak_rss * 1024
+
+
 def check_for_relative_in_path(context, path, remove_relative=True):
     """
     Return path by adding CMake variable or current path prefix, to remove relative
@@ -383,7 +418,13 @@ def get_actual_filename(context, name):
     :rtype: None | str
     """
 
-    res = insensitive_glob(name)
+    covered, actual_name = False, None
+    if context.fs_snapshot is not None:
+        covered, actual_name = context.fs_snapshot.lookup(name)
+    if covered:
+        res = [actual_name] if actual_name else []
+    else:
+        res = insensitive_glob(name)
     if not res:
         # File not found
         message(context, 'file or path "{}" not found.'.format(name), 'warn')
@@ -464,24 +505,42 @@ def message(context, text, status):  # pragma: no cover
     if context.current_node is not None and status:
         text = '{}({}): {}'.format(context.current_node.base, context.current_node.sourceline, text)
 
+    if context.message_sink is not None:
+        _send_message_to_sink(context, text, status)
+        return
+
+    init_console()
     if status == 'error':
-        print(message_begin + 'ERR  : ' + FAIL + text + ENDC)
+        print(message_begin + 'ERR  : ' + _paint(FAIL, text))
     elif 'warn' in status:
         if status == 'warn':
             status += '1'
         message_warning_level = int(status[-1])
         if message_warning_level <= context.warn_level:
-            print(message_begin + 'WARN L' + status[-1] + ' : ' + WARN + text + ENDC)
+            print(message_begin + 'WARN L' + status[-1] + ' : ' + _paint(WARN, text))
             context.warnings_count += 1
     elif status == 'ok':
-        print(message_begin + 'OK   : ' + OK + text + ENDC)
+        print(message_begin + 'OK   : ' + _paint(OK, text))
     elif status == 'done':
-        print(message_begin + DONE + text + ENDC)
+        print(message_begin + _paint(DONE, text))
     else:
         if context.verbose:
             print(message_begin + 'INFO : ' + text)
 
 
+def _send_message_to_sink(context, text, status):
+    """ Passes message to sink of context instead of console with the same filtering """
+    if 'warn' in status:
+        if status == 'warn':
+            status += '1'
+        if int(status[-1]) > context.warn_level:
+            return
+        context.warnings_count += 1
+    elif status not in ('error', 'ok', 'done') and not context.verbose:
+        return
+    context.message_sink.add_message(context, text, status)
+
+
 def escape_string(context, wrong_chars_regex, input_str):
     """ Removes wrong chars from input string """
     output_str = re.sub(wrong_chars_regex, '', input_str)
@@ -0,0 +1,346 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+    DependencyGraph
+    ===============
+     Graph of dependencies between projects of solution made of solution
+     dependencies and ProjectReference items of projects. Static libraries which
+     objects are linked into other static libraries and Fortran projects which
+     modules are used by other projects are found here too.
+"""
+
+import os
+from collections import OrderedDict
+
+from cmake_converter.cache import get_cached, PROJECT_REFERENCES, LIBRARY_LINKS
+from cmake_converter.dependencies import Dependencies
+from cmake_converter.utils import message, set_native_slash
+
+
+def _get_path_key(path):
+    return os.path.normcase(os.path.normpath(os.path.abspath(path)))
+
+
+def _read_project_references(project_path):
+    """ Reads paths of projects referenced by ProjectReference items of given project """
+    from lxml import etree  # pylint: disable=import-outside-toplevel
+    try:
+        tree = etree.parse(project_path)
+    except (OSError, IOError, etree.XMLSyntaxError):
+        return []
+    project_dir = os.path.dirname(project_path)
+    return [
+        os.path.join(project_dir, set_native_slash(include))
+        for include in tree.xpath('//*[local-name()="ProjectReference"]/@Include')
+    ]
+
+
+def _read_library_links(project_path):
+    """
+    Reads whether project is a static library and references which objects are linked
+    into it (LinkLibraryDependencies of ProjectReference items or of their definition)
+    """
+    from lxml import etree  # pylint: disable=import-outside-toplevel
+    links = {'static_library': False, 'linked_references': []}
+    try:
+        tree = etree.parse(project_path)
+    except (OSError, IOError, etree.XMLSyntaxError):
+        return links
+
+    links['static_library'] = any(
+        (node.text or '').strip() == 'StaticLibrary'
+        for node in tree.xpath('//*[local-name()="ConfigurationType"]')
+    )
+    link_by_default = any(
+        (node.text or '').strip() == 'true'
+        for node in tree.xpath(
+            '//*[local-name()="ItemDefinitionGroup"]/*[local-name()="ProjectReference"]'
+            '/*[local-name()="LinkLibraryDependencies"]'
+        )
+    )
+    project_dir = os.path.dirname(project_path)
+    for reference in tree.xpath('//*[local-name()="ItemGroup"]/*[local-name()="ProjectReference"]'):
+        values = [
+            (node.text or '').strip()
+            for node in reference.xpath('*[local-name()="LinkLibraryDependencies"]')
+        ]
+        if (values[-1] == 'true') if values else link_by_default:
+            links['linked_references'].append(
+                os.path.join(project_dir, set_native_slash(reference.get('Include')))
+            )
+    return links
+
+
+def _mentions_link_library_dependencies(project_path):
+    """ Cheap check that allows to skip parsing of most projects """
+    try:
+        with open(project_path, 'rb') as project_file:
+            return b'LinkLibraryDependencies' in project_file.read()
+    except OSError:
+        return False
+
+
+def find_object_libraries(context, sln_projects_data):
+    """
+    Finds static libraries which objects are linked into other static libraries of
+    solution with LinkLibraryDependencies. They get OBJECT library with their objects
+    besides of STATIC one. Consumer with LinkLibraryDependencies archives objects of
+    all object libraries linked into it directly or indirectly, others link STATIC ones.
+
+    :param context: context of solution
+    :type context: Context
+    :param sln_projects_data: data of projects from solution
+    :type sln_projects_data: dict
+    :return: normalized paths of object libraries and names of object libraries
+        which objects are archived mapped to normalized paths of projects
+    :rtype: tuple
+    """
+    paths = OrderedDict()
+    for sln_project_data in sln_projects_data.values():
+        project_path = os.path.join(context.solution_path, sln_project_data['path'])
+        if project_path.endswith('.vcxproj'):
+            paths[_get_path_key(project_path)] = project_path
+
+    def is_static_library(key):
+        return get_cached(context, LIBRARY_LINKS, paths[key], _read_library_links)[
+            'static_library'
+        ]
+
+    linked_objects = {}
+    for key, project_path in paths.items():
+        if not _mentions_link_library_dependencies(project_path) or not is_static_library(key):
+            continue
+        links = get_cached(context, LIBRARY_LINKS, project_path, _read_library_links)
+        linked_objects[key] = [
+            reference_key for reference_key in map(_get_path_key, links['linked_references'])
+            if reference_key in paths and is_static_library(reference_key)
+        ]
+    object_libraries = {key for keys in linked_objects.values() for key in keys}
+    if not object_libraries:
+        return set(), {}
+
+    objects_of_projects = {}
+    for key, direct_keys in linked_objects.items():
+        archived = []
+        stack = list(reversed(direct_keys))
+        while stack:
+            linked_key = stack.pop()
+            if linked_key == key or linked_key in archived:
+                continue
+            archived.append(linked_key)
+            stack.extend(reversed(linked_objects.get(linked_key, [])))
+        if archived:
+            objects_of_projects[key] = [
+                Dependencies.get_dependency_target_name(context, paths[linked_key])
+                for linked_key in archived
+            ]
+    message(
+        context,
+        'Static libraries with OBJECT libraries for LinkLibraryDependencies: {}'.format(
+            len(object_libraries)
+        ),
+        'done'
+    )
+    return object_libraries, objects_of_projects
+
+
+def find_fortran_module_dependencies(context, sln_projects_data):
+    """
+    Finds Fortran projects that every project of solution depends on directly or
+    indirectly. Modules of them must be found at their module directories.
+
+    :param context: context of solution
+    :type context: Context
+    :param sln_projects_data: data of projects from solution
+    :type sln_projects_data: dict
+    :return: names of Fortran dependencies mapped to normalized paths of projects
+    :rtype: dict
+    """
+    if not any(data['path'].endswith('.vfproj') for data in sln_projects_data.values()):
+        return {}
+
+    graph = DependencyGraph.from_solution(context, sln_projects_data)
+    module_dependencies = {}
+    for guid, path in graph.paths.items():
+        names = sorted(
+            graph.names[dependency] for dependency in graph.get_closure(graph.edges[guid])
+            if dependency != guid and graph.paths[dependency].endswith('.vfproj')
+        )
+        if names:
+            module_dependencies[_get_path_key(path)] = names
+    return module_dependencies
+
+
+class DependencyGraph:
+    """
+        Dependencies between projects of solution mapped by GUIDs of projects
+    """
+
+    def __init__(self):
+        self.names = {}     # guid -> name
+        self.edges = {}     # guid -> guids of dependencies
+        self.paths = {}     # guid -> path of project
+
+    @classmethod
+    def from_solution(cls, context, sln_projects_data):
+        """
+        Makes graph of solution. ProjectReference items of *.vcxproj files are read
+        without full conversion of projects. References outside of solution are ignored.
+
+        :param context: context of solution
+        :type context: Context
+        :param sln_projects_data: data of projects from solution
+        :type sln_projects_data: dict
+        :return: graph of solution
+        :rtype: DependencyGraph
+        """
+        graph = cls()
+        guids_of_names = {}
+        guids_of_paths = {}
+        for guid, sln_project_data in sln_projects_data.items():
+            graph.names[guid] = sln_project_data['name']
+            graph.edges[guid] = []
+            graph.paths[guid] = os.path.join(context.solution_path, sln_project_data['path'])
+            guids_of_names[sln_project_data['name']] = guid
+            guids_of_paths[_get_path_key(graph.paths[guid])] = guid
+
+        for guid, sln_project_data in sln_projects_data.items():
+            for dep_name in sln_project_data.get('sln_deps', []):
+                graph.add_edge(guid, guids_of_names[dep_name])
+
+            project_path = os.path.join(context.solution_path, sln_project_data['path'])
+            if not project_path.endswith('.vcxproj'):
+                continue    # other projects have solution dependencies only
+            references = get_cached(
+                context, PROJECT_REFERENCES, project_path, _read_project_references
+            )
+            for reference_path in references:
+                reference_guid = guids_of_paths.get(_get_path_key(reference_path))
+                if reference_guid is None:
+                    message(
+                        context,
+                        '{} references {} that is not a part of solution'.format(
+                            sln_project_data['name'], reference_path
+                        ),
+                        ''
+                    )
+                    continue
+                graph.add_edge(guid, reference_guid)
+        return graph
+
+    def add_edge(self, guid, dependency_guid):
+        """ Adds dependency of project with given GUID """
+        if dependency_guid not in self.edges[guid]:
+            self.edges[guid].append(dependency_guid)
+
+    def find_guid(self, name):
+        """ Returns GUID of project with given name or None if there is no such project """
+        for guid, project_name in self.names.items():
+            if project_name == name:
+                return guid
+        return None
+
+    def get_closure(self, guids):
+        """
+        Returns given projects with all their direct and indirect dependencies
+
+        :param guids: GUIDs of projects
+        :type guids: list
+        :return: GUIDs of projects of closure
+        :rtype: set
+        """
+        closure = set()
+        stack = list(guids)
+        while stack:
+            guid = stack.pop()
+            if guid in closure:
+                continue
+            closure.add(guid)
+            stack.extend(self.edges[guid])
+        return closure
+
+    def get_dependencies_of_paths(self):
+        """
+        Returns paths of all direct and indirect dependencies of every project
+
+        :return: sets of normalized paths of dependencies mapped to normalized paths of projects
+        :rtype: dict
+        """
+        dependencies = {}
+        for guid, path in self.paths.items():
+            dependencies[_get_path_key(path)] = {
+                _get_path_key(self.paths[dependency])
+                for dependency in self.get_closure(self.edges[guid])
+                if dependency != guid
+            }
+        return dependencies
+
+    def find_cycles(self):
+        """
+        Finds cycles of dependencies as strongly connected components of graph (Tarjan)
+
+        :return: lists of names of projects that depend on each other
+        :rtype: list
+        """
+        index_of = {}
+        low_link = {}
+        stack = []
+        on_stack = set()
+        cycles = []
+
+        for root, root_edges in self.edges.items():
+            if root in index_of:
+                continue
+            # iterative depth-first search: (guid, iterator over dependencies)
+            work = [(root, iter(root_edges))]
+            index_of[root] = low_link[root] = len(index_of)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                guid, dependencies = work[-1]
+                dependency = next(dependencies, None)
+                if dependency is not None:
+                    if dependency not in index_of:
+                        index_of[dependency] = low_link[dependency] = len(index_of)
+                        stack.append(dependency)
+                        on_stack.add(dependency)
+                        work.append((dependency, iter(self.edges[dependency])))
+                    elif dependency in on_stack:
+                        low_link[guid] = min(low_link[guid], index_of[dependency])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low_link[parent] = min(low_link[parent], low_link[guid])
+                if low_link[guid] != index_of[guid]:
+                    continue
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == guid:
+                        break
+                if len(component) > 1 or guid in self.edges[guid]:
+                    cycles.append(sorted(self.names[member] for member in component))
+        return cycles
@@ -26,14 +26,32 @@ Module of Visual Studio solution related logic for converting.
 
 import re
 import os
-import sys
-import shutil
+import time
 from collections import OrderedDict
 
-from cmake_converter.data_converter import DataConverter
+from cmake_converter.data_converter import DataConverter, TargetTask
+from cmake_converter.data_files import copy_file_if_changed
+from cmake_converter.events import emit_event
+from cmake_converter.fs_snapshot import FsSnapshot
+from cmake_converter.visual_studio.dependency_graph import DependencyGraph, \
+    find_object_libraries, find_fortran_module_dependencies
+from cmake_converter.shared_pch import share_precompiled_headers
+from cmake_converter.shards import select_shard, save_shard_results, load_shard_results
 from cmake_converter.utils import message, set_native_slash, make_cmake_configuration
 
 
+class SolutionError(ValueError):
+    """
+    Solution can not be converted: its format is not supported or selected targets
+    are absent. Error is already reported with message()
+    """
+
+
+def get_path_key(path):
+    """ Returns normalized key of path for comparisons """
+    return os.path.normcase(os.path.normpath(os.path.abspath(path)))
+
+
 class VSSolutionConverter(DataConverter):
     """
     Implementation of Converter for Visual Studio solution
@@ -107,11 +125,21 @@ class VSSolutionConverter(DataConverter):
             r'Microsoft Visual Studio Solution File, Format Version (.*)'
         )
         version_match = version_pattern.findall(sln_text)
-        if not version_match or float(version_match[0]) < 9:
+        if not version_match:
+            message(context, 'Version of solution is not found. Check solution file, please',
+                    'error')
+            raise SolutionError('version of solution is not found')
+        try:
+            version = float(version_match[0])
+        except ValueError:
+            version = None
+        if version is None or version < 9:
             message(context, 'Solution files with versions below 9.00 are not supported.'
                              ' Version {} found. Upgrade you solution and try again, please'
                     .format(version_match[0]), 'error')
-            sys.exit(1)
+            raise SolutionError('version {} of solution is not supported'.format(
+                version_match[0]
+            ))
 
         message(context, 'Version of solution is {}'.format(version_match[0]), '')
 
@@ -255,55 +283,102 @@ class VSSolutionConverter(DataConverter):
             projects_data[project_guid]['sln_project_folder'] = sln_project_folder
 
     @staticmethod
-    def set_dependencies_for_project(context, project_data):
-        """ Copy dependencies on other solution projects into project context """
-        if 'sln_deps' not in project_data:
-            return
-
-        context.sln_deps = project_data['sln_deps']
-
-    @staticmethod
-    def clean_cmake_lists_file(context, subdirectory, cmake_lists_set):
-        """ Clean previous CMake script before converting """
-        cmake_path_to_clean = \
-            os.path.join(
-                context.set_cmake_lists_path(subdirectory),
-                'CMakeLists.txt'
-            )
-        if context.dry:
-            return
-
-        if cmake_path_to_clean in cmake_lists_set:
-            return
-        cmake_lists_set.add(cmake_path_to_clean)
-
-        if os.path.exists(cmake_path_to_clean):
-            os.remove(cmake_path_to_clean)
-            message(context, 'removed {}'.format(cmake_path_to_clean), '')
-        else:
-            message(context, 'not found {}'.format(cmake_path_to_clean), 'warn')
-
-    def clean_cmake_lists_of_solution(self, context, sln_projects_data):
-        """ Clean previous set of CMake scripts before converting """
-        if not os.path.exists(os.path.join(context.solution_path, 'CMake')):
-            return  # first run
-
-        message(context, 'Cleaning CMake Scripts', '')
-        cmake_lists_set = set()
+    def get_subdirectories_of_solution(context, sln_projects_data):
+        """
+        Returns directories of projects of solution that pass filters and
+        solution directory itself
+        """
+        subdirectories = []
         for guid in sln_projects_data:
             sln_project_path = sln_projects_data[guid]['path']
+            if not VSSolutionConverter.is_project_selected(context, guid, sln_project_path):
+                continue
             sln_project_abs = os.path.join(context.solution_path, sln_project_path)
-            subdirectory = os.path.dirname(sln_project_abs)
-            self.clean_cmake_lists_file(context, subdirectory, cmake_lists_set)
+            subdirectories.append(os.path.dirname(sln_project_abs))
+        subdirectories.append(context.solution_path)
+        return subdirectories
 
-        self.clean_cmake_lists_file(context, context.solution_path, cmake_lists_set)
-        print('\n')
+    @staticmethod
+    def remove_stale_cmake_lists(context, subdirectories, written_files):
+        """
+        Removes CMakeLists.txt of previous conversion that were not written this time
 
-    def convert_solution(self, project_context, sln_file_path):
+        :param context: context of solution
+        :type context: Context
+        :param subdirectories: directories to check
+        :type subdirectories: list
+        :param written_files: paths of written files
+        :type written_files: dict
+        :return: list of removed files
+        :rtype: list
         """
-        Routine converts Visual studio solution into set of CMakeLists.txt scripts
+        if context.dry:
+            return []
+        if not os.path.exists(os.path.join(context.solution_path, 'CMake')):
+            return []  # first run
+
+        written_keys = {os.path.normcase(os.path.normpath(f)) for f in written_files}
+        removed_files = []
+        for subdirectory in subdirectories:
+            cmake_path_to_clean = os.path.join(subdirectory, 'CMakeLists.txt')
+            key = os.path.normcase(os.path.normpath(cmake_path_to_clean))
+            if key in written_keys:
+                continue
+            written_keys.add(key)
+            if os.path.exists(cmake_path_to_clean):
+                os.remove(cmake_path_to_clean)
+                removed_files.append(cmake_path_to_clean)
+                message(context, 'removed {}'.format(cmake_path_to_clean), '')
+        return removed_files
+
+    @staticmethod
+    def get_written_cmake_lists(results):
+        """ Collects CMakeLists.txt written by workers with flags of change """
+        written_files = {}
+        for batch_results in results:
+            for target_result in batch_results:
+                if target_result['cmake_lists']:
+                    written_files[target_result['cmake_lists']] = \
+                        target_result['cmake_lists_changed']
+        return written_files
+
+    @staticmethod
+    def report_written_files(context, written_files, removed_files):
+        """ Prints summary of changed, unchanged and removed files """
+        changed_files = sorted(f for f in written_files if written_files[f])
+        unchanged_files = sorted(f for f in written_files if not written_files[f])
+        message(
+            context,
+            'Files changed: {}, unchanged: {}, removed: {}'.format(
+                len(changed_files), len(unchanged_files), len(removed_files)
+            ),
+            'done'
+        )
+        emit_event(
+            context,
+            'files_summary',
+            changed=changed_files,
+            unchanged=unchanged_files,
+            removed=sorted(removed_files)
+        )
+        for file in changed_files:
+            message(context, '    changed   : {}'.format(file), 'done')
+        for file in unchanged_files:
+            message(context, '    unchanged : {}'.format(file), '')
+        for file in sorted(removed_files):
+            message(context, '    removed   : {}'.format(file), 'done')
+
+    def read_solution(self, project_context, sln_file_path):
         """
+        Reads and parses given solution file and sets solution paths into context
 
+        :param project_context: context of solution
+        :type project_context: Context
+        :param sln_file_path: path to *.sln file
+        :type sln_file_path: str
+        :return: data from solution
+        :rtype: dict
+        """
         message(
             project_context, '------- Started parsing solution {} -------'.format(sln_file_path), ''
         )
@@ -316,18 +391,443 @@ class VSSolutionConverter(DataConverter):
         project_context.solution_path = os.path.dirname(sln_file_path)
         project_context.project_name = os.path.splitext(os.path.basename(sln_file_path))[0]
         project_context.vcxproj_path = sln_file_path
-        subdirectories_set = set()
-        subdirectories_to_target_name = {}
-        sln_projects_data = solution_data['sln_projects_data']
+        project_context.cmake = project_context.solution_path
+        if project_context.snapshot_fs:
+            self.snapshot_solution_tree(project_context, solution_data['sln_projects_data'])
+        (project_context.object_libraries,
+         project_context.archived_object_libraries_of_projects) = find_object_libraries(
+            project_context, solution_data['sln_projects_data'])
+        project_context.fortran_module_dependencies_of_projects = \
+            find_fortran_module_dependencies(project_context, solution_data['sln_projects_data'])
+        if project_context.target_names:
+            project_context.selected_projects = self.select_projects_of_targets(
+                project_context, solution_data['sln_projects_data']
+            )
+        return solution_data
+
+    @staticmethod
+    def snapshot_solution_tree(project_context, sln_projects_data):
+        """
+        Reads directories of solution and of its projects into snapshot of filesystem
+        that is shared with workers
+
+        :param project_context: context of solution
+        :type project_context: Context
+        :param sln_projects_data: data of projects from solution
+        :type sln_projects_data: dict
+        """
+        start_time = time.time()
+        roots = [project_context.solution_path] + [
+            os.path.dirname(os.path.join(project_context.solution_path, data['path']))
+            for data in sln_projects_data.values()
+        ]
+        project_context.fs_snapshot = FsSnapshot.build(roots, project_context.jobs)
+        message(
+            project_context,
+            'Filesystem snapshot: {} directories read in {:.3f} s'.format(
+                len(project_context.fs_snapshot), time.time() - start_time
+            ),
+            'done'
+        )
 
-        self.clean_cmake_lists_of_solution(project_context, sln_projects_data)
+    @staticmethod
+    def select_projects_of_targets(project_context, sln_projects_data):
+        """
+        Selects projects of targets given by names and, if asked, all their dependencies.
+        Cycles of dependencies are reported.
+
+        :param project_context: context of solution
+        :type project_context: Context
+        :param sln_projects_data: data of projects from solution
+        :type sln_projects_data: dict
+        :return: GUIDs of selected projects
+        :rtype: set
+        """
+        graph = DependencyGraph.from_solution(project_context, sln_projects_data)
+        for cycle in graph.find_cycles():
+            message(
+                project_context,
+                'Cycle of dependencies between projects: {}'.format(', '.join(cycle)),
+                'warn'
+            )
 
-        input_data_for_converter = self.__get_input_data_for_converter(
+        target_guids = []
+        for target_name in project_context.target_names:
+            guid = graph.find_guid(target_name)
+            if guid is None:
+                message(
+                    project_context,
+                    'Target {} is not found at solution'.format(target_name),
+                    'error'
+                )
+                raise SolutionError('target {} is not found at solution'.format(target_name))
+            target_guids.append(guid)
+
+        selected_projects = set(target_guids)
+        if project_context.with_deps:
+            selected_projects = graph.get_closure(target_guids)
+        message(
+            project_context,
+            'Selected projects: {}'.format(
+                ', '.join(sorted(graph.names[guid] for guid in selected_projects))
+            ),
+            'done'
+        )
+        return selected_projects
+
+    @staticmethod
+    def is_project_selected(project_context, guid, sln_project_path):
+        """ Checks whether project passes filter of paths and selection of targets """
+        if project_context.selected_projects is not None and \
+                guid not in project_context.selected_projects:
+            return False
+        return re.match(project_context.projects_regexp, sln_project_path) is not None
+
+    def convert_solution(self, project_context, sln_file_path):
+        """
+        Routine converts Visual studio solution into set of CMakeLists.txt scripts
+        """
+
+        solution_data = self.read_solution(project_context, sln_file_path)
+        sln_projects_data = solution_data['sln_projects_data']
+
+        input_data_for_converter = self.get_input_data_for_converter(
             project_context,
             sln_projects_data
         )
 
         results = self.do_conversion(project_context, input_data_for_converter)
+        self.report_conversion_results(project_context, results)
+        if project_context.share_pch:
+            self.share_pch_of_solutions(
+                project_context, [(project_context, solution_data)], results
+            )
+            self.write_cmake_lists_of_results(
+                project_context, [r for batch_results in results for r in batch_results]
+            )
+
+        self.__write_solution_files(project_context, solution_data, results)
+
+    def convert_solutions(self, project_context, sln_file_paths):
+        """
+        Converts several solutions at once. Projects shared by solutions are converted once
+        with one pool of workers, entry point CMakeLists.txt is written for every solution.
+
+        :param project_context: context with options of converter
+        :type project_context: Context
+        :param sln_file_paths: paths to *.sln files
+        :type sln_file_paths: list
+        """
+        solutions = OrderedDict()
+        for sln_file_path in sln_file_paths:
+            solution_context = project_context.clone()
+            solution_data = self.read_solution(solution_context, sln_file_path)
+            solutions[sln_file_path] = (
+                solution_context,
+                solution_data,
+                self.get_input_data_for_converter(
+                    solution_context,
+                    solution_data['sln_projects_data']
+                )
+            )
+
+        inputs_of_solutions, directories_of_solutions = self.__share_projects_of_solutions(
+            project_context, solutions
+        )
+        message(
+            project_context,
+            'Solutions: {}, projects to convert: {} of {}'.format(
+                len(solutions),
+                sum(len(tasks) for input_data in inputs_of_solutions.values()
+                    for tasks in input_data.values()),
+                sum(len(tasks) for _, _, input_data in solutions.values()
+                    for tasks in input_data.values())
+            ),
+            'done'
+        )
+
+        results_of_solutions = self.do_solutions_conversion(
+            project_context,
+            inputs_of_solutions,
+            OrderedDict(
+                (sln_file_path, solutions[sln_file_path][0]) for sln_file_path in solutions
+            )
+        )
+        all_results = [
+            batch_results for results in results_of_solutions.values()
+            for batch_results in results
+        ]
+        self.report_conversion_results(project_context, all_results)
+        if project_context.share_pch:
+            self.share_pch_of_solutions(
+                project_context,
+                [(solution_context, solution_data)
+                 for solution_context, solution_data, _ in solutions.values()],
+                all_results
+            )
+            for owner_key, results in results_of_solutions.items():
+                self.write_cmake_lists_of_results(
+                    solutions[owner_key][0],
+                    [r for batch_results in results for r in batch_results]
+                )
+
+        self.__write_files_of_solutions(solutions, results_of_solutions, directories_of_solutions)
+
+    def __write_files_of_solutions(self, solutions, results_of_solutions,
+                                   directories_of_solutions):
+        """ Writes entry point of every solution with results of its directories """
+        results_of_directories = {}
+        for owner_key, results in results_of_solutions.items():
+            for batch_results in results:
+                for target_result in batch_results:
+                    results_of_directories.setdefault(
+                        (owner_key, get_path_key(target_result['cmake'])), []
+                    ).append(target_result)
+
+        for sln_file_path, (solution_context, solution_data, _) in solutions.items():
+            results = [
+                results_of_directories.get(directory, [])
+                for directory in directories_of_solutions[sln_file_path]
+            ]
+            self.__write_solution_files(solution_context, solution_data, results)
+
+    @staticmethod
+    def share_pch_of_solutions(project_context, solutions, results):
+        """
+        Makes targets with the same PCH and compile settings reuse PCH of one of them.
+        Dependencies of projects are taken from all given solutions.
+
+        :param project_context: context with options of converter
+        :type project_context: Context
+        :param solutions: pairs of context and data of solution
+        :type solutions: list
+        :param results: lists of results of projects conversion
+        :type results: list
+        """
+        dependencies = {}
+        for solution_context, solution_data in solutions:
+            graph = DependencyGraph.from_solution(
+                solution_context, solution_data['sln_projects_data']
+            )
+            for path, paths in graph.get_dependencies_of_paths().items():
+                dependencies.setdefault(path, set()).update(paths)
+        share_precompiled_headers(project_context, results, dependencies)
+
+    @staticmethod
+    def __share_projects_of_solutions(project_context, solutions):
+        """
+        Deduplicates projects of solutions by absolute path. Every directory is converted
+        once by solution that refers it first, projects of other solutions are added there.
+        Projects of solution directories are rendered into entry point of their solution,
+        so they are not shared.
+
+        :return: input data for converter mapped to keys of solutions and
+                 (owner key, directory key) pairs of directories of every solution
+        :rtype: tuple
+        """
+        solution_directories = {
+            get_path_key(solution_context.solution_path)
+            for solution_context, _, _ in solutions.values()
+        }
+        inputs_of_solutions = OrderedDict((key, OrderedDict()) for key in solutions)
+        directories_of_solutions = OrderedDict((key, []) for key in solutions)
+        owners_of_directories = {}
+        projects = {}
+        for key, (_, _, input_data_for_converter) in solutions.items():
+            for subdirectory, tasks in input_data_for_converter.items():
+                directory_key = get_path_key(subdirectory)
+                if directory_key in solution_directories:
+                    inputs_of_solutions[key][subdirectory] = tasks
+                    directories_of_solutions[key].append((key, directory_key))
+                    continue
+
+                if directory_key not in owners_of_directories:
+                    owners_of_directories[directory_key] = (key, subdirectory)
+                    inputs_of_solutions[key][subdirectory] = []
+                owner_key, owner_subdirectory = owners_of_directories[directory_key]
+                directories_of_solutions[key].append((owner_key, directory_key))
+                VSSolutionConverter.__add_new_tasks(
+                    project_context,
+                    projects,
+                    key,
+                    [task._replace(subdirectory=owner_subdirectory) for task in tasks],
+                    inputs_of_solutions[owner_key][owner_subdirectory]
+                )
+        return inputs_of_solutions, directories_of_solutions
+
+    @staticmethod
+    def __add_new_tasks(project_context, projects, key, tasks, owner_tasks):
+        """
+        Adds tasks of solution with given key to tasks of owner of their directory
+        unless projects of them were added by other solutions before
+        """
+        for task in tasks:
+            project_key = get_path_key(task.target_abs)
+            if project_key not in projects:
+                projects[project_key] = (key, task)
+                owner_tasks.append(task)
+                continue
+            first_key, first_task = projects[project_key]
+            if (first_task.sln_configurations_map, first_task.sln_deps,
+                    first_task.project_folder) != \
+                    (task.sln_configurations_map, task.sln_deps, task.project_folder):
+                message(
+                    project_context,
+                    '{} has different settings at {} and {}, settings of the first '
+                    'solution are used'.format(task.target_abs, first_key, key),
+                    'warn'
+                )
+
+    def convert_solution_shard(self, project_context, sln_file_path, shard, shard_results_path):
+        """
+        Converts projects of one shard of solution and saves results of them for merging
+
+        :param project_context: context of solution
+        :type project_context: Context
+        :param sln_file_path: path to *.sln file
+        :type sln_file_path: str
+        :param shard: index [1..n] and count of shards
+        :type shard: tuple
+        :param shard_results_path: path of file for results of shard
+        :type shard_results_path: str
+        """
+        shard_index, shards_count = shard
+        solution_data = self.read_solution(project_context, sln_file_path)
+
+        input_data_for_converter = select_shard(
+            project_context.solution_path,
+            self.get_input_data_for_converter(
+                project_context,
+                solution_data['sln_projects_data']
+            ),
+            shard_index,
+            shards_count
+        )
+        message(
+            project_context,
+            'Shard {}/{}: {} directories to convert'.format(
+                shard_index, shards_count, len(input_data_for_converter)
+            ),
+            'done'
+        )
+
+        results = self.do_conversion(project_context, input_data_for_converter)
+        self.report_conversion_results(project_context, results)
+        if project_context.dry:
+            return
+
+        save_shard_results(
+            shard_results_path,
+            project_context.solution_path,
+            shard_index,
+            shards_count,
+            results
+        )
+        written_files = self.get_written_cmake_lists(results)
+        self.report_written_files(project_context, written_files, [])
+        message(project_context, 'Results of shard saved to {}'.format(shard_results_path), 'done')
+
+    def merge_solution_shards(self, project_context, sln_file_path, shard_results_paths):
+        """
+        Writes entry point CMakeLists.txt of solution from results of all shards
+
+        :param project_context: context of solution
+        :type project_context: Context
+        :param sln_file_path: path to *.sln file
+        :type sln_file_path: str
+        :param shard_results_paths: paths of files with results of shards
+        :type shard_results_paths: list
+        :return: True if all shards were merged
+        :rtype: bool
+        """
+        solution_data = self.read_solution(project_context, sln_file_path)
+
+        results = []
+        merged_shards = set()
+        shards_counts = set()
+        for shard_results_path in shard_results_paths:
+            shard_index, shards_count, shard_results = load_shard_results(
+                shard_results_path, project_context.solution_path
+            )
+            message(
+                project_context,
+                'Shard {}/{} loaded from {}'.format(shard_index, shards_count, shard_results_path),
+                ''
+            )
+            merged_shards.add(shard_index)
+            shards_counts.add(shards_count)
+            results.append(shard_results)
+
+        if len(shards_counts) != 1:
+            message(project_context, 'Results of different sharding can not be merged', 'error')
+            return False
+        absent_shards = set(range(1, shards_counts.pop() + 1)) - merged_shards
+        if absent_shards:
+            message(
+                project_context,
+                'Results of shards {} are absent'.format(sorted(absent_shards)),
+                'error'
+            )
+            return False
+
+        self.__write_solution_files(project_context, solution_data, results)
+        return True
+
+    def __write_solution_files(self, project_context, solution_data, results):
+        """ Writes solution files, removes stale ones and reports about them """
+        written_files = self.get_written_cmake_lists(results)
+        written_files.update(
+            self.write_solution_cmake_file(project_context, solution_data, results)
+        )
+        removed_files = self.remove_stale_cmake_lists(
+            project_context,
+            self.get_subdirectories_of_solution(
+                project_context,
+                solution_data['sln_projects_data']
+            ),
+            written_files
+        )
+        if not project_context.dry:
+            written_files.update(self.copy_cmake_utils(project_context.solution_path))
+            self.report_written_files(project_context, written_files, removed_files)
+
+    def write_solution_cmake_file(self, project_context, solution_data, results):
+        """
+        Writes entry point CMakeLists.txt of solution using results of projects conversion
+
+        :param project_context: context of solution
+        :type project_context: Context
+        :param solution_data: data from solution
+        :type solution_data: dict
+        :param results: lists of results of projects conversion
+        :type results: list
+        :return: path of written CMakeLists.txt mapped to flag of change
+        :rtype: dict
+        """
+        changed = project_context.writer.write_project_cmake_file(
+            project_context,
+            *self.__get_solution_cmake_file_data(project_context, solution_data, results)
+        )
+        if changed is None:
+            return {}
+        return {os.path.join(project_context.solution_path, 'CMakeLists.txt'): changed}
+
+    def render_solution_cmake_file(self, project_context, solution_data, results):
+        """
+        Renders entry point CMakeLists.txt of solution using results of projects conversion
+
+        :return: text of CMakeLists.txt of solution
+        :rtype: str
+        """
+        return project_context.writer.render_project_cmake_file(
+            project_context,
+            *self.__get_solution_cmake_file_data(project_context, solution_data, results)
+        )
+
+    def __get_solution_cmake_file_data(self, project_context, solution_data, results):
+        """ Collects data for entry point CMakeLists.txt from results of projects conversion """
+        subdirectories_set = set()
+        subdirectories_to_target_name = {}
 
         self.__get_info_from_results(
             project_context,
@@ -338,43 +838,56 @@ class VSSolutionConverter(DataConverter):
 
         configuration_types_list = self.__get_global_configuration_types(solution_data)
 
-        project_context.writer.write_project_cmake_file(
-            project_context,
+        solution_projects_texts = []
+        for batch_results in results:
+            for target_result in batch_results:
+                if target_result['cmake'] == project_context.solution_path:
+                    solution_projects_texts.append(target_result['cmake_lists_text'])
+
+        return (
             configuration_types_list,
             subdirectories_set,
-            subdirectories_to_target_name
+            subdirectories_to_target_name,
+            ('\n' * 26).join(solution_projects_texts)
         )
 
-        self.copy_cmake_utils(project_context.solution_path)
+    @staticmethod
+    def get_input_data_for_converter(project_context, sln_projects_data):
+        """
+        Makes tasks for converter from projects of solution grouped by directories
 
-    def __get_input_data_for_converter(self, project_context, sln_projects_data):
+        :param project_context: context of solution
+        :type project_context: Context
+        :param sln_projects_data: data of projects from solution
+        :type sln_projects_data: dict
+        :return: lists of tasks mapped to directories
+        :rtype: dict
+        """
         input_data_for_converter = {}
         target_number = 0
-        projects_filter_pattern = re.compile(project_context.projects_regexp)
         for guid in sln_projects_data:
             target_number += 1
-            target_context = project_context.clone()
-            target_context.target_number = target_number
-            sln_project_path = sln_projects_data[guid]['path']
+            sln_project_data = sln_projects_data[guid]
+            sln_project_path = sln_project_data['path']
 
-            m = projects_filter_pattern.match(sln_project_path)
-            if m is None:
+            if not VSSolutionConverter.is_project_selected(project_context, guid, sln_project_path):
                 continue
 
             sln_project_abs = os.path.join(project_context.solution_path, sln_project_path)
             subdirectory = os.path.dirname(sln_project_abs)
-            self.set_dependencies_for_project(target_context, sln_projects_data[guid])
-            target_context.sln_configurations_map = \
-                sln_projects_data[guid]['sln_configs_2_project_configs']
-            target_context.project_folder = sln_projects_data[guid]['sln_project_folder']
             if subdirectory not in input_data_for_converter:
                 input_data_for_converter[subdirectory] = []
             input_data_for_converter[subdirectory].append(
-                {
-                    'target_context': target_context,
-                    'target_abs': sln_project_abs,
-                    'subdirectory': subdirectory
-                }
+                TargetTask(
+                    target_number=target_number,
+                    target_abs=sln_project_abs,
+                    subdirectory=subdirectory,
+                    sln_configurations_map=tuple(
+                        sln_project_data['sln_configs_2_project_configs'].items()
+                    ),
+                    sln_deps=tuple(sln_project_data.get('sln_deps', [])),
+                    project_folder=sln_project_data['sln_project_folder'],
+                )
             )
 
         return input_data_for_converter
@@ -418,14 +931,13 @@ class VSSolutionConverter(DataConverter):
         return configuration_types_list
 
     def copy_cmake_utils(self, cmake_lists_path):
-        super().copy_cmake_utils(cmake_lists_path)
+        copied_files = super().copy_cmake_utils(cmake_lists_path)
 
         utils_path = os.path.join(cmake_lists_path, 'CMake')
-        if not os.path.exists(utils_path):
-            os.makedirs(utils_path)
         src_dir = os.path.dirname(os.path.abspath(__file__))
-        shutil.copyfile(os.path.join(src_dir, 'Default.cmake'), utils_path + '/Default.cmake')
-        shutil.copyfile(os.path.join(src_dir, 'DefaultCXX.cmake'),
-                        utils_path + '/DefaultCXX.cmake')
-        shutil.copyfile(os.path.join(src_dir, 'DefaultFortran.cmake'),
-                        utils_path + '/DefaultFortran.cmake')
+        for util_file in ['Default.cmake', 'DefaultCXX.cmake', 'DefaultFortran.cmake']:
+            dst_path = utils_path + '/' + util_file
+            copied_files[dst_path] = copy_file_if_changed(
+                os.path.join(src_dir, util_file), dst_path
+            )
+        return copied_files
@@ -27,6 +27,7 @@ Module that handles dependencies information for C/C++ projects.
 import os
 import re
 
+from cmake_converter.cache import get_cached, PACKAGE_METADATA
 from cmake_converter.dependencies import Dependencies
 from cmake_converter.data_files import get_xml_data, get_propertygroup
 from cmake_converter.utils import normalize_path, message, prepare_build_event_cmd_line_for_cmake, \
@@ -94,17 +95,17 @@ class VCXDependencies(Dependencies):
 
     @staticmethod
     def set_link_library_dependencies(context, node):
-        """ Handler for link library dependencies. No support of CMake. Just warning. """
+        """
+        Handler for link library dependencies. Referenced static libraries get OBJECT
+        libraries by solution converter, so their objects are archived into this one.
+        """
         if None in context.current_setting:
             configuration_type = context.settings[context.current_setting]['target_type']
             if node.text == 'true' and configuration_type == 'StaticLibrary':
                 message(
                     context,
-                    'LinkLibraryDependencies is true that is not supported with cmake. '
-                    'There is a workaround with cmake object libraries but it is hard to '
-                    'implement it in converter. '
-                    'You should switch LinkLibraryDependencies to false, otherwise you '
-                    'might have problems with linking.', 'warn1'
+                    'LinkLibraryDependencies is true. Objects of referenced static libraries '
+                    'are archived in from CMake object libraries.', ''
                 )
 
     @staticmethod
@@ -211,7 +212,14 @@ class VCXDependencies(Dependencies):
                 )
                 continue
 
-            ext_properties = self.__parse_targets_file_of_nuget_package(context, targets_file_path)
+            ext_properties = []
+            if targets_file_path:
+                ext_properties = get_cached(
+                    context,
+                    PACKAGE_METADATA,
+                    targets_file_path,
+                    lambda path: self.__parse_targets_file_of_nuget_package(context, path)
+                )
             context.packages.append([package_id, package_version, ext_properties])
 
             for ext_property in ext_properties:
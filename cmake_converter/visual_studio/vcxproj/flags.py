@@ -29,6 +29,8 @@ import os
 from collections import OrderedDict
 
 from cmake_converter.flags import Flags, defines, cl_flags, default_value, ln_flags
+from cmake_converter.compiler_cache import make_cache_friendly_option, \
+    EMBEDDED_DEBUG_INFORMATION_FORMAT
 from cmake_converter.utils import take_name_from_list_case_ignore
 from cmake_converter.utils import set_unix_slash, message, replace_vs_vars_with_cmake_vars
 
@@ -595,6 +597,8 @@ class CPPFlags(Flags):
         ready_add_opts = []
         for opt in add_opts:
             if opt != '%(AdditionalOptions)':
+                if context.compiler_cache:
+                    opt = make_cache_friendly_option(opt)
                 ready_add_opts.append(opt)
         self.flags[context.current_setting][flag_name][cl_flags] = ready_add_opts
         message(context, 'Compile Additional Options : {}'.format(ready_add_opts), '')
@@ -869,11 +873,21 @@ class CPPFlags(Flags):
         """
         Set DebugInformationFormat flag: /Zi
 
+        With compiler cache debug information is embedded into object files: /Z7
         """
 
         if context.file_contexts is None and node.text == '':  # if file context ignore default
             return {}
 
+        if context.compiler_cache:
+            if node.text == 'EditAndContinue':
+                message(context, 'Edit and Continue is not available with compiler cache', 'warn4')
+            return {
+                'ProgramDatabase': {cl_flags: EMBEDDED_DEBUG_INFORMATION_FORMAT},
+                'EditAndContinue': {cl_flags: EMBEDDED_DEBUG_INFORMATION_FORMAT},
+                default_value: {cl_flags: EMBEDDED_DEBUG_INFORMATION_FORMAT}
+            }
+
         del context, flag_name, node
         flag_values = {
             'ProgramDatabase': {cl_flags: '/Zi'},
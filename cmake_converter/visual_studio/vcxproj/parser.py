@@ -38,6 +38,10 @@ class VCXParser(Parser):
         Parser.__init__(self)
         self.filters = None
 
+    def release_parse_state(self):
+        Parser.release_parse_state(self)
+        self.filters = None
+
     def get_node_handlers_dict(self, context):
         node_handlers = {}
 
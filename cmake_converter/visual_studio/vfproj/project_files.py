@@ -27,7 +27,8 @@
 import re
 import os
 
-from cmake_converter.project_files import ProjectFiles
+from cmake_converter.project_files import ProjectFiles, get_directory_listing, \
+    is_existing_path
 from cmake_converter.utils import message
 
 
@@ -65,10 +66,13 @@ class VFProjectFiles(ProjectFiles):
 
             # add current file path to search list helper
             current_file_path = os.path.normpath(os.path.dirname(file_abs_path))
-            if os.path.exists(current_file_path):
-                file_lists_for_include_paths[current_file_path] = set(os.listdir(current_file_path))
+            if is_existing_path(context, current_file_path):
+                file_lists_for_include_paths[current_file_path] = set(
+                    get_directory_listing(context, current_file_path)
+                )
 
             if not self.search_file_in_paths(
+                    context,
                     file_lists_for_include_paths,
                     include_file_path,
                     include_file_name):
@@ -76,10 +80,12 @@ class VFProjectFiles(ProjectFiles):
                         .format(include_name_in_file, file_path_name), 'error')
 
     @staticmethod
-    def search_file_in_paths(file_lists_for_include_paths, include_file_path, include_file_name):
+    def search_file_in_paths(context, file_lists_for_include_paths, include_file_path,
+                             include_file_name):
         """
         Search of file at filesystem(cached) case sensitive
 
+        :param context:
         :param file_lists_for_include_paths:
         :param include_file_path:
         :param include_file_name:
@@ -93,8 +99,8 @@ class VFProjectFiles(ProjectFiles):
             if joined_include_path in file_lists_for_include_paths:
                 files = file_lists_for_include_paths[joined_include_path]
             else:
-                if os.path.exists(joined_include_path):
-                    files = set(os.listdir(joined_include_path))
+                if is_existing_path(context, joined_include_path):
+                    files = set(get_directory_listing(context, joined_include_path))
                     file_lists_for_includes_with_paths[joined_include_path] = files
 
             if include_file_name in files:
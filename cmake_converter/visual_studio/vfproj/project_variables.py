@@ -59,8 +59,8 @@ class VFProjectVariables(ProjectVariables):
 
         message(
             context,
-            'Fortran Module Directory will be ignored due lack of regex support at CMake\n'
-            'See walk-around at CMake/DefaultFortran.cmake', 'warn3'
+            'Fortran Module Directory will be ignored. Every target has its own module '
+            'directory at build tree to allow parallel builds', 'warn3'
         )
 
     def set_import_library(self, context, flag_name, import_library, node):
@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Module of watch mode that keeps CMakeLists.txt of solution in sync with changed projects.
+"""
+
+import os
+import time
+
+from cmake_converter.visual_studio.solution import VSSolutionConverter
+from cmake_converter.utils import message
+
+
+def get_file_key(path):
+    """ Returns normalized key of file path for comparisons """
+    return os.path.normcase(os.path.normpath(os.path.abspath(path)))
+
+
+class VSSolutionWatcher:
+    """
+    Watches files of solution and reconverts only affected projects on changes
+    """
+
+    def __init__(self, interval=1.0, debounce=0.5):
+        self.interval = interval
+        self.debounce = debounce
+        self.converter = VSSolutionConverter()
+        self.sln_file_path = ''
+        self.options_context = None
+        self.parsed_context = None
+        self.solution_data = None
+        self.input_data_for_converter = {}
+        self.results_of_directories = {}
+        self.directories_of_files = {}
+        self.mtimes = {}
+
+    def watch(self, project_context, sln_file_path):
+        """
+        Converts solution and then reconverts affected projects on every change until interrupted
+
+        :param project_context: context with options of converter
+        :type project_context: Context
+        :param sln_file_path: path to *.sln file
+        :type sln_file_path: str
+        """
+        self.start(project_context, sln_file_path)
+
+        message(
+            project_context,
+            'Watching {} files of solution. Press Ctrl+C to stop.'.format(len(self.mtimes)),
+            'done'
+        )
+        try:
+            while True:
+                self.process_changes(self.wait_for_changes())
+        except KeyboardInterrupt:
+            message(project_context, 'Watch mode stopped', 'done')
+
+    def start(self, project_context, sln_file_path):
+        """
+        Converts solution and remembers files that are watched
+
+        :param project_context: context with options of converter
+        :type project_context: Context
+        :param sln_file_path: path to *.sln file
+        :type sln_file_path: str
+        """
+        self.options_context = project_context.clone()
+        self.sln_file_path = sln_file_path
+        self.__convert_solution(project_context)
+
+    def __convert_solution(self, project_context):
+        """
+        Full conversion of solution with remembering of solution and projects data.
+        Previous data is kept if solution can not be read.
+        """
+        solution_data = self.converter.read_solution(project_context, self.sln_file_path)
+        parsed_context = project_context.clone()
+        sln_projects_data = solution_data['sln_projects_data']
+
+        input_data_for_converter = self.converter.get_input_data_for_converter(
+            project_context,
+            sln_projects_data
+        )
+        results = self.converter.do_conversion(project_context, input_data_for_converter)
+
+        self.solution_data = solution_data
+        self.parsed_context = parsed_context
+        self.input_data_for_converter = input_data_for_converter
+        self.results_of_directories = {}
+        self.__remember_results(self.input_data_for_converter, results)
+        self.__write_solution_files(
+            project_context,
+            results,
+            self.converter.get_subdirectories_of_solution(project_context, sln_projects_data)
+        )
+        self.__init_watched_files()
+
+    def __remember_results(self, input_data_for_converter, results):
+        """ Stores results of conversion mapped to directories of projects """
+        for subdirectory in input_data_for_converter:
+            self.results_of_directories[subdirectory] = []
+        for batch_results in results:
+            for target_result in batch_results:
+                subdirectory = target_result['cmake']
+                if subdirectory in self.results_of_directories:
+                    self.results_of_directories[subdirectory].append(target_result)
+
+    def __init_watched_files(self):
+        """
+        Collects files that affect conversion of every directory. Modification times
+        of files that were watched already are kept as they were seen by polling.
+        """
+        self.directories_of_files = {}
+        for subdirectory, tasks in self.input_data_for_converter.items():
+            files = []
+            for task in tasks:
+                files.append(task.target_abs)
+                files.append(task.target_abs + '.filters')
+            for target_result in self.results_of_directories[subdirectory]:
+                files.extend(target_result['input_files'])
+            for file in files:
+                self.directories_of_files.setdefault(get_file_key(file), set()).add(subdirectory)
+
+        # files saved during conversion must stay changed, so only new files are read
+        watched_files = [get_file_key(self.sln_file_path)] + list(self.directories_of_files)
+        new_files = [file for file in watched_files if file not in self.mtimes]
+        mtimes = self.__get_mtimes(new_files)
+        mtimes.update(
+            (file, self.mtimes[file]) for file in watched_files if file in self.mtimes
+        )
+        self.mtimes = mtimes
+
+    @staticmethod
+    def __get_mtimes(files):
+        mtimes = {}
+        for file in files:
+            try:
+                mtimes[file] = os.stat(file).st_mtime_ns
+            except OSError:
+                mtimes[file] = None
+        return mtimes
+
+    def get_changed_files(self):
+        """ Returns watched files that were changed since previous call """
+        current_mtimes = self.__get_mtimes(self.mtimes)
+        changed_files = {
+            file for file, mtime in current_mtimes.items() if mtime != self.mtimes[file]
+        }
+        self.mtimes = current_mtimes
+        return changed_files
+
+    def wait_for_changes(self):
+        """ Polls watched files and returns changed ones after burst of saves is over """
+        changed_files = set()
+        while not changed_files:
+            time.sleep(self.interval)
+            changed_files = self.get_changed_files()
+
+        while True:
+            time.sleep(self.debounce)
+            more_changed_files = self.get_changed_files()
+            if not more_changed_files:
+                break
+            changed_files |= more_changed_files
+
+        return changed_files
+
+    def process_changes(self, changed_files):
+        """
+        Reconverts projects affected by given changed files and entry point of solution.
+        Failed reconversion is reported and watching goes on with previous data.
+
+        :param changed_files: keys of changed files
+        :type changed_files: set
+        """
+        project_context = self.options_context.clone()
+        try:
+            self.__sync_changes(project_context, changed_files)
+        except (Exception, SystemExit) as e:  # half-saved file must not stop watching
+            message(
+                project_context,
+                'Changes are not synced: {}. Waiting for next change.'.format(
+                    str(e) or type(e).__name__
+                ),
+                'error'
+            )
+
+    def __sync_changes(self, project_context, changed_files):
+        """ Reconverts whole solution or directories of changed projects """
+        start_time = time.time()
+        if get_file_key(self.sln_file_path) in changed_files:
+            message(project_context, 'Solution file changed. Converting whole solution.', 'done')
+            self.__convert_solution(project_context)
+            self.__report_latency(project_context, start_time, len(changed_files), 'all')
+            return
+
+        affected_directories = set()
+        for file in changed_files:
+            affected_directories |= self.directories_of_files.get(file, set())
+            message(project_context, 'changed: {}'.format(file), '')
+
+        project_context = self.parsed_context.clone()
+        input_data_for_converter = {
+            subdirectory: self.input_data_for_converter[subdirectory]
+            for subdirectory in affected_directories
+        }
+        results = self.converter.do_conversion(project_context, input_data_for_converter)
+        self.__remember_results(input_data_for_converter, results)
+
+        self.__write_solution_files(project_context, results, list(affected_directories))
+        self.__init_watched_files()
+        self.__report_latency(
+            project_context,
+            start_time,
+            len(changed_files),
+            sum(len(tasks) for tasks in input_data_for_converter.values())
+        )
+
+    def __write_solution_files(self, project_context, results, subdirectories):
+        """ Writes entry point CMakeLists.txt and removes stale files of given directories """
+        written_files = self.converter.get_written_cmake_lists(results)
+        # entry point CMakeLists.txt contains projects of solution directory (if any)
+        written_files.update(self.converter.write_solution_cmake_file(
+            project_context,
+            self.solution_data,
+            list(self.results_of_directories.values())
+        ))
+        removed_files = self.converter.remove_stale_cmake_lists(
+            project_context,
+            subdirectories,
+            written_files
+        )
+        if not project_context.dry:
+            written_files.update(self.converter.copy_cmake_utils(project_context.solution_path))
+            self.converter.report_written_files(project_context, written_files, removed_files)
+
+    @staticmethod
+    def __report_latency(context, start_time, changed_files_count, projects_count):
+        message(
+            context,
+            'Change of {} file(s) is synced in {:.3f} s (projects reconverted: {})'.format(
+                changed_files_count,
+                time.time() - start_time,
+                projects_count
+            ),
+            'done'
+        )
@@ -26,16 +26,28 @@
 """
 
 import os
+import io
 from collections import OrderedDict
 
 from cmake_converter.utils import message, make_cmake_literal,\
     normalize_path, is_settings_has_data, set_unix_slash
 from cmake_converter.flags import defines, cl_flags, ln_flags, ifort_cl_win, ifort_cl_unix,\
     ifort_ln_win, ifort_ln_unix
-from cmake_converter.data_files import get_cmake_lists
+from cmake_converter.data_files import write_file_if_changed
+from cmake_converter.events import emit_event
+from cmake_converter.compiler_cache import LAUNCHER_LANGUAGES
 
 # pylint: disable=R0904
 
+# Place of files at block of per-file properties that is shared by files with the same block
+FILES_TOKEN = '<files>'
+# source_file_compile_options() of utils.cmake takes one file, so group of files appends
+# options with set_property() that does the same
+FILE_COMPILE_OPTIONS_CALL = 'source_file_compile_options({} '.format(FILES_TOKEN)
+FILES_COMPILE_OPTIONS_CALL = 'set_property(SOURCE {} APPEND PROPERTY COMPILE_OPTIONS '.format(
+    FILES_TOKEN
+)
+
 
 class CMakeWriter:
     """
@@ -70,6 +82,7 @@ class CMakeWriter:
             self.write_sln_dependencies(context, cmake_file)
             self.write_link_dependencies(context, cmake_file)
             self.write_target_dependency_packages(context, cmake_file)
+            self.write_object_library_properties(context, cmake_file)
         else:
             self.write_target_headers_only_artifact(context, cmake_file)
 
@@ -187,16 +200,46 @@ class CMakeWriter:
             if configuration_type:
                 break
         if configuration_type:
+            sources = ['${ALL_FILES}']
             if configuration_type == 'DynamicLibrary':
                 cmake_file.write('add_library(${PROJECT_NAME} SHARED')
                 message(context, 'CMake will build a SHARED Library.', '')
-            elif configuration_type == 'StaticLibrary':  # pragma: no cover
+            elif configuration_type == 'StaticLibrary':
+                if context.object_library:
+                    cmake_file.write('add_library(${PROJECT_NAME}_objects OBJECT ${ALL_FILES})\n')
+                    sources = ['$<TARGET_OBJECTS:${PROJECT_NAME}_objects>']
+                    message(
+                        context,
+                        'CMake will build a STATIC Library from OBJECT Library. Its objects '
+                        'are archived into libraries with LinkLibraryDependencies.',
+                        ''
+                    )
+                else:  # pragma: no cover
+                    message(context, 'CMake will build a STATIC Library.', '')
                 cmake_file.write('add_library(${PROJECT_NAME} STATIC')
-                message(context, 'CMake will build a STATIC Library.', '')
+                sources.extend(
+                    '$<TARGET_OBJECTS:{}_objects>'.format(library)
+                    for library in context.archived_object_libraries
+                )
             else:  # pragma: no cover
                 cmake_file.write('add_executable(${PROJECT_NAME}')
                 message(context, 'CMake will build an EXECUTABLE.', '')
-            cmake_file.write(' ${ALL_FILES})\n')
+            if len(sources) == 1:
+                cmake_file.write(' {})\n'.format(sources[0]))
+            else:
+                cmake_file.write('\n')
+                for source in sources:
+                    cmake_file.write('{}{}\n'.format(context.indent, source))
+                cmake_file.write(')\n')
+            if context.object_library:
+                # CMake does not find linker language of target made of objects only
+                linker_language = 'CXX'
+                if context.target_languages and 'CXX' not in context.target_languages:
+                    linker_language = context.target_languages[0]
+                cmake_file.write(
+                    'set_target_properties(${{PROJECT_NAME}} PROPERTIES LINKER_LANGUAGE {})\n'
+                    .format(linker_language)
+                )
 
         if context.project_folder:
             cmake_file.write(
@@ -471,15 +514,93 @@ class CMakeWriter:
             cmake_file.write('set_target_properties(${PROJECT_NAME} PROPERTIES MSVC_RUNTIME_LIBRARY'
                              ' ${MSVC_RUNTIME_LIBRARY_STR})\n\n')
 
-        # No support of Regex for Fortran_MODULE_DIRECTORY at CMake 3.13
-        # CMakeWriter.write_property_of_settings(
-        #     cmake_file, context.settings,
-        #     context.sln_configurations_map,
-        #     begin_text='set_target_properties(${PROJECT_NAME} PROPERTIES',
-        #     end_text=')',
-        #     property_name='Fortran_MODULE_DIRECTORY',
-        #     write_setting_property_func=ProjectVariables.write_target_property
-        # )
+        CMakeWriter.write_unity_build(context, cmake_file)
+        CMakeWriter.write_fortran_module_directory(context, cmake_file)
+
+    @staticmethod
+    def write_fortran_module_directory(context, cmake_file):
+        """
+        Write module directory of Fortran target and module directories of Fortran
+        targets it depends on. ModulePath of project is not used: targets must not share
+        module directory, otherwise parallel builds race on *.mod files.
+        Generators of Visual Studio add configuration to module directory.
+
+        :param context: related full context
+        :type context: Context
+        :param cmake_file: CMakeLists.txt IO wrapper
+        :type cmake_file: _io.TextIOWrapper
+        """
+        if 'Fortran' not in context.target_languages:
+            return
+
+        CMakeWriter.write_comment(cmake_file, 'Fortran module directory')
+        cmake_file.write(
+            'set_target_properties(${{PROJECT_NAME}} PROPERTIES\n'
+            '{}Fortran_MODULE_DIRECTORY '
+            '"${{CMAKE_CURRENT_BINARY_DIR}}/${{PROJECT_NAME}}.Modules.dir"\n'
+            ')\n'.format(context.indent)
+        )
+        if context.fortran_module_dependencies:
+            cmake_file.write('target_include_directories(${PROJECT_NAME} PRIVATE\n')
+            for dependency in context.fortran_module_dependencies:
+                cmake_file.write(
+                    '{}"$<TARGET_PROPERTY:{},Fortran_MODULE_DIRECTORY>/${{CMAKE_CFG_INTDIR}}"\n'
+                    .format(context.indent, make_cmake_literal(context, dependency))
+                )
+            cmake_file.write(')\n')
+        cmake_file.write('\n')
+
+    @staticmethod
+    def write_unity_build(context, cmake_file):
+        """
+        Write unity build properties of C and C++ target and list files that must be
+        compiled alone
+
+        :param context: related full context
+        :type context: Context
+        :param cmake_file: CMakeLists.txt IO wrapper
+        :type cmake_file: _io.TextIOWrapper
+        """
+        if context.unity_build_batch_size is None:
+            return
+        if not {'C', 'CXX'} & set(context.target_languages):
+            return  # CMake merges sources of C and C++ only
+
+        CMakeWriter.write_comment(cmake_file, 'Unity build')
+        cmake_file.write(
+            'set_target_properties(${{PROJECT_NAME}} PROPERTIES\n'
+            '{0}UNITY_BUILD ON\n'
+            '{0}UNITY_BUILD_BATCH_SIZE {1}\n'
+            ')\n'.format(context.indent, context.unity_build_batch_size)
+        )
+
+        skipped_files = [
+            file for file in context.file_contexts
+            if CMakeWriter.__is_file_not_for_unity_build(context.file_contexts[file])
+        ]
+        if skipped_files:
+            cmake_file.write('set_source_files_properties(\n')
+            for file in skipped_files:
+                cmake_file.write('{}{}\n'.format(context.indent, file))
+            cmake_file.write(
+                '{0}PROPERTIES\n{0}SKIP_UNITY_BUILD_INCLUSION ON\n)\n'.format(context.indent)
+            )
+        cmake_file.write('\n')
+
+    @staticmethod
+    def __is_file_not_for_unity_build(file_context):
+        """ Files that create PCH or have own settings can not be merged with others """
+        if file_context.excluded_from_build:
+            return True
+
+        for key in (defines, cl_flags, ifort_cl_win, ifort_cl_unix):
+            if is_settings_has_data(file_context.sln_configurations_map,
+                                    file_context.settings,
+                                    key):
+                return True
+
+        pch_column = file_context.settings.get_column('PrecompiledHeader')
+        return any('Create' in value for value in pch_column.values() if value)
 
     @staticmethod
     def write_include_directories(context, cmake_file):
@@ -545,17 +666,64 @@ class CMakeWriter:
             separator=';\n',
             in_quotes=True
         )
-        for file in context.file_contexts:
-            CMakeWriter.write_property_of_settings(
-                context.file_contexts[file],
-                cmake_file,
-                begin_text='set_source_files_properties({} PROPERTIES'.format(file),
+        self.write_grouped_by_files(
+            context,
+            cmake_file,
+            lambda file_context, block_file: CMakeWriter.write_property_of_settings(
+                file_context,
+                block_file,
+                begin_text='set_source_files_properties({} PROPERTIES'.format(FILES_TOKEN),
                 end_text=')',
                 property_name=defines,
                 write_setting_property_func=self.__write_defines_for_files
             )
+        )
         cmake_file.write('\n')
 
+    @staticmethod
+    def write_grouped_by_files(context, cmake_file, write_block):
+        """
+        Writes blocks of per-file properties. Files with identical blocks are written
+        with one block listing all of them, so FILES_TOKEN marks place of files at block.
+
+        :param context: converter context
+        :type context: Context
+        :param cmake_file: CMakeLists.txt IO wrapper
+        :type cmake_file: _io.TextIOWrapper
+        :param write_block: writes block of given file context into given file
+        :type write_block: function
+        """
+        files_of_blocks = OrderedDict()
+        for file in context.file_contexts:
+            block_file = io.StringIO()
+            write_block(context.file_contexts[file], block_file)
+            block_text = block_file.getvalue()
+            if block_text:
+                files_of_blocks.setdefault(block_text, []).append(file)
+
+        for block_text, files in files_of_blocks.items():
+            cmake_file.write(CMakeWriter.__put_files_into_block(context, block_text, files))
+
+    @staticmethod
+    def __put_files_into_block(context, block_text, files):
+        """ Replaces FILES_TOKEN with given files, several files go one per line """
+        if len(files) == 1:
+            return block_text.replace(FILES_TOKEN, files[0])
+
+        lines = []
+        block_text = block_text.replace(FILE_COMPILE_OPTIONS_CALL, FILES_COMPILE_OPTIONS_CALL)
+        for line in block_text.split('\n'):
+            if FILES_TOKEN not in line:
+                lines.append(line)
+                continue
+            indent = line[:len(line) - len(line.lstrip())]
+            prefix, suffix = line.split(FILES_TOKEN, 1)
+            lines.append(prefix.rstrip())
+            lines.extend(indent + context.indent + file for file in files)
+            if suffix.strip():
+                lines.append(indent + context.indent + suffix.strip())
+        return '\n'.join(lines)
+
     @staticmethod
     def __write_compile_flags(context, cmake_file, compiler_flags_key):
         CMakeWriter.write_property_of_settings(
@@ -566,20 +734,29 @@ class CMakeWriter:
             separator=';\n',
             indent=context.indent
         )
-        for file in context.file_contexts:
-            file_cl_var = 'FILE_CL_OPTIONS'
-            text = CMakeWriter.write_property_of_settings(
-                context.file_contexts[file], cmake_file,
-                begin_text='string(CONCAT {}'.format(file_cl_var),
-                end_text=')',
-                property_name=compiler_flags_key,
-                indent=context.indent,
-                in_quotes=True
+        CMakeWriter.write_grouped_by_files(
+            context,
+            cmake_file,
+            lambda file_context, block_file: CMakeWriter.__write_file_compile_flags(
+                context, file_context, block_file, compiler_flags_key
+            )
+        )
+
+    @staticmethod
+    def __write_file_compile_flags(context, file_context, cmake_file, compiler_flags_key):
+        file_cl_var = 'FILE_CL_OPTIONS'
+        text = CMakeWriter.write_property_of_settings(
+            file_context, cmake_file,
+            begin_text='string(CONCAT {}'.format(file_cl_var),
+            end_text=')',
+            property_name=compiler_flags_key,
+            indent=context.indent,
+            in_quotes=True
+        )
+        if text:
+            cmake_file.write(
+                '{}{}${{{}}})\n'.format(context.indent, FILE_COMPILE_OPTIONS_CALL, file_cl_var)
             )
-            if text:
-                cmake_file.write(
-                    '{}source_file_compile_options({} ${{{}}})\n'
-                    .format(context.indent, file, file_cl_var))
 
     @staticmethod
     def __write_link_flags(context, cmake_file, linker_flags_key):
@@ -903,6 +1080,22 @@ class CMakeWriter:
                 'use_package(${{PROJECT_NAME}} {} {})\n'.format(package[0], package[1])
             )
 
+    @staticmethod
+    def write_object_library_properties(context, cmake_file):
+        """
+        Pass compile properties written for STATIC library to OBJECT library which
+        objects it is built from
+
+        :param context: converter Context
+        :type context: Context
+        :param cmake_file: CMakeLIsts.txt IO wrapper
+        :type cmake_file: _io.TextIOWrapper
+        """
+        if not context.object_library:
+            return
+        CMakeWriter.write_comment(cmake_file, 'Objects')
+        cmake_file.write('use_compile_properties(${PROJECT_NAME}_objects ${PROJECT_NAME})\n\n')
+
     @staticmethod
     def write_target_headers_only_artifact(context, cmake_file):
         """
@@ -917,75 +1110,117 @@ class CMakeWriter:
         message(context, 'CMake will show fake custom Library.', '')
         cmake_file.write('add_custom_target(${PROJECT_NAME} SOURCES ${ALL_FILES})\n\n')
 
-    def write_project_cmake_file(
+    def render_project_cmake_file(
             self,
             project_context,
             configuration_types_list,
             subdirectories_set,
-            subdirectories_to_target_name
+            subdirectories_to_target_name,
+            project_cmake_projects_text=''
     ):
-        """ Routine that writes entry point of converted solution for CMake """
-
-        if project_context.dry:
-            return
+        """
+        Routine that renders entry point of converted solution for CMake
 
-        project_cmake_projects_text = ''
-        for project_cmake in get_cmake_lists(project_context, project_context.solution_path, 'r'):
-            if project_cmake is not None:
-                project_cmake_projects_text = project_cmake.read()
-
-        for project_cmake in get_cmake_lists(project_context, project_context.solution_path):
-            project_cmake.write('cmake_minimum_required(VERSION 3.16.0 FATAL_ERROR)\n\n')
-            if project_context.target_windows_version:
-                project_cmake.write(
-                    'set(CMAKE_SYSTEM_VERSION {} CACHE STRING "" FORCE)\n\n'
-                    .format(project_context.target_windows_version)
-                )
+        :return: text of CMakeLists.txt of solution
+        :rtype: str
+        """
 
+        project_cmake = io.StringIO()
+        project_cmake.write('cmake_minimum_required(VERSION 3.16.0 FATAL_ERROR)\n\n')
+        if project_context.target_windows_version:
             project_cmake.write(
-                'project({} {})\n\n'.format(
-                    project_context.project_name,
-                    ' '.join(sorted(project_context.project_languages))
-                )
+                'set(CMAKE_SYSTEM_VERSION {} CACHE STRING "" FORCE)\n\n'
+                .format(project_context.target_windows_version)
             )
 
-            self.write_arch_types(project_context, project_cmake)
-
-            self.__write_supported_architectures_check(project_context, project_cmake)
-            self.__write_global_configuration_types(
-                project_context, project_cmake, configuration_types_list
+        project_cmake.write(
+            'project({} {})\n\n'.format(
+                project_context.project_name,
+                ' '.join(sorted(project_context.project_languages))
             )
+        )
 
-            self.__write_global_compile_options(
-                project_context, project_cmake, configuration_types_list
-            )
+        self.write_arch_types(project_context, project_cmake)
 
-            self.__write_global_link_options(
-                project_context,
-                project_cmake,
-                configuration_types_list
-            )
+        self.__write_supported_architectures_check(project_context, project_cmake)
+        self.__write_global_configuration_types(
+            project_context, project_cmake, configuration_types_list
+        )
+
+        self.__write_global_compile_options(
+            project_context, project_cmake, configuration_types_list
+        )
+
+        self.__write_global_link_options(
+            project_context,
+            project_cmake,
+            configuration_types_list
+        )
 
-            self.write_use_package_stub(project_context, project_cmake)
+        self.write_compiler_launcher(project_context, project_cmake)
 
-            CMakeWriter.write_comment(project_cmake, 'Common utils')
-            project_cmake.write('include(CMake/Utils.cmake)\n\n')
+        self.write_use_package_stub(project_context, project_cmake)
 
-            CMakeWriter.write_comment(
-                project_cmake, 'Additional Global Settings(add specific info there)'
-            )
-            project_cmake.write('include(CMake/GlobalSettingsInclude.cmake OPTIONAL)\n\n')
+        CMakeWriter.write_comment(project_cmake, 'Common utils')
+        project_cmake.write('include(CMake/Utils.cmake)\n\n')
+
+        CMakeWriter.write_comment(
+            project_cmake, 'Additional Global Settings(add specific info there)'
+        )
+        project_cmake.write('include(CMake/GlobalSettingsInclude.cmake OPTIONAL)\n\n')
 
-            CMakeWriter.write_comment(project_cmake, 'Use solution folders feature')
-            project_cmake.write('set_property(GLOBAL PROPERTY USE_FOLDERS ON)\n\n')
+        CMakeWriter.write_comment(project_cmake, 'Use solution folders feature')
+        project_cmake.write('set_property(GLOBAL PROPERTY USE_FOLDERS ON)\n\n')
 
-            self.__write_subdirectories(
-                project_cmake, subdirectories_set, subdirectories_to_target_name
-            )
+        self.__write_subdirectories(
+            project_cmake, subdirectories_set, subdirectories_to_target_name
+        )
+
+        if project_cmake_projects_text:
+            project_cmake.write('\n' * 26)
+            project_cmake.write(project_cmake_projects_text)
+
+        return project_cmake.getvalue()
+
+    def write_project_cmake_file(
+            self,
+            project_context,
+            configuration_types_list,
+            subdirectories_set,
+            subdirectories_to_target_name,
+            project_cmake_projects_text=''
+    ):
+        """
+        Routine that writes entry point of converted solution for CMake
 
-            if project_cmake_projects_text:
-                project_cmake.write('\n' * 26)
-                project_cmake.write(project_cmake_projects_text)
+        :return: True if CMakeLists.txt of solution was changed, None in dry mode
+        :rtype: None | bool
+        """
+
+        if project_context.dry:
+            return None
+
+        cmake_lists_path = os.path.join(project_context.solution_path, 'CMakeLists.txt')
+        message(project_context, 'CMakeLists.txt will be written to : ' + cmake_lists_path, '')
+        cmake_lists_text = self.render_project_cmake_file(
+            project_context,
+            configuration_types_list,
+            subdirectories_set,
+            subdirectories_to_target_name,
+            project_cmake_projects_text
+        )
+        changed = write_file_if_changed(cmake_lists_path, cmake_lists_text)
+        emit_event(
+            project_context,
+            'solution_finished',
+            solution=project_context.vcxproj_path,
+            path=cmake_lists_path,
+            changed=changed,
+            bytes=len(cmake_lists_text.encode('utf-8')),
+            warnings_count=project_context.warnings_count,
+            languages=sorted(project_context.project_languages),
+            subdirectories=len(subdirectories_set),
+        )
 
         warnings = ''
         if project_context.warnings_count > 0:
@@ -1006,6 +1241,29 @@ class CMakeWriter:
             ),
             'done'
         )
+        return changed
+
+    @staticmethod
+    def write_compiler_launcher(context, cmake):
+        """ Writes compiler cache as launcher of compilers of solution languages if found """
+        if not context.compiler_cache:
+            return
+        languages = [
+            lang for lang in sorted(context.project_languages) if lang in LAUNCHER_LANGUAGES
+        ]
+        if not languages:
+            return
+
+        CMakeWriter.write_comment(cmake, 'Compiler cache')
+        cmake.write('find_program(COMPILER_CACHE_PROGRAM {})\n'.format(context.compiler_cache))
+        cmake.write('if(COMPILER_CACHE_PROGRAM)\n')
+        for lang in languages:
+            cmake.write(
+                '{}set(CMAKE_{}_COMPILER_LAUNCHER "${{COMPILER_CACHE_PROGRAM}}")\n'.format(
+                    context.indent, lang
+                )
+            )
+        cmake.write('endif()\n\n')
 
     @staticmethod
     def write_arch_types(context, cmake):
@@ -1235,26 +1493,27 @@ class CMakeWriter:
         indent = kwargs['indent']
         write_setting_property_func = kwargs['write_setting_property_func']
 
-        mapped_setting = settings[sln_setting_2_project_setting[sln_setting]]
-        if property_name in mapped_setting:
-            if mapped_setting[property_name]:
-                if not has_property_value:
-                    begin_text = begin_text.replace('\n', '\n' + indent + command_indent)
-                    if begin_text:
-                        cmake_file.write('{}{}\n'.format(indent + command_indent, begin_text))
-                    has_property_value = True
-
-                config_condition_expr = None
-                if sln_conf is not None:
-                    config_condition_expr = '$<CONFIG:{}>'.format(sln_conf)
-                    config_expressions.append(config_condition_expr)
-                write_setting_property_func(cmake_file,
-                                            indent + command_indent,
-                                            config_condition_expr,
-                                            mapped_setting[property_name],
-                                            max_config_condition_width,
-                                            **kwargs
-                                            )
+        property_value = settings.get_value(
+            sln_setting_2_project_setting[sln_setting], property_name
+        )
+        if property_value:
+            if not has_property_value:
+                begin_text = begin_text.replace('\n', '\n' + indent + command_indent)
+                if begin_text:
+                    cmake_file.write('{}{}\n'.format(indent + command_indent, begin_text))
+                has_property_value = True
+
+            config_condition_expr = None
+            if sln_conf is not None:
+                config_condition_expr = '$<CONFIG:{}>'.format(sln_conf)
+                config_expressions.append(config_condition_expr)
+            write_setting_property_func(cmake_file,
+                                        indent + command_indent,
+                                        config_condition_expr,
+                                        property_value,
+                                        max_config_condition_width,
+                                        **kwargs
+                                        )
         return has_property_value
 
     @staticmethod
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from cmake_converter.api import convert, ConverterCache, SolutionError
+
+
+class TestApi(unittest.TestCase):
+    """
+        This file test in-memory conversion API.
+    """
+
+    cur_dir = os.path.dirname(os.path.realpath(__file__))
+
+    def test_convert_in_memory(self):
+        """Convert Solution In Memory"""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = os.path.join(temp_dir, 'datatest')
+            shutil.copytree(
+                os.path.join(self.cur_dir, 'datatest'),
+                data_dir,
+                ignore=shutil.ignore_patterns('CMakeLists.txt', 'CMake')
+            )
+            sln_path = os.path.join(data_dir, 'sln', 'cpp.sln')
+            cache = ConverterCache()
+
+            under_test = convert(sln_path, {'warn_level': 1}, cache)
+
+            solution_cmake_lists = os.path.join(data_dir, 'sln', 'CMakeLists.txt')
+            self.assertEqual(3, len(under_test.cmake_lists))
+            self.assertIn('project(cpp ', under_test.cmake_lists[solution_cmake_lists])
+            self.assertIn(
+                'add_subdirectory(../external ${CMAKE_BINARY_DIR}/zlib)',
+                under_test.cmake_lists[solution_cmake_lists]
+            )
+            self.assertEqual(3, under_test.stats['projects'])
+            self.assertNotEqual(0, len(under_test.warnings))
+            for cmake_lists_path in under_test.cmake_lists:
+                self.assertFalse(os.path.exists(cmake_lists_path))
+
+            convert(sln_path, {'warn_level': 1}, cache)
+            self.assertNotEqual(0, cache.hits)
+
+    def test_unknown_option(self):
+        """Unknown Option Is Rejected"""
+
+        with self.assertRaises(ValueError):
+            convert('my.sln', {'jobs': 4})
+
+    def test_malformed_solution(self):
+        """Malformed Solution Raises Error Instead Of Exit"""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sln_path = os.path.join(temp_dir, 'broken.sln')
+            for sln_text in ('', 'Microsoft Visual Studio Solution File, Format Version 8.00\n',
+                             'Microsoft Visual Studio Solution File, Format Version x\n'):
+                with open(sln_path, 'w', encoding='utf-8') as sln_file:
+                    sln_file.write(sln_text)
+                with self.assertRaises(SolutionError):
+                    convert(sln_path)
+
+    def test_absent_target(self):
+        """Absent Target Raises Error Instead Of Exit"""
+
+        with self.assertRaises(ValueError):
+            convert(
+                os.path.join(self.cur_dir, 'datatest', 'sln', 'cpp.sln'),
+                {'target_names': ['absent']}
+            )
+
+    def test_concurrent_conversions(self):
+        """Conversions At Threads Keep Their Own Options"""
+
+        sln_path = os.path.join(self.cur_dir, 'datatest', 'sln', 'cpp.sln')
+        results = {}
+
+        def convert_with_indent(indent):
+            for _ in range(3):
+                results.setdefault(indent, []).append(convert(sln_path, {'indent': indent}))
+
+        threads = [
+            threading.Thread(target=convert_with_indent, args=(indent,))
+            for indent in ('  ', '\t')
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        solution_cmake_lists = os.path.join(os.path.dirname(sln_path), 'CMakeLists.txt')
+        for indent, results_of_indent in results.items():
+            for result in results_of_indent:
+                for cmake_lists_path, text in result.cmake_lists.items():
+                    if cmake_lists_path != solution_cmake_lists:
+                        self.assertIn('set(ALL_FILES\n{}${{'.format(indent), text)
+
+
+if __name__ == '__main__':
+    unittest.main()
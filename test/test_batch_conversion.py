@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from cmake_converter.data_converter import DataConverter
+from cmake_converter.main import get_solution_paths
+from cmake_converter.visual_studio.context import VSContext
+from cmake_converter.visual_studio.solution import VSSolutionConverter
+
+
+class TestBatchConversion(unittest.TestCase):
+    """
+        This file test conversion of several solutions at once.
+    """
+
+    cur_dir = os.path.dirname(os.path.realpath(__file__))
+
+    def test_shared_projects_are_converted_once(self):
+        """Shared Projects Are Converted Once"""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = os.path.join(temp_dir, 'datatest')
+            shutil.copytree(
+                os.path.join(self.cur_dir, 'datatest'),
+                data_dir,
+                ignore=shutil.ignore_patterns('CMakeLists.txt', 'CMake')
+            )
+            os.mkdir(os.path.join(data_dir, 'sln2'))
+            shutil.copy(
+                os.path.join(data_dir, 'sln', 'cpp.sln'),
+                os.path.join(data_dir, 'sln2', 'cpp2.sln')
+            )
+            sln_file_paths = get_solution_paths([
+                os.path.join(data_dir, 'sln', 'cpp_and_fortran.sln'),
+                os.path.join(data_dir, 'sln*', 'cpp*.sln'),
+            ])
+            self.assertEqual(3, len(sln_file_paths))
+
+            context = VSContext()
+            context.warn_level = 1
+            with mock.patch.object(
+                    DataConverter,
+                    'convert_project',
+                    autospec=True,
+                    side_effect=DataConverter.convert_project
+            ) as convert_project:
+                VSSolutionConverter().convert_solutions(context, sln_file_paths)
+
+            self.assertEqual(4, convert_project.call_count)
+            for cmake_lists_dir in ['', 'external', 'sln', 'sln2']:
+                self.assertTrue(
+                    os.path.exists(os.path.join(data_dir, cmake_lists_dir, 'CMakeLists.txt'))
+                )
+            with open(os.path.join(data_dir, 'sln2', 'CMakeLists.txt')) as cmake_lists:
+                self.assertIn('add_subdirectory(../external ', cmake_lists.read())
+
+    def test_absent_solution_pattern(self):
+        """Wildcard Without Solutions Is Rejected"""
+
+        with self.assertRaises(ValueError):
+            get_solution_paths([os.path.join(self.cur_dir, 'no_such_dir', '*.sln')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+
+from cmake_converter.cache import get_cached, ConverterCache, REFERENCE_NAMES
+from cmake_converter.visual_studio.context import VSContext
+
+
+class TestConverterCache(unittest.TestCase):
+    """
+        This file test cache of data read from disk.
+    """
+
+    def test_hit_adds_input_files_of_loader(self):
+        """Cache Hit Adds Input Files Read By Loader To Context"""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            vs_project = os.path.join(temp_dir, 'foo.vcxproj')
+            props = os.path.join(temp_dir, 'foo.props')
+            for path in (vs_project, props):
+                open(path, 'w').close()
+
+            def read_name(path):
+                context.input_files.update([path, props])
+                return 'foo'
+
+            cache = ConverterCache()
+            first = context = VSContext()
+            context.cache = cache
+            context.input_files.add(props)
+            self.assertEqual('foo', get_cached(context, REFERENCE_NAMES, vs_project, read_name))
+
+            second = context = VSContext()
+            context.cache = cache
+            self.assertEqual('foo', get_cached(context, REFERENCE_NAMES, vs_project, read_name))
+            self.assertEqual(1, cache.hits)
+            self.assertEqual({vs_project, props}, first.input_files)
+            self.assertEqual({vs_project, props}, second.input_files)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import unittest
+
+from cmake_converter.compiler_cache import make_cache_friendly_option, get_compiler_cache_issues
+from cmake_converter.context import Context
+from cmake_converter.flags import cl_flags
+from cmake_converter.writer import CMakeWriter
+
+
+class TestCompilerCache(unittest.TestCase):
+    """
+        This file test conversion for compiler cache.
+    """
+
+    def test_cache_friendly_options(self):
+        """Debug Information Is Embedded Into Object Files"""
+
+        self.assertEqual('/Z7', make_cache_friendly_option('/Zi'))
+        self.assertEqual('/Z7', make_cache_friendly_option('/ZI'))
+        self.assertEqual('/Od', make_cache_friendly_option('/Od'))
+
+    def test_compiler_cache_issues(self):
+        """Targets That Can Not Be Cached Are Reported"""
+
+        context = Context()
+        context.settings[('Debug', 'x64')] = {'PrecompiledHeader': ['NotUsing'], cl_flags: []}
+        self.assertEqual([], get_compiler_cache_issues(context))
+
+        context.target_languages = ['CXX', 'Fortran']
+        context.settings[('Release', 'x64')] = {
+            'PrecompiledHeader': ['Use'], cl_flags: ['/Fdvc.pdb']
+        }
+        self.assertEqual(
+            [
+                'Fortran has no compiler launcher',
+                'PDB file is set with /Fdvc.pdb',
+                'precompiled headers are used',
+            ],
+            get_compiler_cache_issues(context)
+        )
+
+    def test_compiler_launcher(self):
+        """Compiler Cache Is Launcher Of C And C++ Compilers"""
+
+        context = Context()
+        context.project_languages = {'C', 'CXX', 'Fortran'}
+        cmake_file = io.StringIO()
+        CMakeWriter.write_compiler_launcher(context, cmake_file)
+        self.assertEqual('', cmake_file.getvalue())
+
+        context.compiler_cache = 'ccache'
+        CMakeWriter.write_compiler_launcher(context, cmake_file)
+        self.assertIn(
+            'find_program(COMPILER_CACHE_PROGRAM ccache)\n'
+            'if(COMPILER_CACHE_PROGRAM)\n'
+            '    set(CMAKE_C_COMPILER_LAUNCHER "${COMPILER_CACHE_PROGRAM}")\n'
+            '    set(CMAKE_CXX_COMPILER_LAUNCHER "${COMPILER_CACHE_PROGRAM}")\n'
+            'endif()\n',
+            cmake_file.getvalue()
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
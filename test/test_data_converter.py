@@ -21,10 +21,14 @@
 # along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import shutil
+import tempfile
 import unittest
+from collections import OrderedDict
 
-from cmake_converter.data_converter import DataConverter
+from cmake_converter.data_converter import DataConverter, TargetTask
 from cmake_converter.visual_studio.context import VSContext
+from cmake_converter.visual_studio.solution import VSSolutionConverter
 
 
 class TestDataConverter(unittest.TestCase):
@@ -51,6 +55,105 @@ class TestDataConverter(unittest.TestCase):
         # self.assertTrue('ns' in under_test.vcxproj)
         # self.assertTrue('tree' in under_test.vcxproj)
 
+    def test_parse_state_is_released(self):
+        """Parse State Is Released Before Writing"""
+
+        context = VSContext()
+        context.dry = True
+        context.sln_configurations_map = OrderedDict([
+            ((None, None), (None, None)),
+            (('Debug', 'x64'), ('Debug', 'x64')),
+            (('Release', 'x64'), ('Release', 'x64')),
+        ])
+
+        self.assertTrue(DataConverter().convert_project(context, self.vs_project, self.cur_dir))
+
+        self.assertEqual({}, context.xml_data)
+        self.assertIsNone(context.current_node)
+        self.assertIsNone(context.parser.filters)
+        self.assertEqual({}, context.flags.flags)
+        self.assertEqual({}, context.files.file_lists)
+        self.assertNotEqual(0, len(context.settings))
+        for file_context in context.file_contexts.values():
+            self.assertEqual({}, file_context.xml_data)
+            self.assertEqual({}, file_context.flags.flags)
+
+    def test_parser_stats(self):
+        """Calls And Time Of Parser Handlers Are Counted And Merged"""
+
+        context = VSContext()
+        context.dry = True
+        context.parser_stats = True
+        context.sln_configurations_map = OrderedDict([
+            ((None, None), (None, None)),
+            (('Debug', 'x64'), ('Debug', 'x64')),
+        ])
+
+        self.assertTrue(DataConverter().convert_project(context, self.vs_project, self.cur_dir))
+
+        calls, total_time, own_time = context.handler_stats['<ItemGroup>']
+        self.assertLess(0, calls)
+        self.assertLessEqual(own_time, total_time)
+        self.assertIn('<ClCompile> Include', context.handler_stats)
+        self.assertIn('Condition', context.handler_stats)
+        self.assertEqual([], context.parser.handler_time_stack)
+
+        results = [
+            [{'target_name': 'foo', 'handler_stats': {'Condition': [2, 0.5, 0.5]}}],
+            [{'target_name': 'bar', 'handler_stats': {'Condition': [3, 1.0, 0.75]}}],
+        ]
+        merged_stats = DataConverter.merge_handler_stats(results)
+        self.assertEqual(5, merged_stats['Condition']['calls'])
+        self.assertEqual(1.25, merged_stats['Condition']['own_time'])
+        self.assertEqual('bar', merged_stats['Condition']['hottest_project'])
+
+    def test_executor_choice(self):
+        """Executor Is Chosen By Options And Size Of Solution"""
+
+        def make_inputs(count):
+            tasks = [
+                TargetTask(number, self.vs_project, 'dir{}'.format(number), (), [], '')
+                for number in range(count)
+            ]
+            return OrderedDict([(None, OrderedDict((task.subdirectory, [task]) for task in tasks))])
+
+        context = VSContext()
+        context.jobs = 4
+        self.assertEqual('serial', DataConverter.get_executor(context, make_inputs(3)))
+        self.assertIn(
+            DataConverter.get_executor(context, make_inputs(100)), ['process', 'forkserver']
+        )
+        context.executor = 'thread'
+        self.assertEqual('thread', DataConverter.get_executor(context, make_inputs(3)))
+        context.jobs = 1
+        self.assertEqual('serial', DataConverter.get_executor(context, make_inputs(100)))
+
+    def test_thread_executor(self):
+        """Threads Write The Same CMakeLists As Main Process"""
+
+        texts = {}
+        for executor in ['serial', 'thread']:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                data_dir = os.path.join(temp_dir, 'datatest')
+                shutil.copytree(
+                    os.path.join(self.cur_dir, 'datatest'),
+                    data_dir,
+                    ignore=shutil.ignore_patterns('CMakeLists.txt', 'CMake')
+                )
+                context = VSContext()
+                context.warn_level = 1
+                context.jobs = 2
+                context.executor = executor
+                VSSolutionConverter().convert_solution(
+                    context, os.path.join(data_dir, 'sln', 'cpp.sln')
+                )
+                texts[executor] = []
+                for cmake_lists_dir in ['', 'external']:
+                    with open(os.path.join(data_dir, cmake_lists_dir, 'CMakeLists.txt')) as f:
+                        texts[executor].append(f.read())
+
+        self.assertEqual(texts['serial'], texts['thread'])
+
     def test_create_data(self):
         """Data Converter Create Data"""
 
@@ -21,12 +21,13 @@
 # along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import tempfile
 import unittest
 import lxml
-import _io
 
-from cmake_converter.data_files import get_vcxproj_data, get_cmake_lists
+from cmake_converter.data_files import get_vcxproj_data
 from cmake_converter.data_files import get_propertygroup, get_definitiongroup
+from cmake_converter.data_files import write_file_if_changed
 from cmake_converter.visual_studio.context import VSContext
 
 
@@ -68,10 +69,17 @@ class TestDataFiles(unittest.TestCase):
         self.assertTrue('ItemDefinitionGroup' in under_test)
         self.assertTrue('Release|Win32' in under_test)
 
-    def test_get_cmakelists(self):
-        """Get CMakeLists.txt"""
+    def test_write_file_if_changed(self):
+        """Write File Only If Content Changed"""
 
-        context = VSContext()
-        for under_test in get_cmake_lists(context, './'):
-            self.assertTrue(under_test)
-            self.assertIsInstance(under_test, _io.TextIOWrapper)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, 'CMakeLists.txt')
+
+            self.assertTrue(write_file_if_changed(file_path, 'project(foo)\n'))
+            os.utime(file_path, (1, 1))
+            self.assertFalse(write_file_if_changed(file_path, 'project(foo)\n'))
+            self.assertEqual(1, os.stat(file_path).st_mtime)
+
+            self.assertTrue(write_file_if_changed(file_path, 'project(bar)\n'))
+            with open(file_path) as file:
+                self.assertEqual('project(bar)\n', file.read())
@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from cmake_converter.visual_studio.context import VSContext
+from cmake_converter.visual_studio.dependency_graph import DependencyGraph, \
+    find_object_libraries, find_fortran_module_dependencies
+from cmake_converter.visual_studio.solution import VSSolutionConverter
+from cmake_converter.writer import CMakeWriter
+
+
+class TestDependencyGraph(unittest.TestCase):
+    """
+        This file test graph of dependencies between projects of solution.
+    """
+
+    cur_dir = os.path.dirname(os.path.realpath(__file__))
+    sln_file_path = os.path.join(cur_dir, 'datatest', 'sln', 'cpp.sln')
+
+    def test_target_with_dependencies(self):
+        """Target With Dependencies Is Selected"""
+
+        context = VSContext()
+        context.target_names = ['foo']
+        context.with_deps = True
+        converter = VSSolutionConverter()
+        solution_data = converter.read_solution(context, self.sln_file_path)
+        self.assertEqual(3, len(context.selected_projects))
+
+        context.with_deps = False
+        context.target_names = ['zlib']
+        converter.read_solution(context, self.sln_file_path)
+        input_data_for_converter = converter.get_input_data_for_converter(
+            context, solution_data['sln_projects_data']
+        )
+        tasks = [task for tasks in input_data_for_converter.values() for task in tasks]
+        self.assertEqual(['zlib.vcxproj'], [os.path.basename(t.target_abs) for t in tasks])
+
+    def test_find_cycles(self):
+        """Cycles Of Dependencies Are Found"""
+
+        under_test = DependencyGraph()
+        for guid in 'abcd':
+            under_test.names[guid] = guid.upper()
+            under_test.edges[guid] = []
+        under_test.add_edge('a', 'b')
+        under_test.add_edge('b', 'c')
+        under_test.add_edge('c', 'a')
+        under_test.add_edge('c', 'd')
+        under_test.add_edge('d', 'd')
+
+        self.assertEqual([['D'], ['A', 'B', 'C']], under_test.find_cycles())
+        self.assertEqual({'b', 'c', 'a', 'd'}, under_test.get_closure(['b']))
+        self.assertEqual({'d'}, under_test.get_closure(['d']))
+
+    @staticmethod
+    def write_project(solution_dir, name, configuration_type, references, link_objects):
+        """ Writes minimal project with references to other projects of solution """
+        definition = ''
+        if link_objects:
+            definition = (
+                '<ItemDefinitionGroup><ProjectReference>'
+                '<LinkLibraryDependencies>true</LinkLibraryDependencies>'
+                '</ProjectReference></ItemDefinitionGroup>'
+            )
+        with open(os.path.join(solution_dir, name + '.vcxproj'), 'w') as project_file:
+            project_file.write(
+                '<Project xmlns="http://schemas.microsoft.com/developer/msbuild/2003">'
+                '<PropertyGroup><ConfigurationType>{}</ConfigurationType></PropertyGroup>'
+                '{}<ItemGroup>{}</ItemGroup></Project>'.format(
+                    configuration_type,
+                    definition,
+                    ''.join(
+                        '<ProjectReference Include="{}.vcxproj" />'.format(reference)
+                        for reference in references
+                    )
+                )
+            )
+        return {'name': name, 'path': name + '.vcxproj'}
+
+    def test_find_object_libraries(self):
+        """Static Libraries Linked With LinkLibraryDependencies Are Object Libraries"""
+
+        solution_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, solution_dir)
+        context = VSContext()
+        context.solution_path = solution_dir
+        sln_projects_data = {
+            '1': self.write_project(solution_dir, 'app', 'Application', ['liba'], True),
+            '2': self.write_project(solution_dir, 'liba', 'StaticLibrary', ['libb'], True),
+            '3': self.write_project(solution_dir, 'libb', 'StaticLibrary', ['libc'], True),
+            '4': self.write_project(solution_dir, 'libc', 'StaticLibrary', [], False),
+            '5': self.write_project(solution_dir, 'libd', 'StaticLibrary', ['libc'], False),
+        }
+
+        object_libraries, objects_of_projects = find_object_libraries(
+            context, sln_projects_data
+        )
+
+        def key(name):
+            return os.path.normcase(os.path.normpath(os.path.join(solution_dir, name + '.vcxproj')))
+
+        self.assertEqual({key('libb'), key('libc')}, object_libraries)
+        self.assertEqual(
+            {key('liba'): ['libb', 'libc'], key('libb'): ['libc']},
+            objects_of_projects
+        )
+
+    @staticmethod
+    def write_static_library(object_library, archived_object_libraries, target_references):
+        """ Writes target and links of static library made by converter """
+        context = VSContext()
+        context.sln_configurations_map = {('Debug', 'x64'): ('Debug', 'x64')}
+        context.settings[('Debug', 'x64')] = {'target_type': 'StaticLibrary'}
+        context.target_languages = ['CXX']
+        context.object_library = object_library
+        context.archived_object_libraries = archived_object_libraries
+        context.target_references = target_references
+        cmake_file = io.StringIO()
+        CMakeWriter.write_target_artifact(context, cmake_file)
+        CMakeWriter.write_link_dependencies(context, cmake_file)
+        CMakeWriter.write_object_library_properties(context, cmake_file)
+        return cmake_file.getvalue()
+
+    def test_write_object_libraries(self):
+        """Objects Are Archived Only Into Libraries With LinkLibraryDependencies"""
+
+        text = self.write_static_library(True, ['libc'], ['libc'])
+        self.assertIn(
+            'add_library(${PROJECT_NAME}_objects OBJECT ${ALL_FILES})\n'
+            'add_library(${PROJECT_NAME} STATIC\n'
+            '    $<TARGET_OBJECTS:${PROJECT_NAME}_objects>\n'
+            '    $<TARGET_OBJECTS:libc_objects>\n'
+            ')\n'
+            'set_target_properties(${PROJECT_NAME} PROPERTIES LINKER_LANGUAGE CXX)\n',
+            text
+        )
+        self.assertIn('target_link_libraries(${PROJECT_NAME} PUBLIC\n    libc\n)\n', text)
+        self.assertIn('use_compile_properties(${PROJECT_NAME}_objects ${PROJECT_NAME})\n', text)
+
+        text = self.write_static_library(False, ['libb', 'libc'], ['libb'])
+        self.assertIn(
+            'add_library(${PROJECT_NAME} STATIC\n'
+            '    ${ALL_FILES}\n'
+            '    $<TARGET_OBJECTS:libb_objects>\n'
+            '    $<TARGET_OBJECTS:libc_objects>\n'
+            ')\n',
+            text
+        )
+        self.assertIn('target_link_libraries(${PROJECT_NAME} PUBLIC\n    libb\n)\n', text)
+        self.assertNotIn('_objects OBJECT', text)
+
+        text = self.write_static_library(False, [], ['libc'])
+        self.assertIn('add_library(${PROJECT_NAME} STATIC ${ALL_FILES})\n', text)
+        self.assertIn('target_link_libraries(${PROJECT_NAME} PUBLIC\n    libc\n)\n', text)
+        self.assertNotIn('TARGET_OBJECTS', text)
+        self.assertNotIn('use_compile_properties', text)
+
+    def test_find_fortran_module_dependencies(self):
+        """Fortran Projects Get Fortran Dependencies Of Their Dependencies"""
+
+        solution_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, solution_dir)
+        context = VSContext()
+        context.solution_path = solution_dir
+        sln_projects_data = {
+            '1': {'name': 'app', 'path': 'app.vfproj', 'sln_deps': ['glue']},
+            '2': self.write_project(solution_dir, 'glue', 'StaticLibrary', [], False),
+            '3': {'name': 'solver', 'path': 'solver.vfproj', 'sln_deps': ['base']},
+            '4': {'name': 'base', 'path': 'base.vfproj', 'sln_deps': []},
+        }
+        sln_projects_data['2']['sln_deps'] = ['solver']
+
+        under_test = find_fortran_module_dependencies(context, sln_projects_data)
+
+        def key(file_name):
+            return os.path.normcase(os.path.normpath(os.path.join(solution_dir, file_name)))
+
+        self.assertEqual(['base', 'solver'], under_test[key('app.vfproj')])
+        self.assertEqual(['base'], under_test[key('solver.vfproj')])
+        self.assertNotIn(key('base.vfproj'), under_test)
+        self.assertEqual(
+            {}, find_fortran_module_dependencies(context, {'2': sln_projects_data['2']})
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
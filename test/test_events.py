@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import copy
+import json
+import tempfile
+import unittest
+
+from cmake_converter.events import EventStream, emit_event
+from cmake_converter.visual_studio.context import VSContext
+
+
+class TestEvents(unittest.TestCase):
+    """
+        This file test stream of conversion events.
+    """
+
+    def test_events_are_written_as_json_lines(self):
+        """Events Are Written As JSON Lines"""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            events_file = os.path.join(temp_dir, 'events.jsonl')
+            context = VSContext()
+            context.events = EventStream(events_file)
+            context.events.start()
+
+            emit_event(context, 'project_started', target_number=1)
+            emit_event(copy.deepcopy(context), 'project_finished', target_number=1)
+            context.events.close()
+
+            with open(events_file) as events:
+                under_test = [json.loads(line) for line in events]
+
+        self.assertEqual(
+            ['project_started', 'project_finished'],
+            [event['event'] for event in under_test]
+        )
+        self.assertEqual(1, under_test[1]['target_number'])
+        self.assertEqual(os.getpid(), under_test[1]['pid'])
+
+    def test_no_events_without_stream(self):
+        """No Events Without Stream"""
+
+        emit_event(VSContext(), 'project_started', target_number=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
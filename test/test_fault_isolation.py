@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import signal
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from cmake_converter.api import convert
+from cmake_converter.data_converter import DataConverter, ProjectTimer, ProjectTimeoutError
+
+
+class TestFaultIsolation(unittest.TestCase):
+    """
+        This file test that failed projects do not stop conversion of others.
+    """
+
+    cur_dir = os.path.dirname(os.path.realpath(__file__))
+
+    @unittest.skipUnless(hasattr(signal, 'setitimer'), 'SIGALRM is not available')
+    def test_project_timer(self):
+        """Project Timer Interrupts Long Conversion"""
+
+        with self.assertRaises(ProjectTimeoutError):
+            with ProjectTimer(0.05):
+                time.sleep(2)
+        with ProjectTimer(0.1):
+            pass
+        time.sleep(0.2)     # timer must be disarmed after exit
+
+    @unittest.skipUnless(hasattr(signal, 'setitimer'), 'SIGALRM is not available')
+    def test_failed_projects_are_skipped(self):
+        """Failed And Hung Projects Are Skipped"""
+
+        original_convert_project = DataConverter.convert_project
+
+        def convert_project(converter, context, xml_project_path, cmake_lists_destination_path):
+            if 'zlib' in xml_project_path:
+                raise RuntimeError('broken project')
+            if 'g3log' in xml_project_path:
+                time.sleep(10)
+            return original_convert_project(
+                converter, context, xml_project_path, cmake_lists_destination_path
+            )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = os.path.join(temp_dir, 'datatest')
+            shutil.copytree(
+                os.path.join(self.cur_dir, 'datatest'),
+                data_dir,
+                ignore=shutil.ignore_patterns('CMakeLists.txt', 'CMake')
+            )
+            sln_path = os.path.join(data_dir, 'sln', 'cpp.sln')
+
+            with mock.patch.object(DataConverter, 'convert_project', convert_project):
+                under_test = convert(sln_path, {'project_timeout': 0.5})
+
+            self.assertEqual(
+                [('error', 'zlib.vcxproj'), ('timeout', 'g3log.vcxproj')],
+                sorted((f['reason'], os.path.basename(f['path'])) for f in under_test.failures)
+            )
+            self.assertEqual(1, under_test.stats['projects'])
+            self.assertEqual(2, under_test.stats['failed_projects'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from cmake_converter.fs_snapshot import FsSnapshot
+
+
+class TestFsSnapshot(unittest.TestCase):
+    """
+        This file test snapshot of directories of solution.
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        for directory in ('Src/Gen', '.git/objects', 'other'):
+            os.makedirs(os.path.join(self.root, directory))
+        for file_name in ('Src/Main.cpp', 'Src/Gen/a.cpp', '.git/HEAD', 'other/b.cpp'):
+            open(os.path.join(self.root, file_name), 'w').close()
+        self.under_test = FsSnapshot.build(
+            [os.path.join(self.root, 'Src'), self.root, os.path.join(self.root, 'Src', 'Gen')],
+            2
+        )
+
+    def path(self, relative_path):
+        """ Returns absolute path of given path of test tree """
+        return os.path.join(self.root, *relative_path.split('/'))
+
+    def test_lookup_ignores_case(self):
+        """Actual Paths Are Found Ignoring Case"""
+
+        self.assertEqual(4, len(self.under_test))
+        self.assertEqual(
+            (True, self.path('Src/Main.cpp')), self.under_test.lookup(self.path('src/MAIN.cpp'))
+        )
+        self.assertEqual((True, self.path('Src/Gen')), self.under_test.lookup(self.path('SRC/gen')))
+        self.assertEqual((True, None), self.under_test.lookup(self.path('src/absent.cpp')))
+        self.assertEqual((True, None), self.under_test.lookup(self.path('src/main.cpp/x')))
+        self.assertEqual((True, None), self.under_test.lookup(self.path('absent/x/y.cpp')))
+
+    def test_not_walked_paths_are_not_covered(self):
+        """Paths Outside Of Roots And Under Hidden Directories Are Not Covered"""
+
+        self.assertFalse(self.under_test.lookup(self.path('.git/HEAD'))[0])
+        self.assertFalse(self.under_test.lookup(os.path.dirname(self.root))[0])
+        self.assertFalse(self.under_test.lookup('relative/path.cpp')[0])
+
+    def test_exists_and_listdir_respect_case_of_filesystem(self):
+        """Existence And Listings Have The Same Case Sensitivity As Filesystem"""
+
+        for path in ('Src/Main.cpp', 'src/main.cpp', 'Src/Gen', 'Src/absent'):
+            self.assertEqual(
+                (True, os.path.exists(self.path(path))), self.under_test.exists(self.path(path))
+            )
+        self.assertEqual((True, ['Gen', 'Main.cpp']), self.under_test.listdir(self.path('Src')))
+        self.assertEqual((True, None), self.under_test.listdir(self.path('Src/Main.cpp')))
+        self.assertEqual((True, None), self.under_test.listdir(self.path('absent')))
+
+    def test_names_differ_only_by_case(self):
+        """Entries Which Names Differ Only By Case Are All Found"""
+
+        for directory in ('Src/Inc', 'Src/inc'):
+            os.makedirs(self.path(directory))
+        for file_name in ('Src/Foo.h', 'Src/foo.h', 'Src/inc/a.h'):
+            open(self.path(file_name), 'w').close()
+        if len(os.listdir(self.path('Src'))) != 6:
+            self.skipTest('filesystem is case-insensitive')
+        under_test = FsSnapshot.build([self.root], 2)
+
+        for file_name in ('Src/Foo.h', 'Src/foo.h', 'Src/Inc', 'Src/inc', 'Src/inc/a.h'):
+            self.assertEqual((True, self.path(file_name)), under_test.lookup(self.path(file_name)))
+            self.assertEqual((True, True), under_test.exists(self.path(file_name)))
+        self.assertEqual((True, self.path('Src/Foo.h')), under_test.lookup(self.path('src/FOO.h')))
+        self.assertEqual((True, False), under_test.exists(self.path('Src/FOO.h')))
+        self.assertEqual(
+            (True, self.path('Src/inc/a.h')), under_test.lookup(self.path('src/INC/a.h'))
+        )
+        self.assertEqual((True, []), under_test.listdir(self.path('Src/Inc')))
+        self.assertEqual((True, ['a.h']), under_test.listdir(self.path('Src/inc')))
+        self.assertEqual(
+            (True, ['Foo.h', 'Gen', 'Inc', 'Main.cpp', 'foo.h', 'inc']),
+            under_test.listdir(self.path('Src'))
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
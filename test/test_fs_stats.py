@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import unittest
+
+from cmake_converter import fs_stats
+
+
+class TestFsStats(unittest.TestCase):
+    """
+        This file test accounting of filesystem calls.
+    """
+
+    cur_dir = os.path.dirname(os.path.realpath(__file__))
+
+    def tearDown(self):
+        fs_stats.disable()
+        fs_stats.set_project('')
+        fs_stats.take_records()
+
+    def test_calls_are_counted_by_call_site_and_project(self):
+        """Filesystem Calls Are Counted By Call Site, Project And Path"""
+
+        original_exists = os.path.exists
+        fs_stats.take_records()
+        fs_stats.enable()
+        fs_stats.set_project('foo')
+        for _ in range(3):
+            os.path.exists(self.cur_dir)
+        fs_stats.set_project('')
+        os.listdir(self.cur_dir)
+        fs_stats.disable()
+        os.path.exists(self.cur_dir)
+
+        self.assertIs(original_exists, os.path.exists)
+        records = fs_stats.take_records()
+        calls = {(r[0], r[2]): r[3] for r in records['calls']}
+        self.assertEqual({('os.path.exists', 'foo'): 3, ('os.listdir', ''): 1}, calls)
+        self.assertTrue(all('test_fs_stats.py:' in r[1] for r in records['calls']))
+        self.assertEqual([[self.cur_dir, 4]], records['paths'])
+
+        fs_stats.add_records(records)
+        fs_stats.add_records(records)
+        lines = fs_stats.get_report_lines(fs_stats.take_records())
+        self.assertEqual('Filesystem calls: 8', lines[0].split(' in ')[0])
+        self.assertIn('    {:>7} x {}'.format(8, self.cur_dir), lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import subprocess
+import sys
+import unittest
+
+
+def get_import_times(statement):
+    """ Returns cumulative import time in microseconds of every module imported by statement """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line.split('|')
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+class TestImportTime(unittest.TestCase):
+    """
+        This file guards startup time of converter against heavy imports.
+    """
+
+    heavy_modules = ['lxml.etree', 'colorama', 'cmake_converter.writer']
+
+    def test_cli_does_not_import_converter_before_arguments_parsing(self):
+        """CLI Imports Converter After Parsing Of Arguments"""
+
+        import_times = get_import_times('import cmake_converter.main')
+
+        self.assertNotIn('cmake_converter.data_converter', import_times)
+        for module in self.heavy_modules:
+            self.assertNotIn(module, import_times)
+        # generous budget, the usual time is about 20 ms
+        self.assertLess(import_times['cmake_converter.main'], 500 * 1000)
+
+    def test_converter_imports_heavy_modules_lazily(self):
+        """Converter Imports Heavy Modules Lazily"""
+
+        import_times = get_import_times('import cmake_converter.visual_studio.solution')
+
+        for module in self.heavy_modules:
+            self.assertNotIn(module, import_times)
+
+
+if __name__ == '__main__':
+    unittest.main()
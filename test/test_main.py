@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import argparse
+import unittest
+
+from cmake_converter.main import positive_float, non_negative_int
+
+
+class TestMain(unittest.TestCase):
+    """
+        This file test checks of command line arguments.
+    """
+
+    def test_positive_float(self):
+        """Time Limit Must Be Positive Number"""
+
+        self.assertEqual(2.5, positive_float('2.5'))
+        for value in ('abc', '0', '-1', 'nan', 'inf'):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                positive_float(value)
+
+    def test_non_negative_int(self):
+        """Batch Size Of Unity Build Must Not Be Negative"""
+
+        self.assertEqual(0, non_negative_int('0'))
+        self.assertEqual(16, non_negative_int('16'))
+        for value in ('abc', '1.5', '-1'):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                non_negative_int(value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import unittest
+
+from cmake_converter.prefetcher import XmlPrefetcher
+
+
+class TestXmlPrefetcher(unittest.TestCase):
+    """
+        This file test methods of XmlPrefetcher class.
+    """
+
+    cur_dir = os.path.dirname(os.path.realpath(__file__))
+    zlib_project = '{}/datatest/external/zlib.vcxproj'.format(cur_dir)
+    g3log_project = '{}/datatest/external/g3log.vcxproj'.format(cur_dir)
+
+    def test_prefetched_tree_is_given_once(self):
+        """Prefetched Tree Is Given Once"""
+
+        under_test = XmlPrefetcher(1, 1024 * 1024)
+        under_test.schedule([self.zlib_project])
+
+        self.assertIsNotNone(under_test.take(self.zlib_project))
+        self.assertIsNone(under_test.take(self.zlib_project))
+        self.assertEqual(1, under_test.hits)
+        under_test.shutdown()
+
+    def test_memory_limit(self):
+        """Memory Limit Stops Prefetching"""
+
+        under_test = XmlPrefetcher(1, 1)
+        under_test.schedule([self.zlib_project])
+
+        self.assertIsNone(under_test.take(self.zlib_project))
+        under_test.shutdown()
+
+    def test_memory_limit_of_parsed_trees(self):
+        """Memory Limit Applies To Estimated Size Of Parsed Trees"""
+
+        under_test = XmlPrefetcher(1, os.path.getsize(self.zlib_project) * 2)
+        under_test.schedule([self.zlib_project])
+
+        self.assertIsNone(under_test.take(self.zlib_project))
+        under_test.shutdown()
+
+    def test_files_of_passed_projects_are_dropped(self):
+        """Files Of Passed Projects Are Dropped"""
+
+        under_test = XmlPrefetcher(1, 1024 * 1024)
+        under_test.schedule([self.zlib_project])
+        under_test.schedule([self.g3log_project])
+
+        self.assertIsNone(under_test.take(self.zlib_project))
+        self.assertIsNotNone(under_test.take(self.g3log_project))
+        under_test.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
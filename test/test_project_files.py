@@ -26,7 +26,6 @@ import unittest
 from cmake_converter.visual_studio.context import VSContext
 from cmake_converter.visual_studio.solution import VSSolutionConverter
 from cmake_converter.project_files import ProjectFiles
-from cmake_converter.data_files import get_cmake_lists
 
 
 class TestProjectFiles(unittest.TestCase):
@@ -62,7 +61,7 @@ class TestProjectFiles(unittest.TestCase):
         """Add Additional CMake Code"""
 
         # When file is empty, nothing is added
-        self.data_test['cmake'] = get_cmake_lists(context, self.cur_dir)
+        self.data_test['cmake'] = open(os.path.join(self.cur_dir, 'CMakeLists.txt'), 'w')
         under_test = ProjectFiles(self.data_test)
 
         under_test.add_additional_code(context, '')
@@ -76,7 +75,7 @@ class TestProjectFiles(unittest.TestCase):
         cmakelists_test.close()
 
         # When file exist, code is added
-        under_test.cmake = get_cmake_lists(context, self.cur_dir)
+        under_test.cmake = open(os.path.join(self.cur_dir, 'CMakeLists.txt'), 'w')
         under_test.add_additional_code(context, '%s/datatest/additional_code_test.cmake' % self.cur_dir)
 
         under_test.cmake.close()
@@ -89,7 +88,7 @@ class TestProjectFiles(unittest.TestCase):
         cmakelists_test.close()
 
         # When file does not exist, nothing is added
-        under_test.cmake = get_cmake_lists(context, self.cur_dir)
+        under_test.cmake = open(os.path.join(self.cur_dir, 'CMakeLists.txt'), 'w')
         under_test.add_additional_code(context, 'nofile/additional_code_test.cmake')
 
         under_test.cmake.close()
@@ -112,7 +111,7 @@ class TestProjectFiles(unittest.TestCase):
     def test_add_include_cmake(self):
         """Add Include CMake File"""
 
-        self.data_test['cmake'] = get_cmake_lists(context, self.cur_dir)
+        self.data_test['cmake'] = open(os.path.join(self.cur_dir, 'CMakeLists.txt'), 'w')
         under_test = ProjectFiles(self.data_test)
 
         under_test.add_include_cmake('path/to/file.cmake')
@@ -24,7 +24,7 @@ import os
 import unittest
 
 from cmake_converter.visual_studio.context import VSContext
-from cmake_converter.data_files import get_vcxproj_data, get_cmake_lists
+from cmake_converter.data_files import get_vcxproj_data
 
 
 @unittest.skip("TestProjectVariables tests skipping")
@@ -36,7 +36,7 @@ class TestProjectVariables(unittest.TestCase):
     cur_dir = os.path.dirname(os.path.realpath(__file__))
     context = VSContext()
     vcxproj_data_test = get_vcxproj_data(context, '%s/datatest/foo.vcxproj' % cur_dir)
-    cmake_lists_test = get_cmake_lists(context, cur_dir)
+    cmake_lists_test = None
 
     data_test = {
         'cmake': cmake_lists_test,
@@ -60,7 +60,7 @@ class TestProjectVariables(unittest.TestCase):
     def test_add_project_variables(self):
         """Add Project Variables"""
 
-        self.data_test['cmake'] = get_cmake_lists(context, self.cur_dir)
+        self.data_test['cmake'] = open(os.path.join(self.cur_dir, 'CMakeLists.txt'), 'w')
         under_test = VCXProjectVariables(self.data_test)
 
         under_test.add_project_variables()
@@ -96,7 +96,7 @@ class TestProjectVariables(unittest.TestCase):
 
         # If output is given
         under_test.output = '../output_binaries'
-        under_test.cmake = get_cmake_lists(context, self.cur_dir)
+        under_test.cmake = open(os.path.join(self.cur_dir, 'CMakeLists.txt'), 'w')
         under_test.add_outputs_variables()
 
         under_test.cmake.close()
@@ -112,7 +112,7 @@ class TestProjectVariables(unittest.TestCase):
     def test_add_cmake_project(self):
         """Add CMake Project"""
 
-        self.data_test['cmake'] = get_cmake_lists(context, self.cur_dir)
+        self.data_test['cmake'] = open(os.path.join(self.cur_dir, 'CMakeLists.txt'), 'w')
         under_test = VCXProjectVariables(self.data_test)
 
         # Case CXX languages
@@ -128,7 +128,7 @@ class TestProjectVariables(unittest.TestCase):
         cmakelists_test.close()
 
         # Case C languages
-        under_test.cmake = get_cmake_lists(context, self.cur_dir)
+        under_test.cmake = open(os.path.join(self.cur_dir, 'CMakeLists.txt'), 'w')
         under_test.add_cmake_project(['c'])
 
         under_test.cmake.close()
@@ -143,7 +143,7 @@ class TestProjectVariables(unittest.TestCase):
     def test_add_artefact_target_outputs(self):
         """Add Artefact Target Outputs"""
 
-        self.data_test['cmake'] = get_cmake_lists(context, self.cur_dir)
+        self.data_test['cmake'] = open(os.path.join(self.cur_dir, 'CMakeLists.txt'), 'w')
         under_test = VCXProjectVariables(self.data_test)
 
         under_test.add_cmake_output_directories()
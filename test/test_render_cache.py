@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+from collections import OrderedDict
+
+from cmake_converter.data_converter import DataConverter
+from cmake_converter.render_cache import RenderCache
+from cmake_converter.visual_studio.context import VSContext
+
+
+class TestRenderCache(unittest.TestCase):
+    """
+        This file test cache of rendered CMake code of targets.
+    """
+
+    cur_dir = os.path.dirname(os.path.realpath(__file__))
+    vs_project = os.path.join(cur_dir, 'datatest', 'foo.vcxproj')
+
+    def convert(self, render_cache, indent='    '):
+        """ Converts test project without writing of files """
+        context = VSContext()
+        context.in_memory = True
+        context.indent = indent
+        context.render_cache = render_cache
+        context.sln_configurations_map = OrderedDict([
+            ((None, None), (None, None)),
+            (('Debug', 'x64'), ('Debug', 'x64')),
+            (('Release', 'x64'), ('Release', 'x64')),
+        ])
+        self.assertTrue(DataConverter().convert_project(context, self.vs_project, self.cur_dir))
+        return context
+
+    def test_rendered_code_is_reused(self):
+        """Rendered Code Is Reused"""
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            render_cache = RenderCache(temp_dir)
+
+            first = self.convert(render_cache)
+            second = self.convert(render_cache)
+            self.assertFalse(first.render_cache_hit)
+            self.assertTrue(second.render_cache_hit)
+            self.assertEqual(first.cmake_lists_text, second.cmake_lists_text)
+            self.assertEqual(first.warnings_count, second.warnings_count)
+
+            other_indent = self.convert(render_cache, indent='  ')
+            self.assertFalse(other_indent.render_cache_hit)
+            self.assertNotEqual(first.cmake_lists_text, other_indent.cmake_lists_text)
+
+
+if __name__ == '__main__':
+    unittest.main()
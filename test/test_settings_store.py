@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import copy
+import pickle
+import unittest
+
+from cmake_converter.settings_store import SettingsStore
+
+
+class TestSettingsStore(unittest.TestCase):
+    """
+        This file test columnar store of settings.
+    """
+
+    def test_dict_interface(self):
+        """Settings Work Like Dict Of Dicts"""
+
+        under_test = SettingsStore()
+        under_test[('Debug', 'x64')] = {'defines': [], 'target_type': '', 'events': {}}
+        under_test[('Release', 'x64')] = {'defines': ['NDEBUG']}
+
+        self.assertEqual([('Debug', 'x64'), ('Release', 'x64')], list(under_test))
+        self.assertIn('defines', under_test[('Debug', 'x64')])
+        self.assertNotIn('target_type', under_test[('Release', 'x64')])
+
+        under_test[('Debug', 'x64')]['defines'].append('_DEBUG')
+        under_test[('Debug', 'x64')]['events']['x'] = 1
+        self.assertEqual(['_DEBUG'], under_test[('Debug', 'x64')]['defines'])
+        self.assertEqual({'x': 1}, under_test.get_value(('Debug', 'x64'), 'events'))
+        self.assertEqual(
+            {('Debug', 'x64'): ['_DEBUG'], ('Release', 'x64'): ['NDEBUG']},
+            under_test.get_column('defines')
+        )
+        with self.assertRaises(KeyError):
+            _ = under_test[('Release', 'x64')]['target_type']
+
+    def test_empty_values_are_shared(self):
+        """Empty Values Are Shared Until Changed"""
+
+        under_test = SettingsStore()
+        under_test[('Debug', 'x64')] = {'defines': [], 'inc_dirs': []}
+        under_test.copy_setting(('Debug', 'x64'), ('Release', 'x64'))
+        under_test[('Release', 'x64')]['defines'].append('NDEBUG')
+
+        self.assertIs(
+            under_test.get_value(('Debug', 'x64'), 'inc_dirs'),
+            under_test.get_value(('Release', 'x64'), 'inc_dirs')
+        )
+        self.assertEqual([], under_test[('Debug', 'x64')]['defines'])
+
+        for other in [copy.deepcopy(under_test), pickle.loads(pickle.dumps(under_test))]:
+            other[('Debug', 'x64')]['inc_dirs'].append('include')
+            self.assertEqual([], under_test[('Debug', 'x64')]['inc_dirs'])
+            self.assertEqual(['NDEBUG'], other[('Release', 'x64')]['defines'])
+
+    def test_rows_are_reused(self):
+        """Rows Of Replaced And Deleted Settings Are Reused"""
+
+        under_test = SettingsStore()
+        defines = ['A', 'B']
+        under_test[('Debug', 'x64')] = {'defines': defines, 'target_type': 'Application'}
+        under_test[('Release', 'x64')] = {'defines': ['NDEBUG']}
+        under_test.get_mutable_value(('Debug', 'x64'), 'defines').append('C')
+        self.assertEqual(['A', 'B'], defines)
+
+        for _ in range(10):
+            under_test[('Debug', 'x64')] = {'defines': ['D']}
+            del under_test[('Release', 'x64')]
+            under_test.copy_setting(('Debug', 'x64'), ('Release', 'x64'))
+
+        self.assertEqual([('Debug', 'x64'), ('Release', 'x64')], list(under_test))
+        self.assertEqual(
+            {('Debug', 'x64'): ['D'], ('Release', 'x64'): ['D']},
+            under_test.get_column('defines')
+        )
+        self.assertEqual({}, under_test.get_column('target_type'))
+        self.assertEqual(2, under_test._SettingsStore__rows_count)  # pylint: disable=no-member
+
+
+if __name__ == '__main__':
+    unittest.main()
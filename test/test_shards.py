@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+
+from cmake_converter.data_converter import TargetTask
+from cmake_converter.shards import parse_shard, select_shard
+from cmake_converter.shards import save_shard_results, load_shard_results
+
+
+class TestShards(unittest.TestCase):
+    """
+        This file test functions of sharded conversion.
+    """
+
+    solution_path = os.path.join(tempfile.gettempdir(), 'sln')
+
+    def __get_input_data(self):
+        input_data = {}
+        for number in range(20):
+            subdirectory = os.path.join(self.solution_path, 'project{}'.format(number))
+            input_data[subdirectory] = [
+                TargetTask(number, os.path.join(subdirectory, name), subdirectory, (), (), '')
+                for name in ['a.vcxproj', 'b.vcxproj']
+            ]
+        return input_data
+
+    def test_parse_shard(self):
+        """Parse Shard Option"""
+
+        self.assertEqual((2, 4), parse_shard('2/4'))
+        with self.assertRaises(ValueError):
+            parse_shard('0/4')
+        with self.assertRaises(ValueError):
+            parse_shard('5/4')
+        with self.assertRaises(ValueError):
+            parse_shard('two')
+
+    def test_shards_cover_all_directories_once(self):
+        """Shards Cover All Directories Once"""
+
+        input_data = self.__get_input_data()
+        selected_directories = []
+        for shard_index in range(1, 4):
+            shard_data = select_shard(self.solution_path, input_data, shard_index, 3)
+            for subdirectory, tasks in shard_data.items():
+                self.assertEqual(input_data[subdirectory], tasks)
+            selected_directories.extend(shard_data)
+
+        self.assertEqual(sorted(input_data), sorted(selected_directories))
+        self.assertEqual(
+            select_shard(self.solution_path, input_data, 2, 3),
+            select_shard(self.solution_path, input_data, 2, 3)
+        )
+
+    def test_save_and_load_results(self):
+        """Save And Load Results Of Shard"""
+
+        subdirectory = os.path.join(self.solution_path, 'project')
+        target_result = {
+            'cmake': subdirectory,
+            'cmake_lists': os.path.join(subdirectory, 'CMakeLists.txt'),
+            'cmake_lists_changed': True,
+            'cmake_lists_text': '',
+            'target_name': 'project',
+            'project_languages': {'CXX'},
+            'target_windows_ver': '',
+            'warnings_count': 1,
+            'input_files': [os.path.join(subdirectory, 'project.vcxproj')],
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            shard_results_path = os.path.join(temp_dir, 'shard.json')
+            save_shard_results(
+                shard_results_path, self.solution_path, 1, 2, [[target_result]]
+            )
+            under_test = load_shard_results(shard_results_path, self.solution_path)
+
+        self.assertEqual((1, 2, [target_result]), under_test)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import unittest
+
+from cmake_converter.context import Context
+from cmake_converter.shared_pch import share_precompiled_headers
+
+PCH_TEXT = 'target_precompile_headers(${PROJECT_NAME} PRIVATE\n    "stdafx.h"\n)\n\n'
+
+
+class TestSharedPch(unittest.TestCase):
+    """
+        This file test sharing of precompiled headers between targets.
+    """
+
+    @staticmethod
+    def make_result(name, signature):
+        """ Returns result of target conversion with PCH data """
+        return {
+            'target_name': name,
+            'cmake_lists_text': 'set(PROJECT_NAME {})\n{}'.format(name, PCH_TEXT),
+            'shared_pch': {
+                'signature': signature,
+                'text': PCH_TEXT,
+                'target': name,
+                'path': os.path.abspath(name + '.vcxproj'),
+            },
+        }
+
+    def test_pch_is_reused_from_leader(self):
+        """Targets With The Same PCH Reuse PCH Of Target Without Dependencies At Group"""
+
+        context = Context()
+        results = [
+            [self.make_result('app', 'same'), self.make_result('lib', 'same')],
+            [self.make_result('tool', 'same'), self.make_result('other', 'different')],
+        ]
+        dependencies = {
+            os.path.abspath('app.vcxproj'): {os.path.abspath('lib.vcxproj')},
+        }
+
+        self.assertEqual(2, share_precompiled_headers(context, results, dependencies))
+        self.assertEqual(
+            'set(PROJECT_NAME app)\ntarget_precompile_headers(${PROJECT_NAME} REUSE_FROM lib)\n\n',
+            results[0][0]['cmake_lists_text']
+        )
+        self.assertIn(PCH_TEXT, results[0][1]['cmake_lists_text'])
+        self.assertIn('REUSE_FROM lib', results[1][0]['cmake_lists_text'])
+        self.assertIn(PCH_TEXT, results[1][1]['cmake_lists_text'])
+
+    def test_pch_is_not_shared_at_cycle(self):
+        """PCH Is Not Shared By Targets That Depend On Each Other"""
+
+        context = Context()
+        results = [[self.make_result('a', 'same'), self.make_result('b', 'same')]]
+        dependencies = {
+            os.path.abspath('a.vcxproj'): {os.path.abspath('b.vcxproj')},
+            os.path.abspath('b.vcxproj'): {os.path.abspath('a.vcxproj')},
+        }
+
+        self.assertEqual(0, share_precompiled_headers(context, results, dependencies))
+        self.assertIn(PCH_TEXT, results[0][0]['cmake_lists_text'])
+        self.assertIn(PCH_TEXT, results[0][1]['cmake_lists_text'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from cmake_converter.system_resources import get_cgroup_cpu_limit, get_available_cpu_count, \
+    get_available_memory, estimate_worker_memory, get_auto_jobs_count, WORKER_BASE_MEMORY, \
+    PROJECT_MEMORY_FACTOR
+
+
+class TestSystemResources(unittest.TestCase):
+    """
+        This file test detection of CPUs and memory available for converter
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.cgroup_root = os.path.join(self.root, 'cgroup')
+        os.makedirs(self.cgroup_root)
+        self.proc_cgroup = os.path.join(self.root, 'proc_cgroup')
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def write_file(self, path, text):
+        """ Writes text into file relative to temporary directory """
+        path = os.path.join(self.root, path)
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+        with open(path, 'w') as text_file:
+            text_file.write(text)
+        return path
+
+    def test_cgroup_v2_limits(self):
+        """Limits Of Cgroup V2 And Its Ancestors Are Applied"""
+
+        self.write_file('proc_cgroup', '0::/ci/job\n')
+        self.write_file('cgroup/cpu.max', 'max 100000\n')
+        self.write_file('cgroup/ci/cpu.max', '800000 100000\n')
+        self.write_file('cgroup/ci/job/cpu.max', '250000 100000\n')
+        self.write_file('cgroup/ci/memory.max', str(1024 * 1024 * 1024))
+        self.write_file('cgroup/ci/memory.current', str(256 * 1024 * 1024))
+        meminfo = self.write_file('meminfo', 'MemTotal: 100 kB\nMemAvailable: 4194304 kB\n')
+
+        self.assertEqual(3, get_cgroup_cpu_limit(self.cgroup_root, self.proc_cgroup))
+        self.assertLessEqual(
+            get_available_cpu_count(self.cgroup_root, self.proc_cgroup), 3
+        )
+        self.assertEqual(
+            768 * 1024 * 1024,
+            get_available_memory(self.cgroup_root, self.proc_cgroup, meminfo)
+        )
+
+    def test_cgroup_v1_limits(self):
+        """Limits Of Cgroup V1 Controllers Are Applied"""
+
+        self.write_file('proc_cgroup', '4:memory:/docker/ci\n2:cpu,cpuacct:/docker/ci\n')
+        self.write_file('cgroup/cpu,cpuacct/docker/ci/cpu.cfs_quota_us', '400000\n')
+        self.write_file('cgroup/cpu,cpuacct/docker/ci/cpu.cfs_period_us', '100000\n')
+        self.write_file('cgroup/cpu,cpuacct/cpu.cfs_quota_us', '-1\n')
+        self.write_file('cgroup/cpu,cpuacct/cpu.cfs_period_us', '100000\n')
+        self.write_file('cgroup/memory/docker/ci/memory.limit_in_bytes', str(2 ** 63 - 4096))
+        self.write_file('cgroup/memory/docker/ci/memory.usage_in_bytes', '1024')
+        meminfo = self.write_file('meminfo', 'MemAvailable: 1024 kB\n')
+
+        self.assertEqual(4, get_cgroup_cpu_limit(self.cgroup_root, self.proc_cgroup))
+        self.assertEqual(
+            1024 * 1024, get_available_memory(self.cgroup_root, self.proc_cgroup, meminfo)
+        )
+
+    def test_no_limits(self):
+        """Absent Limits Are Not Applied"""
+
+        self.assertIsNone(get_cgroup_cpu_limit(self.cgroup_root, self.proc_cgroup))
+        self.assertIsNone(get_available_memory(
+            self.cgroup_root, self.proc_cgroup, os.path.join(self.root, 'meminfo')
+        ))
+        self.assertLessEqual(1, get_available_cpu_count(self.cgroup_root, self.proc_cgroup))
+
+    def test_auto_jobs_count(self):
+        """Count Of Workers Fits Into CPUs, Memory And Groups Of Projects"""
+
+        project = self.write_file('p.vcxproj', 'x' * 1000)
+        self.write_file('p.vcxproj.filters', 'x' * 24)
+        self.write_file('small.vcxproj', 'x' * 10)
+        worker_memory = estimate_worker_memory([project, os.path.join(self.root, 'small.vcxproj')])
+        self.assertEqual(WORKER_BASE_MEMORY + PROJECT_MEMORY_FACTOR * 1024, worker_memory)
+        self.assertLess(worker_memory, estimate_worker_memory([project], 2, 1024 * 1024))
+
+        self.assertEqual(8, get_auto_jobs_count(8, None, worker_memory, 100))
+        self.assertEqual(3, get_auto_jobs_count(8, None, worker_memory, 3))
+        self.assertEqual(2, get_auto_jobs_count(8, worker_memory * 2 + 1, worker_memory, 100))
+        self.assertEqual(1, get_auto_jobs_count(8, 0, worker_memory, 100))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import os
+import unittest
+
+from cmake_converter.api import convert
+from cmake_converter.context import Context
+from cmake_converter.flags import defines
+from cmake_converter.writer import CMakeWriter
+
+
+class TestUnityBuild(unittest.TestCase):
+    """
+        This file test unity build properties of generated CMake.
+    """
+
+    @staticmethod
+    def make_file_context(**settings):
+        """ Returns file context with given settings of Debug|x64 """
+        file_context = Context()
+        file_context.sln_configurations_map = {('Debug', 'x64'): ('Debug', 'x64')}
+        file_context.settings[('Debug', 'x64')] = settings
+        return file_context
+
+    def test_unity_build_is_optional(self):
+        """Unity Build Is Not Written By Default"""
+
+        cmake_file = io.StringIO()
+        CMakeWriter.write_unity_build(Context(), cmake_file)
+
+        self.assertEqual('', cmake_file.getvalue())
+
+    def test_files_not_for_unity_build(self):
+        """Files With Own Settings Are Skipped From Unity Build"""
+
+        context = Context()
+        context.unity_build_batch_size = 16
+        context.target_languages = ['CXX']
+        context.file_contexts['plain.cpp'] = self.make_file_context(PrecompiledHeader=['Use'])
+        context.file_contexts['pch.cpp'] = self.make_file_context(PrecompiledHeader=['Create'])
+        context.file_contexts['defines.cpp'] = self.make_file_context(**{defines: ['A']})
+        context.file_contexts['excluded.cpp'] = self.make_file_context()
+        context.file_contexts['excluded.cpp'].excluded_from_build = True
+        cmake_file = io.StringIO()
+        CMakeWriter.write_unity_build(context, cmake_file)
+
+        text = cmake_file.getvalue()
+        self.assertIn('    UNITY_BUILD ON\n    UNITY_BUILD_BATCH_SIZE 16\n', text)
+        self.assertIn(
+            'set_source_files_properties(\n'
+            '    pch.cpp\n    defines.cpp\n    excluded.cpp\n'
+            '    PROPERTIES\n    SKIP_UNITY_BUILD_INCLUSION ON\n)\n',
+            text
+        )
+
+    def test_no_unity_build_of_fortran(self):
+        """Fortran Targets Are Not Built As Unity"""
+
+        sln_dir = os.path.join(
+            os.path.dirname(os.path.realpath(__file__)), 'datatest', 'sln'
+        )
+        result = convert(
+            os.path.join(sln_dir, 'cpp_and_fortran.sln'), {'unity_build_batch_size': 8}
+        )
+
+        fortran_text = result.cmake_lists[os.path.join(sln_dir, 'CMakeLists.txt')]
+        self.assertIn('Fortran_MODULE_DIRECTORY', fortran_text)
+        self.assertNotIn('UNITY_BUILD', fortran_text)
+        cpp_text = result.cmake_lists[os.path.join(sln_dir, '..', 'CMakeLists.txt')]
+        self.assertIn('UNITY_BUILD_BATCH_SIZE 8', cpp_text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,8 +20,11 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
 
+import os
 import unittest
+from unittest import mock
 
+from cmake_converter import utils
 from cmake_converter.writer import CMakeWriter
 
 
@@ -42,6 +45,25 @@ class TestUtils(unittest.TestCase):
             under_test
         )
 
+    def test_init_worker_console(self):
+        """Worker Prints Colors Into Terminal Only, At Windows Through Colorama"""
+
+        self.addCleanup(utils._console.update, dict(utils._console))
+        environ = {key: value for key, value in os.environ.items() if key != 'PYCHARM_HOSTED'}
+        for os_name, is_terminal, colorama_used in [
+                ('nt', True, True),
+                ('nt', False, False),
+                ('posix', True, False),
+                ('posix', False, False),
+        ]:
+            with mock.patch.object(utils.os, 'name', os_name), \
+                    mock.patch.dict(utils.os.environ, environ, clear=True), \
+                    mock.patch.object(utils.sys.stdout, 'isatty', return_value=is_terminal), \
+                    mock.patch.object(utils, 'init_colorama') as init_colorama:
+                utils.init_worker_console()
+            self.assertEqual(is_terminal, utils._console['colors'])
+            self.assertEqual(colorama_used, init_colorama.called)
+
 
 if __name__ == '__main__':
     unittest.main()
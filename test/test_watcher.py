@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from cmake_converter.visual_studio.context import VSContext
+from cmake_converter.visual_studio.watcher import VSSolutionWatcher, get_file_key
+
+
+class TestVSSolutionWatcher(unittest.TestCase):
+    """
+        This file test watch mode of converter.
+    """
+
+    cur_dir = os.path.dirname(os.path.realpath(__file__))
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_dir = os.path.join(self.temp_dir, 'datatest')
+        shutil.copytree(
+            os.path.join(self.cur_dir, 'datatest'),
+            self.data_dir,
+            ignore=shutil.ignore_patterns('CMakeLists.txt', 'CMake')
+        )
+        self.sln_file_path = os.path.join(self.data_dir, 'sln', 'cpp.sln')
+        context = VSContext()
+        context.warn_level = 1
+        self.under_test = VSSolutionWatcher(interval=0.01, debounce=0.01)
+        self.under_test.start(context, self.sln_file_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def touch(self, *path):
+        """ Changes modification time of file of temporary copy of datatest """
+        path = os.path.join(self.data_dir, *path)
+        mtime_ns = os.stat(path).st_mtime_ns + 1000000000
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        return get_file_key(path)
+
+    def process_changes(self, changed_files):
+        """ Runs one cycle of reconversion and returns reconverted directories and messages """
+        with mock.patch.object(
+                self.under_test.converter,
+                'do_conversion',
+                autospec=True,
+                side_effect=self.under_test.converter.do_conversion
+        ) as do_conversion, \
+                mock.patch('cmake_converter.visual_studio.watcher.message') as message:
+            self.under_test.process_changes(changed_files)
+        directories = set()
+        for call in do_conversion.call_args_list:
+            directories.update(os.path.normpath(directory) for directory in call[0][1])
+        return directories, [call[0][1] for call in message.call_args_list]
+
+    def test_changed_files_are_detected(self):
+        """Changed Project And Filters Files Are Detected"""
+
+        self.assertEqual(set(), self.under_test.get_changed_files())
+        changed_files = {
+            self.touch('external', 'zlib.vcxproj'),
+            self.touch('external', 'zlib.vcxproj.filters'),
+        }
+        self.assertEqual(changed_files, self.under_test.get_changed_files())
+        self.assertEqual(set(), self.under_test.get_changed_files())
+
+    def test_burst_of_changes_is_debounced(self):
+        """Burst Of Changes Is Reported Once"""
+
+        changes = [
+            lambda: None,
+            lambda: self.touch('foo.vcxproj'),
+            lambda: self.touch('external', 'zlib.vcxproj'),
+            lambda: None,
+        ]
+        with mock.patch(
+                'cmake_converter.visual_studio.watcher.time.sleep',
+                side_effect=lambda seconds: changes.pop(0)()
+        ):
+            changed_files = self.under_test.wait_for_changes()
+
+        self.assertEqual([], changes)
+        self.assertEqual(
+            {
+                get_file_key(os.path.join(self.data_dir, 'foo.vcxproj')),
+                get_file_key(os.path.join(self.data_dir, 'external', 'zlib.vcxproj')),
+            },
+            changed_files
+        )
+
+    def test_changed_project_reconverts_its_directory(self):
+        """Changed Project Reconverts Only Its Directory"""
+
+        changed_files = {self.touch('external', 'g3log.vcxproj.filters')}
+        directories, messages = self.process_changes(changed_files)
+
+        self.assertEqual({os.path.join(self.data_dir, 'external')}, directories)
+        self.assertIn('Change of 1 file(s) is synced in', messages[-1])
+        self.assertIn('(projects reconverted: 2)', messages[-1])
+        self.assertTrue(os.path.exists(os.path.join(self.data_dir, 'external', 'CMakeLists.txt')))
+
+    def test_changed_solution_reconverts_everything(self):
+        """Changed Solution Reconverts Whole Solution"""
+
+        changed_files = {self.touch('sln', 'cpp.sln')}
+        directories, messages = self.process_changes(changed_files)
+
+        self.assertEqual(
+            {self.data_dir, os.path.join(self.data_dir, 'external')}, directories
+        )
+        self.assertIn('(projects reconverted: all)', messages[-1])
+
+    def test_change_during_conversion_is_not_lost(self):
+        """File Saved During Conversion Is Reconverted Next Time"""
+
+        do_conversion = self.under_test.converter.do_conversion
+
+        def save_during_conversion(*args):
+            self.touch('foo.vcxproj')
+            return do_conversion(*args)
+
+        self.touch('external', 'zlib.vcxproj')
+        changed_files = self.under_test.get_changed_files()
+        with mock.patch.object(
+                self.under_test.converter, 'do_conversion', side_effect=save_during_conversion
+        ), mock.patch('cmake_converter.visual_studio.watcher.message'):
+            self.under_test.process_changes(changed_files)
+
+        self.assertEqual(
+            {get_file_key(os.path.join(self.data_dir, 'foo.vcxproj'))},
+            self.under_test.get_changed_files()
+        )
+
+    def test_broken_solution_does_not_stop_watching(self):
+        """Broken Solution Is Reported And Fixed One Is Converted"""
+
+        with open(self.sln_file_path, encoding='utf-8') as sln_file:
+            sln_text = sln_file.read()
+        solution_data = self.under_test.solution_data
+
+        with open(self.sln_file_path, 'w', encoding='utf-8') as sln_file:
+            sln_file.write(sln_text[:40])
+        directories, messages = self.process_changes({self.touch('sln', 'cpp.sln')})
+
+        self.assertEqual(set(), directories)
+        self.assertIn('Changes are not synced', messages[-1])
+        self.assertIs(solution_data, self.under_test.solution_data)
+
+        with open(self.sln_file_path, 'w', encoding='utf-8') as sln_file:
+            sln_file.write(sln_text)
+        directories, messages = self.process_changes({self.touch('sln', 'cpp.sln')})
+
+        self.assertEqual(
+            {self.data_dir, os.path.join(self.data_dir, 'external')}, directories
+        )
+        self.assertIn('(projects reconverted: all)', messages[-1])
+
+
+if __name__ == '__main__':
+    unittest.main()
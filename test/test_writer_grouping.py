@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright (c) 2016-2020:
+#   Matthieu Estrada, ttamalfor@gmail.com
+#   Pavel Liavonau, liavonlida@gmail.com
+#
+# This file is part of (CMakeConverter).
+#
+# (CMakeConverter) is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# (CMakeConverter) is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with (CMakeConverter).  If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import unittest
+
+from cmake_converter.context import Context
+from cmake_converter.writer import CMakeWriter, FILES_TOKEN
+
+
+class TestWriterGrouping(unittest.TestCase):
+    """
+        This file test grouping of per-file properties in generated CMake.
+    """
+
+    @staticmethod
+    def write_grouped(file_blocks):
+        """ Writes given per-file blocks through grouping of writer """
+        context = Context()
+        context.file_contexts = dict(file_blocks)
+        cmake_file = io.StringIO()
+        CMakeWriter.write_grouped_by_files(
+            context,
+            cmake_file,
+            lambda file_context, block_file: block_file.write(file_context)
+        )
+        return cmake_file.getvalue()
+
+    def test_identical_blocks_are_grouped(self):
+        """Files With Identical Settings Share One Call"""
+
+        block = 'set_source_files_properties({} PROPERTIES\n    COMPILE_DEFINITIONS "A"\n)\n'\
+            .format(FILES_TOKEN)
+        text = self.write_grouped([
+            ('a.cpp', block),
+            ('b.cpp', block.replace('"A"', '"B"')),
+            ('c.cpp', block),
+            ('d.cpp', ''),
+        ])
+
+        self.assertEqual(
+            'set_source_files_properties(\n    a.cpp\n    c.cpp\n    PROPERTIES\n'
+            '    COMPILE_DEFINITIONS "A"\n)\n'
+            'set_source_files_properties(b.cpp PROPERTIES\n    COMPILE_DEFINITIONS "B"\n)\n',
+            text
+        )
+
+    def test_compile_options_of_group(self):
+        """Group Of Files Appends Compile Options To All Of Them"""
+
+        block = '    source_file_compile_options({} ${{FILE_CL_OPTIONS}})\n'.format(FILES_TOKEN)
+
+        self.assertEqual(
+            '    source_file_compile_options(a.cpp ${FILE_CL_OPTIONS})\n',
+            self.write_grouped([('a.cpp', block)])
+        )
+        self.assertEqual(
+            '    set_property(SOURCE\n        a.cpp\n        b.cpp\n'
+            '        APPEND PROPERTY COMPILE_OPTIONS ${FILE_CL_OPTIONS})\n',
+            self.write_grouped([('a.cpp', block), ('b.cpp', block)])
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()